@@ -0,0 +1,81 @@
+"""Benchmark: heaviest scene's draw cost with and without display-format images.
+
+Fills the space shooter (level 10, hard) with a full wave, the boss and a
+spread of power-ups, then times SpaceShooterScene.draw onto the virtual
+surface. Three launches, each a fresh process in one scratch directory:
+a cold asset cache (images freshly generated), a warm cache with the
+finalize stage disabled (the cached buffers blitted as-is; before the
+atlas cache stored BGRA pages these were RGBA and every launch after the
+first paid the cross-format blit), and a warm cache with finalize.
+Reports the median frame and the per-pixel-format blit cost of one image.
+Run from the repository root:
+    python -m benchmarks.asset_format
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+FRAMES = 200
+RUNS = [("cold cache", "1"), ("warm cache, no finalize", "0"), ("warm cache, finalized", "1")]
+
+
+def child(root, finalize):
+    sys.path.insert(0, root)
+    from src.core.engine import Engine
+    from src.core.rng import RNG
+    from src.entities.enemy import Enemy
+    from src.entities.powerup import PowerUp
+    from src.utils.assets import AssetManager
+
+    if not finalize:
+        AssetManager.finalize = lambda self, surface: surface
+    engine = Engine(headless=True)
+    RNG().seed(2)
+    manager = engine.scene_manager
+    manager.change_scene("game", level=10, difficulty="hard")
+    scene = manager.current_scene
+    scene.spawn_boss()
+    for _ in range(120):
+        Enemy.spawn([scene.all_sprites, scene.enemies], RNG().choice(['basic', 'fast']),
+                    (RNG().randint(40, 1880), RNG().randint(60, 900)), (0, 0))
+    for power_type in ['health', 'cola_burst', 'spread_shot', 'rapid_fire', 'shield'] * 6:
+        PowerUp.spawn([scene.all_sprites, scene.powerups], RNG().randint(40, 1880), RNG().randint(60, 900), power_type)
+    surface = engine.resolution_manager.get_virtual_surface()
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        scene.draw(surface)
+        times.append(time.perf_counter() - start)
+    image = AssetManager().images['enemy_basic']
+    start = time.perf_counter()
+    for i in range(5000):
+        surface.blit(image, (i % 1800, i % 1000))
+    blit_us = (time.perf_counter() - start) / 5000 * 1e6
+    print(len(scene.all_sprites), statistics.median(times) * 1000, blit_us)
+
+
+def main():
+    root = os.getcwd()
+    workdir = tempfile.mkdtemp()
+    results = []
+    for label, finalize in RUNS:
+        out = subprocess.run([sys.executable, "-m", "benchmarks.asset_format", root, finalize],
+                             cwd=workdir, capture_output=True, text=True, check=True,
+                             env={**os.environ, "PYTHONPATH": root})
+        sprites, frame_ms, blit_us = out.stdout.split()[-3:]
+        results.append((label, int(sprites), float(frame_ms), float(blit_us)))
+    print(f"SpaceShooterScene.draw, {results[0][1]} sprites + boss, median of {FRAMES} frames")
+    print(f"{'':<24}{'ms/frame':>10}{'us/blit (64x64)':>17}")
+    baseline = results[1][2]
+    for label, _, frame_ms, blit_us in results:
+        print(f"{label:<24}{frame_ms:>10.2f}{blit_us:>17.1f}{baseline / frame_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        child(sys.argv[1], sys.argv[2] == "1")
+    else:
+        main()
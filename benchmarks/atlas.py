@@ -0,0 +1,106 @@
+"""Benchmark: separate image surfaces vs texture atlas pages.
+
+Draws 5,000 sprites cycling through every asset image onto a 1920x1080
+display-format surface with one Surface.blits per frame, three ways: from
+separate per-image surfaces (the pre-atlas layout), from the atlas
+subsurfaces AssetManager.images now hands out, and as explicit
+(page, position, area) blits. Then times reading the warm asset cache:
+the old per-image buffer read into memory in full versus mapping the atlas
+file (both with the manifest parse, neither with the cache key hash).
+Reports the best of several runs. Headless, scratch directory.
+Run from the repository root:
+    python -m benchmarks.atlas
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+SPRITES = 5000
+FRAMES = 30
+REPEATS = 5
+LOADS = 200
+
+
+def best_ms(func, count):
+    func()
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1000
+
+
+def legacy_load(pygame, path, manifest_path):
+    """The version 1 cache read: whole file into a bytearray, one RGBA surface per image"""
+    with open(manifest_path) as f:
+        layout = json.load(f)
+    data = bytearray(os.path.getsize(path))
+    with open(path, 'rb') as f:
+        f.readinto(data)
+    view = memoryview(data)
+    return {name: pygame.image.frombuffer(view[offset:offset + w * h * 4], (w, h), 'RGBA')
+            for name, (w, h, offset) in layout.items()}
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    import pygame
+    from src.core.engine import Engine
+    from src.utils.assets import AssetManager
+    from src.utils.constants import VIRTUAL_WIDTH, VIRTUAL_HEIGHT
+
+    Engine(headless=True)
+    assets = AssetManager()
+    names = sorted(assets.images)
+    surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT)).convert()
+    rng = random.Random(3)
+    picks = [names[i % len(names)] for i in range(SPRITES)]
+    positions = [(rng.randint(-40, VIRTUAL_WIDTH), rng.randint(-40, VIRTUAL_HEIGHT)) for _ in picks]
+
+    separate = {name: image.copy() for name, image in assets.images.items()}
+    regions = {name: assets.atlas_region(name) for name in names}
+    layouts = [
+        ("separate surfaces", lambda: surface.blits(zip([separate[n] for n in picks], positions), doreturn=False)),
+        ("atlas subsurfaces", lambda: surface.blits(zip([assets.images[n] for n in picks], positions), doreturn=False)),
+        ("page + area", lambda: surface.blits([(regions[n][0], p, regions[n][1]) for n, p in zip(picks, positions)],
+                                              doreturn=False)),
+    ]
+    pages = ", ".join(f"{w}x{h}" for w, h in (page.get_size() for page in assets.atlas_pages))
+    print(f"{SPRITES} sprites over {len(names)} images, atlas pages: {pages}")
+    baseline = None
+    for label, draw in layouts:
+        ms = best_ms(draw, FRAMES)
+        baseline = baseline or ms
+        print(f"{label:<20}{ms:>8.3f} ms/frame{baseline / ms:>7.2f}x")
+
+    # The same pixels in the old one-buffer-per-image cache file
+    assets.cache_key = lambda key=assets.cache_key(): key
+    layout = {}
+    offset = 0
+    with open('images.bin', 'wb') as f:
+        for name in names:
+            raw = pygame.image.tobytes(assets.images[name], 'RGBA')
+            w, h = assets.images[name].get_size()
+            layout[name] = (w, h, offset)
+            f.write(raw)
+            offset += len(raw)
+    with open('images.json', 'w') as f:
+        json.dump(layout, f)
+    old = best_ms(lambda: legacy_load(pygame, 'images.bin', 'images.json'), LOADS)
+    new = best_ms(assets.load_cached_atlas, LOADS)
+    print(f"\nwarm cache read ({offset // 1024} KiB of images, "
+          f"{os.path.getsize(os.path.join('cache', 'assets', 'atlas.bin')) // 1024} KiB atlas)")
+    print(f"{'read into bytearray':<20}{old:>8.3f} ms")
+    print(f"{'mmap atlas':<20}{new:>8.3f} ms{old / new:>7.2f}x")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
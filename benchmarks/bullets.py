@@ -0,0 +1,111 @@
+"""Benchmark: per-sprite Projectile objects vs the vectorized BulletSystem.
+
+Each frame updates every bullet (10% homing on an enemy), collides them with
+50 enemies and draws them to a virtual-resolution surface, the work
+SpaceShooterScene does per frame. Checks both report the same hits and
+compares simulation (update + collide) and draw cost per frame against the
+144 FPS budget; drawing thousands of alpha sprites is fill-rate bound either way.
+Run from the repository root:
+    python -m benchmarks.bullets
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.core.bullet_system import BulletSystem
+from src.core.spatial_hash import SpatialHash
+from src.entities.projectile import Projectile
+from src.utils.constants import *
+
+BULLET_COUNTS = [500, 2_000, 5_000]
+ENEMIES = 50
+FRAMES = 60
+BUDGET_MS = 1000 / 144
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, group):
+        super().__init__(group)
+        self.rect = pygame.Rect(random.randint(0, VIRTUAL_WIDTH - 64), random.randint(0, VIRTUAL_HEIGHT // 2), 64, 64)
+
+
+def shots(n, enemies):
+    random.seed(n)
+    targets = enemies.sprites()
+    for _ in range(n):
+        target = random.choice(targets) if random.random() < 0.1 else None
+        yield (random.uniform(0, VIRTUAL_WIDTH), random.uniform(VIRTUAL_HEIGHT // 2, VIRTUAL_HEIGHT),
+               random.uniform(-20, 20), random.uniform(-20, -5), target)
+
+
+def pairs(result):
+    return sorted((id(enemy), len(hits)) for enemy, hits in result.items())
+
+
+def bench_sprites(n, enemies, surface):
+    group = pygame.sprite.Group()
+    for x, y, vx, vy, target in shots(n, enemies):
+        Projectile.spawn(group, x, y, vy, speed_x=vx, target=target)
+    grid = SpatialHash()
+    grid.register("enemies", enemies)
+    grid.register("projectiles", group)
+    sim = draw = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        group.update(1 / FPS)
+        grid.rebuild()
+        hits = grid.groupcollide("enemies", "projectiles", False, False)
+        mid = time.perf_counter()
+        for sprite in group:
+            surface.blit(sprite.image, sprite.rect)
+        sim += mid - start
+        draw += time.perf_counter() - mid
+    for sprite in group.sprites():
+        sprite.kill()
+    return sim / FRAMES * 1000, draw / FRAMES * 1000, hits
+
+
+def bench_system(n, enemies, surface):
+    bullets = BulletSystem()
+    for x, y, vx, vy, target in shots(n, enemies):
+        bullets.spawn(x, y, vx, vy, target=target)
+    sim = draw = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        bullets.update(1 / FPS)
+        hits = bullets.groupcollide(enemies, False, False)
+        mid = time.perf_counter()
+        bullets.draw(surface)
+        sim += mid - start
+        draw += time.perf_counter() - mid
+    return sim / FRAMES * 1000, draw / FRAMES * 1000, hits
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from src.utils.assets import AssetManager
+    AssetManager().load_assets()
+    surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+    random.seed(0)
+    enemies = pygame.sprite.Group()
+    for _ in range(ENEMIES):
+        Box(enemies)
+
+    print(f"{ENEMIES} enemies, {FRAMES} frames, budget {BUDGET_MS:.2f} ms/frame at 144 FPS")
+    print(f"{'bullets':>8}{'sprite sim':>12}{'system sim':>12}{'speedup':>9}"
+          f"{'sprite draw':>13}{'system draw':>13}{'same hits':>11}{'sim in budget':>15}")
+    for n in BULLET_COUNTS:
+        sprite_sim, sprite_draw, sprite_hits = bench_sprites(n, enemies, surface)
+        system_sim, system_draw, system_hits = bench_system(n, enemies, surface)
+        same = pairs(sprite_hits) == pairs(system_hits)
+        print(f"{n:>8}{sprite_sim:>12.2f}{system_sim:>12.2f}{sprite_sim / system_sim:>8.1f}x"
+              f"{sprite_draw:>13.2f}{system_draw:>13.2f}{str(same):>11}{str(system_sim < BUDGET_MS):>15}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
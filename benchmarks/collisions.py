@@ -0,0 +1,65 @@
+"""Benchmark: SpatialHash broadphase vs pygame brute-force groupcollide.
+
+Checks that both report identical hit pairs and compares rect tests/time.
+Run from the repository root:
+    python -m benchmarks.collisions
+"""
+import random
+import time
+
+import pygame
+from src.core.spatial_hash import SpatialHash
+from src.utils.constants import *
+
+ENEMY_COUNTS = [50, 200]
+PROJECTILE_COUNTS = [100, 500, 2_000]
+FRAMES = 30
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, group, w, h):
+        super().__init__(group)
+        self.rect = pygame.Rect(random.randint(0, VIRTUAL_WIDTH), random.randint(0, VIRTUAL_HEIGHT), w, h)
+
+
+def populate(n_enemies, n_projectiles, seed):
+    random.seed(seed)
+    enemies = pygame.sprite.Group()
+    projectiles = pygame.sprite.Group()
+    for _ in range(n_enemies):
+        Box(enemies, 64, 64)
+    for _ in range(n_projectiles):
+        Box(projectiles, 20, 48)
+    return enemies, projectiles
+
+
+def pairs(result):
+    return {(id(a), id(b)) for a, hits in result.items() for b in hits}
+
+
+def main():
+    print(f"{'enemies':>8}{'bullets':>9}{'naive tests':>13}{'grid tests':>12}{'pygame ms':>11}{'grid ms':>9}  match")
+    for n_enemies in ENEMY_COUNTS:
+        for n_projectiles in PROJECTILE_COUNTS:
+            enemies, projectiles = populate(n_enemies, n_projectiles, seed=n_projectiles)
+            start = time.perf_counter()
+            for _ in range(FRAMES):
+                expected = pygame.sprite.groupcollide(enemies, projectiles, False, False)
+            pygame_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+            grid = SpatialHash()
+            grid.register("enemies", enemies)
+            grid.register("projectiles", projectiles)
+            start = time.perf_counter()
+            for _ in range(FRAMES):
+                grid.rebuild()
+                actual = grid.groupcollide("enemies", "projectiles", False, False)
+            grid_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+            match = pairs(expected) == pairs(actual)
+            print(f"{n_enemies:>8}{n_projectiles:>9}{grid.naive_tests:>13}{grid.rect_tests:>12}"
+                  f"{pygame_ms:>11.3f}{grid_ms:>9.3f}  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark: per-entity memory and spawn rate, old Entity vs lazy-image base and pools.
+
+Builds 10,000 enemies with the old Entity/Enemy constructors (copied below:
+a throwaway 32x32 placeholder Surface, Sprite's group set, fresh Vector2s)
+and with the current lazy-image ones, and reports the Python heap bytes each
+enemy keeps alive (tracemalloc; SDL pixel buffers are not included) plus
+the placeholder surfaces allocated. Then times spawn/kill cycles into a
+real sprite group: old constructor, new constructor, and Enemy.spawn out
+of the pool. Headless, scratch directory.
+Run from the repository root:
+    python -m benchmarks.entities
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+COUNT = 10000
+CYCLES = 50000
+
+
+def legacy_types(pygame, constants, assets, rng):
+    surfaces = [0]
+
+    class LegacyEntity(pygame.sprite.Sprite):
+        def __init__(self, groups=None, layer=constants.LAYER_BACKGROUND, image=None):
+            super().__init__()
+            self.render_layer = layer
+            if image is None:
+                image = pygame.Surface((32, 32))
+                image.fill(constants.WHITE)
+                surfaces[0] += 1
+            self.image = image
+            self.rect = self.image.get_rect()
+            self.position = pygame.math.Vector2(0, 0)
+            self.velocity = pygame.math.Vector2(0, 0)
+            self.active = True
+            if groups:
+                for group in groups:
+                    group.add(self, layer=self.render_layer)
+
+    class LegacyEnemy(LegacyEntity):
+        def __init__(self, groups, enemy_type='basic'):
+            super().__init__(groups, constants.LAYER_ENEMIES)
+            self.enemy_type = enemy_type
+            self.image = assets.images['enemy_basic']
+            self.speed = rng.uniform(120, 250)
+            self.health = 1
+            self.score_value = 100
+            self.rect = self.image.get_rect()
+            self.position = pygame.math.Vector2(rng.randint(40, constants.VIRTUAL_WIDTH - 40),
+                                                rng.randint(-200, -80))
+            self.velocity = pygame.math.Vector2(rng.uniform(-60, 60), self.speed)
+            self.rect.center = self.position
+
+    return LegacyEnemy, surfaces
+
+
+def retained_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    kept = [build() for _ in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / COUNT
+
+
+def spawns_per_second(pygame, spawn):
+    group = pygame.sprite.LayeredUpdates()
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        spawn([group]).kill()
+    return CYCLES / (time.perf_counter() - start)
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    import pygame
+    from src.core.engine import Engine
+    from src.core.rng import RNG
+    from src.entities.enemy import Enemy
+    from src.utils import constants
+    from src.utils.assets import AssetManager
+
+    Engine(headless=True)
+    LegacyEnemy, surfaces = legacy_types(pygame, constants, AssetManager(), RNG())
+
+    old_bytes = retained_bytes(lambda: LegacyEnemy(None))
+    old_surfaces, surfaces[0] = surfaces[0], 0
+    new_bytes = retained_bytes(lambda: Enemy(None))
+    print(f"{COUNT} enemies kept alive")
+    print(f"{'':<14}{'bytes/enemy':>12}{'placeholder surfaces':>22}")
+    print(f"{'old Entity':<14}{old_bytes:>12.0f}{old_surfaces:>22}")
+    print(f"{'lazy image':<14}{new_bytes:>12.0f}{0:>22}")
+
+    old_rate = spawns_per_second(pygame, LegacyEnemy)
+    new_rate = spawns_per_second(pygame, Enemy)
+    pooled_rate = spawns_per_second(pygame, Enemy.spawn)
+    print(f"\n{CYCLES} spawn + kill cycles into a LayeredUpdates group")
+    print(f"{'old constructor':<22}{old_rate:>10.0f} spawns/s")
+    print(f"{'lazy-image ctor':<22}{new_rate:>10.0f} spawns/s{new_rate / old_rate:>7.1f}x")
+    print(f"{'Enemy.spawn (pooled)':<22}{pooled_rate:>10.0f} spawns/s{pooled_rate / old_rate:>7.1f}x")
+    print(f"pool: {Enemy.pool.stats()}")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: CPU cost of sitting on a menu, immediate vs retained redraw.
+
+Runs the real Engine.run loop (dummy video driver) on each static UI scene
+for a few seconds with no input, once with the scene forced back to
+full-frame redraws at the FPS cap and once in its retained mode (dirty rects
+only, idle frame cap after IDLE_DELAY_MS). Each run is a fresh process in a
+scratch directory; reports frames and CPU time per wall-clock second.
+Run from the repository root:
+    python -m benchmarks.menu_idle
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCENES = ["shop", "settings", "mode_select", "game_over", "map"]
+SECONDS = 3
+
+
+def child(root, scene_name, retained):
+    sys.path.insert(0, root)
+    import pygame
+    from src.core.engine import Engine
+
+    engine = Engine(headless=True)
+    if scene_name == "game_over":
+        engine.scene_manager.change_scene(scene_name, result="defeat", score=1200, coins=40)
+    else:
+        engine.scene_manager.change_scene(scene_name)
+    type(engine.scene_manager.current_scene).retained = retained
+    frames = 0
+    step = engine.step
+
+    def counted_step(dt, events):
+        nonlocal frames
+        frames += 1
+        return step(dt, events)
+
+    engine.step = counted_step
+    pygame.time.set_timer(pygame.QUIT, SECONDS * 1000, loops=1)
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    try:
+        engine.run()
+    except SystemExit:
+        pass
+    wall = time.perf_counter() - wall
+    print(frames, (time.process_time() - cpu) / wall)
+
+
+def main():
+    root = os.getcwd()
+    workdir = tempfile.mkdtemp()
+    print(f"{SECONDS}s per run, no input")
+    print(f"{'scene':<13}{'full fps':>10}{'full cpu':>10}{'dirty fps':>11}{'dirty cpu':>11}{'cpu saved':>11}")
+    for scene in SCENES:
+        results = []
+        for retained in (False, True):
+            out = subprocess.run([sys.executable, "-m", "benchmarks.menu_idle", root, scene, str(int(retained))],
+                                 cwd=workdir, capture_output=True, text=True, check=True,
+                                 env={**os.environ, "PYTHONPATH": root})
+            frames, cpu = out.stdout.split()[-2:]
+            results.append((int(frames) / SECONDS, float(cpu)))
+        (full_fps, full_cpu), (dirty_fps, dirty_cpu) = results
+        print(f"{scene:<13}{full_fps:>10.0f}{full_cpu:>9.0%}{dirty_fps:>11.0f}{dirty_cpu:>10.1%}"
+              f"{full_cpu / max(dirty_cpu, 1e-6):>10.0f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        child(sys.argv[1], sys.argv[2], sys.argv[3] == "1")
+    else:
+        main()
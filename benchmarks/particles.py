@@ -0,0 +1,57 @@
+"""Microbenchmark: ListParticlePool vs NumPy ParticlePool.
+
+Run from the repository root:
+    python -m benchmarks.particles
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.core.vfx_manager import ListParticlePool, ParticlePool
+from src.utils.constants import *
+
+SIZES = [500, 5_000, 50_000]
+FRAMES = 60
+
+
+def fill(pool, n):
+    """Emit n particles in bursts, the way a boss explosion does"""
+    for _ in range(n // 50):
+        pool.emit(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2, GOLD, 50,
+                  velocity_range=(-15, 15), life_range=(40, 80))
+
+
+def run_frames(pool, surface, draw):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        pool.update(1 / FPS)
+        if draw:
+            pool.draw(surface)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def bench(pool_cls, n, surface, draw):
+    pool = pool_cls(max_particles=n)
+    start = time.perf_counter()
+    fill(pool, n)
+    emit_ms = (time.perf_counter() - start) * 1000
+    frame_ms = run_frames(pool, surface, draw)
+    return emit_ms, frame_ms
+
+
+def main():
+    pygame.init()
+    surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+    print(f"{'pool':<18}{'particles':>10}{'emit ms':>10}{'update ms':>12}{'upd+draw ms':>13}")
+    for n in SIZES:
+        for pool_cls in (ListParticlePool, ParticlePool):
+            emit_ms, update_ms = bench(pool_cls, n, surface, draw=False)
+            _, frame_ms = bench(pool_cls, n, surface, draw=True)
+            print(f"{pool_cls.__name__:<18}{n:>10}{emit_ms:>10.2f}{update_ms:>12.3f}{frame_ms:>13.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
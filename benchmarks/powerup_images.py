@@ -0,0 +1,115 @@
+"""Benchmark: power-up spawns with per-spawn icon surfaces vs the shared image registry.
+
+Spawns 10,000 power-ups cycling through every type, first with the old
+PowerUp.reset (copied below: spread_shot, rapid_fire and shield icons
+redrawn with pygame.draw on a new surface each time) and then with the
+current one, which takes AssetManager.image_for's shared images. Counts
+pygame.Surface constructions during each run and fails unless the current
+PowerUp.spawn makes none and hands out one image per type. Also reports
+spawns per second. Headless, scratch directory.
+Run from the repository root:
+    python -m benchmarks.powerup_images
+"""
+import os
+import sys
+import tempfile
+import time
+
+COUNT = 10000
+TYPES = ['health', 'cola_burst', 'spread_shot', 'rapid_fire', 'shield']
+
+
+def legacy_type(pygame, constants, assets, PowerUp):
+    C = constants
+
+    class LegacyPowerUp(PowerUp):
+        pool = None
+
+        def reset(self, x, y, power_type='health'):
+            self.power_type = power_type
+            if power_type == 'health':
+                self.image = assets.images.get('powerup_health', pygame.Surface((20, 20)))
+            elif power_type == 'cola_burst':
+                self.image = assets.images.get('powerup_cola', pygame.Surface((20, 20)))
+            elif power_type == 'spread_shot':
+                self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
+                pygame.draw.circle(self.image, C.NEON_PURPLE, (12, 12), 12)
+                pygame.draw.circle(self.image, C.WHITE, (12, 12), 8, 2)
+                pygame.draw.circle(self.image, C.WHITE, (12, 6), 2)
+                pygame.draw.circle(self.image, C.WHITE, (6, 16), 2)
+                pygame.draw.circle(self.image, C.WHITE, (18, 16), 2)
+            elif power_type == 'rapid_fire':
+                self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
+                pygame.draw.rect(self.image, C.GOLD, (4, 4, 16, 16), border_radius=4)
+                pygame.draw.polygon(self.image, C.WHITE, [(8, 8), (16, 12), (8, 16)])
+            elif power_type == 'shield':
+                self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
+                pygame.draw.circle(self.image, C.NEON_BLUE, (12, 12), 12)
+                pygame.draw.circle(self.image, C.WHITE, (12, 12), 10, 2)
+                pygame.draw.line(self.image, C.WHITE, (6, 12), (18, 12), 2)
+                pygame.draw.line(self.image, C.WHITE, (12, 6), (12, 18), 2)
+            self.image = assets.finalize(self.image)
+            self.rect = self.image.get_rect(center=(x, y))
+            self.position.update(x, y)
+            self.velocity.update(0, 120)
+            self.pooled = False
+
+    return LegacyPowerUp
+
+
+def spawn_all(pygame, spawn):
+    """Spawn COUNT power-ups (killing each, as pickups do); returns (seconds, surfaces made, distinct images)"""
+    made = [0]
+    surface_type = pygame.Surface
+
+    def counting_surface(*args, **kwargs):
+        made[0] += 1
+        return surface_type(*args, **kwargs)
+
+    group = pygame.sprite.LayeredUpdates()
+    images = set()
+    pygame.Surface = counting_surface
+    try:
+        start = time.perf_counter()
+        for i in range(COUNT):
+            powerup = spawn([group], 100, 100, TYPES[i % len(TYPES)])
+            images.add(powerup.image)
+            powerup.kill()
+        elapsed = time.perf_counter() - start
+    finally:
+        pygame.Surface = surface_type
+    return elapsed, made[0], len(images)
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    import pygame
+    from src.core.engine import Engine
+    from src.entities.powerup import PowerUp
+    from src.utils import constants
+    from src.utils.assets import AssetManager
+
+    Engine(headless=True)
+    LegacyPowerUp = legacy_type(pygame, constants, AssetManager(), PowerUp)
+    # Warm up the registry's fallbacks and the pool outside the counted runs
+    for power_type in TYPES:
+        PowerUp.spawn([], 0, 0, power_type).kill()
+
+    print(f"{COUNT} power-up spawns over {len(TYPES)} types")
+    print(f"{'':<22}{'spawns/s':>10}{'new surfaces':>14}{'distinct images':>17}")
+    results = []
+    for label, spawn in (("per-spawn icons", LegacyPowerUp), ("shared registry", PowerUp.spawn)):
+        elapsed, made, distinct = spawn_all(pygame, spawn)
+        results.append((made, distinct))
+        print(f"{label:<22}{COUNT / elapsed:>10.0f}{made:>14}{distinct:>17}")
+    made, distinct = results[-1]
+    assert made == 0, f"PowerUp.spawn created {made} surfaces"
+    assert distinct == len(TYPES), f"{distinct} distinct images for {len(TYPES)} types"
+    print("ok: no surfaces created, one shared image per type")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark: rect-only vs two-phase pixel-exact collisions.
+
+Replays SpaceShooterScene's per-frame collision checks (bullets vs enemies,
+bullets vs the boss truck, enemies vs the player) with the real sprite
+images, rect-only and with the overlap-table narrow phase alternating (best
+of REPEATS each), then with pygame.sprite.collide_mask building masks on
+every test for reference. The static layout keeps dozens to hundreds of
+overlapping pairs alive every frame, a worst case; the second table plays the real scene headless (auto-fire with
+spread_shot + rapid_fire, seeded) and compares its collision phase and
+whole frame with precise_collisions off and on.
+Run from the repository root:
+    python -m benchmarks.precise_collisions
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.core.bullet_system import BulletSystem
+from src.core.spatial_hash import SpatialHash
+from src.entities.entity import Entity
+from src.utils.assets import AssetManager
+from src.utils.constants import *
+
+BULLET_COUNTS = [100, 500, 2_000]
+ENEMIES = 50
+FRAMES = 50
+REPEATS = 20
+GAME_FRAMES = 3_000
+UNCACHED_BULLETS = 100  # collide_mask builds two masks for every pair it tests, so
+UNCACHED_FRAMES = 3     # the reference run only covers the smallest case
+
+
+class Unmasked(pygame.sprite.Sprite):
+    """Plain sprite, so collide_mask builds its mask from the image each test"""
+    def __init__(self, group, image, rect):
+        super().__init__(*([group] if group is not None else []))
+        self.image = image
+        self.rect = rect
+
+
+def populate(n_bullets):
+    random.seed(n_bullets)
+    images = AssetManager().images
+    enemies = pygame.sprite.Group()
+    for _ in range(ENEMIES):
+        enemy = Entity([enemies], LAYER_ENEMIES, images[random.choice(['enemy_basic', 'enemy_fast'])])
+        enemy.rect.center = (random.randint(0, VIRTUAL_WIDTH), random.randint(0, VIRTUAL_HEIGHT))
+    boss = Entity(None, LAYER_ENEMIES, images['boss_truck'])
+    boss.rect.center = (VIRTUAL_WIDTH // 2, 200)
+    player = Entity(None, LAYER_PLAYER, images['santa'])
+    player.rect.center = (VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2)
+    bullets = BulletSystem()
+    for _ in range(n_bullets):
+        bullets.spawn(random.uniform(0, VIRTUAL_WIDTH), random.uniform(0, VIRTUAL_HEIGHT), 0, 0)
+    return enemies, boss, player, bullets
+
+
+def bench(n_bullets):
+    """{precise: (best ms per frame, hits)} for rect-only and exact collisions.
+
+    One untimed frame per mode builds the masks and overlap tables; the two
+    modes then alternate over REPEATS runs so background load hits both.
+    """
+    enemies, boss, player, bullets = populate(n_bullets)
+    grid = SpatialHash()
+    grid.register("enemies", enemies)
+
+    def frame(precise):
+        grid.rebuild()
+        hits = bullets.groupcollide(enemies, False, False, precise)
+        boss_hits = bullets.spritecollide(boss, False, precise)
+        player_hits = grid.spritecollide(player, "enemies", False, precise)
+        return sum(len(h) for h in hits.values()) + len(boss_hits) + len(player_hits)
+
+    counts = {precise: frame(precise) for precise in (False, True)}
+    best = {False: float("inf"), True: float("inf")}
+    for _ in range(REPEATS):
+        for precise in best:
+            start = time.perf_counter()
+            for _ in range(FRAMES):
+                frame(precise)
+            best[precise] = min(best[precise], time.perf_counter() - start)
+    return {precise: (best[precise] / FRAMES * 1000, counts[precise]) for precise in best}
+
+
+def bench_uncached(n_bullets):
+    enemies, boss, player, bullets = populate(n_bullets)
+    bullet_group = pygame.sprite.Group()
+    for bullet in bullets:
+        Unmasked(bullet_group, bullet.image, bullet.rect)
+    enemy_group = pygame.sprite.Group(Unmasked(None, e.image, e.rect) for e in enemies)
+    boss = Unmasked(None, boss.image, boss.rect)
+    player = Unmasked(None, player.image, player.rect)
+    collide = pygame.sprite.collide_mask
+    start = time.perf_counter()
+    for _ in range(UNCACHED_FRAMES):
+        hits = pygame.sprite.groupcollide(enemy_group, bullet_group, False, False, collide)
+        boss_hits = pygame.sprite.spritecollide(boss, bullet_group, False, collide)
+        player_hits = pygame.sprite.spritecollide(player, enemy_group, False, collide)
+    elapsed = (time.perf_counter() - start) / UNCACHED_FRAMES * 1000
+    return elapsed, sum(len(h) for h in hits.values()) + len(boss_hits) + len(player_hits)
+
+
+def bench_game(engine, precise):
+    from src.core.profiler import Profiler
+    from src.utils.constants import PROFILER_HISTORY
+
+    engine.start_recording(os.devnull, "game", seed=11, level=30, difficulty="extreme")
+    engine.input_manager.stop()
+    scene = engine.scene_manager.current_scene
+    scene.precise_collisions = precise
+    player = scene.player
+    player.set_auto_fire(True)
+    profiler = Profiler()
+    profiler.set_enabled(True)
+    totals = {"collisions": 0.0, "frame": 0.0}
+    step = engine.step
+
+    def held_step(dt, events):
+        player.powerups["spread_shot"] = player.powerups["rapid_fire"] = 10
+        player.health = player.max_health
+        return step(dt, events)
+
+    engine.step = held_step
+    for _ in range(GAME_FRAMES // PROFILER_HISTORY):
+        engine.run_headless(max_frames=PROFILER_HISTORY)
+        averages = profiler.averages()
+        for name in totals:
+            totals[name] += averages.get(name, 0.0) * PROFILER_HISTORY
+    engine.step = step
+    profiler.set_enabled(False)
+    frames = GAME_FRAMES // PROFILER_HISTORY * PROFILER_HISTORY
+    return totals["collisions"] / frames, totals["frame"] / frames
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    from src.core.engine import Engine
+    engine = Engine(headless=True)
+
+    print(f"{ENEMIES} enemies + boss + player, {FRAMES} frames (ms per frame)")
+    print(f"{'bullets':>8}{'rect ms':>9}{'exact ms':>10}{'overhead':>10}{'rect hits':>11}{'exact hits':>12}"
+          f"{'uncached ms':>13}")
+    for n in BULLET_COUNTS:
+        results = bench(n)
+        rect_ms, rect_hits = results[False]
+        exact_ms, exact_hits = results[True]
+        uncached = "-"
+        if n <= UNCACHED_BULLETS:
+            uncached_ms, uncached_hits = bench_uncached(n)
+            assert uncached_hits == exact_hits
+            uncached = f"{uncached_ms:.1f}"
+        print(f"{n:>8}{rect_ms:>9.3f}{exact_ms:>10.3f}{(exact_ms / rect_ms - 1) * 100:>9.1f}%"
+              f"{rect_hits:>11}{exact_hits:>12}{uncached:>13}")
+
+    print(f"\nSpaceShooterScene, level 30 extreme, {GAME_FRAMES} frames (ms per frame)")
+    print(f"{'':<6}{'collisions':>12}{'frame':>9}")
+    rect_collide, rect_frame = bench_game(engine, False)
+    exact_collide, exact_frame = bench_game(engine, True)
+    print(f"{'rect':<6}{rect_collide:>12.3f}{rect_frame:>9.3f}")
+    print(f"{'exact':<6}{exact_collide:>12.3f}{exact_frame:>9.3f}")
+    print(f"overhead: {(exact_collide / rect_collide - 1) * 100:.1f}% of the collision phase, "
+          f"{(exact_frame / rect_frame - 1) * 100:.1f}% of the frame")
+    os.chdir(root)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
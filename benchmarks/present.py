@@ -0,0 +1,55 @@
+"""Benchmark: ResolutionManager.present per scale mode vs the old allocate-and-fill path.
+
+Run from the repository root:
+    python -m benchmarks.present
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.core.resolution_manager import ResolutionManager
+from src.utils.constants import *
+
+RESOLUTIONS = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+FRAMES = 60
+
+
+def legacy_present(manager, screen):
+    """The previous implementation: fresh scaled surface and full clear every frame"""
+    scaled_surf = pygame.transform.scale(
+        manager.virtual_surface,
+        (int(manager.virtual_width * manager.scale), int(manager.virtual_height * manager.scale))
+    )
+    screen.fill(BLACK)
+    screen.blit(scaled_surf, (manager.offset_x, manager.offset_y))
+
+
+def time_present(present, manager, screen):
+    present(screen)  # warm-up / first-frame bar clear
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        present(screen)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    manager = ResolutionManager()
+    print(f"{'screen':<11}{'legacy ms':>11}" + "".join(f"{mode + ' ms':>12}" for mode in SCALE_MODES))
+    for width, height in RESOLUTIONS:
+        screen = pygame.Surface((width, height))
+        manager.set_resolution(width, height)
+        manager.set_scale_mode("nearest")
+        manager.virtual_surface.fill((30, 60, 90))
+        row = f"{f'{width}x{height}':<11}{time_present(lambda s: legacy_present(manager, s), manager, screen):>11.2f}"
+        for mode in SCALE_MODES:
+            manager.set_scale_mode(mode)
+            row += f"{time_present(manager.present, manager, screen):>12.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Allocation benchmark: pooled vs unpooled projectiles.
+
+Holds spread_shot + rapid_fire for 60 simulated seconds headless (auto-fire,
+seeded, in a scratch directory) and reports how many bullet handles the
+player's BulletSystem constructed, its live/free/peak counts and Python heap
+allocation. The unpooled run sets the free list cap to 0 so every kill is dropped.
+Run from the repository root:
+    python -m benchmarks.projectiles
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SECONDS = 60
+
+
+def run(engine, max_free):
+    from src.utils.constants import FPS
+
+    engine.start_recording(os.devnull, "game", seed=7, level=1, difficulty="easy")
+    engine.input_manager.stop()
+    scene = engine.scene_manager.current_scene
+    bullets = scene.projectiles
+    bullets.max_free = max_free
+    player = scene.player
+    player.set_auto_fire(True)
+
+    step = engine.step
+
+    def held_step(dt, events):
+        # Keep both powerups active, the player alive and the boss away for the whole run
+        player.powerups["spread_shot"] = player.powerups["rapid_fire"] = SECONDS
+        player.health = player.max_health
+        scene.boss_spawned = True
+        return step(dt, events)
+
+    engine.step = held_step
+    tracemalloc.start()
+    start = time.perf_counter()
+    stats = engine.run_headless(max_frames=SECONDS * FPS)
+    elapsed = time.perf_counter() - start
+    _, heap_peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    engine.step = step
+    return stats, elapsed, heap_peak, blocks, bullets.stats()
+
+
+def main():
+    root = os.getcwd()
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)
+    sys.path.insert(0, root)
+
+    from src.core.engine import Engine
+    from src.utils.constants import PROJECTILE_POOL_MAX_FREE
+
+    engine = Engine(headless=True)
+    print(f"spread_shot + rapid_fire held for {SECONDS}s simulated")
+    print(f"{'mode':<10}{'frames':>8}{'wall s':>9}{'created':>9}{'reused':>8}{'peak':>6}"
+          f"{'live':>6}{'free':>6}{'heap peak KB':>14}{'blocks':>9}")
+    for label, max_free in (("unpooled", 0), ("pooled", PROJECTILE_POOL_MAX_FREE)):
+        stats, elapsed, heap_peak, blocks, pool = run(engine, max_free)
+        print(f"{label:<10}{stats['frames']:>8}{elapsed:>9.2f}{pool['created']:>9}{pool['reused']:>8}"
+              f"{pool['peak']:>6}{pool['live']:>6}{pool['free']:>6}{heap_peak / 1024:>14.0f}{blocks:>9}")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
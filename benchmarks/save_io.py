@@ -0,0 +1,84 @@
+"""Check: GameState write-behind keeps disk I/O out of the frame loop and loses nothing.
+
+Plays a seeded auto-fire run with a steady stream of kills headless in a scratch directory while logging
+every save-store transaction and the thread it came from, then shuts down cleanly and
+compares the stored rows with the in-memory state. Run from the repository root:
+    python -m benchmarks.save_io
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+FRAMES = 3000
+
+
+def main():
+    root = os.getcwd()
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)
+    sys.path.insert(0, root)
+
+    from src.core.engine import Engine
+    from src.core.game_state import GameState
+    from src.entities.enemy import Enemy
+
+    writes = []
+    in_frame = threading.Event()
+    write_records = GameState.write_records
+
+    def logging_write(self, changes):
+        writes.append((threading.current_thread().name, in_frame.is_set()))
+        return write_records(self, changes)
+
+    GameState.write_records = logging_write
+
+    engine = Engine(headless=True)
+    engine.start_recording(os.devnull, "game", seed=42, level=5, difficulty="easy")
+    engine.input_manager.stop()
+    scene = engine.scene_manager.current_scene
+    scene.player.set_auto_fire(True)
+    game_state = GameState()
+    game_state.flush_interval = 0.25
+    coins_before = game_state.data.get("coins", 0)
+
+    step = engine.step
+    frame = [0]
+
+    def tracked_step(dt, events):
+        # Drop enemies straight into the firing line so kills (and saves) pile up
+        frame[0] += 1
+        if frame[0] % 5 == 0 and engine.scene_manager.current_scene is scene:
+            enemy = Enemy([scene.all_sprites, scene.enemies])
+            enemy.position.x = scene.player.position.x
+            enemy.velocity.x = 0
+        in_frame.set()
+        try:
+            return step(dt, events)
+        finally:
+            in_frame.clear()
+
+    engine.step = tracked_step
+    start = time.perf_counter()
+    stats = engine.run_headless(max_frames=FRAMES)
+    game_state.close()
+    GameState.write_records = write_records
+    on_disk = game_state.read_store()
+
+    frame_writes = sum(1 for thread, framed in writes if thread == "MainThread" and framed)
+    background = sum(1 for thread, _ in writes if thread != "MainThread")
+    print(f"frames simulated:         {stats['frames']} in {time.perf_counter() - start:.2f}s")
+    print(f"coins earned:             {game_state.data.get('coins', 0) - coins_before}")
+    print(f"save writes in frame loop: {frame_writes}")
+    print(f"save writes by writer:     {background}")
+    print(f"total save writes:         {len(writes)}")
+    lost = on_disk != game_state.data
+    print(f"data lost on shutdown:     {lost}")
+    os.chdir(root)
+    if frame_writes or lost:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
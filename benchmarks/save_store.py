@@ -0,0 +1,125 @@
+"""Benchmark: save write latency, whole-file JSON vs the SQLite row store.
+
+Grows the player state to 1,000 and 100,000 stored records (high scores)
+and times one flush after a coin pickup and after a new high score: the
+old write path (copied below: json.dumps of all of data, temp file,
+rename) against GameState.flush, which rewrites only the changed rows.
+Also times loading the state both ways. Then checks crash recovery: a
+child process commits coin pickups in a loop and is killed with SIGKILL;
+the store must pass SQLite's integrity check and hold the last coin count
+the child reported committed (or the one after). Medians, scratch
+directory. Run from the repository root:
+    python -m benchmarks.save_store
+"""
+import json
+import os
+import signal
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SIZES = [1000, 100000]
+WRITES = 30
+
+
+def legacy_flush(data, path):
+    payload = json.dumps(data)
+    with open(path + ".tmp", 'w') as f:
+        f.write(payload)
+    os.replace(path + ".tmp", path)
+
+
+def median_ms(func):
+    times = []
+    for i in range(WRITES):
+        start = time.perf_counter()
+        func(i)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def child(root):
+    """Commit one coin at a time forever, reporting each committed total"""
+    sys.path.insert(0, root)
+    from src.core.game_state import GameState
+    game_state = GameState()
+    game_state.flush_interval = 3600
+    while True:
+        game_state.add_coins(1)
+        game_state.flush()
+        print(game_state.data["coins"], flush=True)
+
+
+def crash_check(root):
+    proc = subprocess.Popen([sys.executable, "-m", "benchmarks.save_store", root], stdout=subprocess.PIPE,
+                            text=True, env={**os.environ, "PYTHONPATH": root})
+    reported = []
+    deadline = time.perf_counter() + 1.0
+    for line in proc.stdout:
+        reported.append(int(line))
+        if time.perf_counter() > deadline:
+            break
+    os.kill(proc.pid, signal.SIGKILL)
+    reported += [int(line) for line in proc.stdout.read().split()]
+    proc.wait()
+    db = sqlite3.connect("save_data.db")
+    integrity = db.execute("PRAGMA integrity_check").fetchone()[0]
+    stored = json.loads(db.execute("SELECT value FROM state WHERE key = 'coins'").fetchone()[0])
+    db.close()
+    ok = integrity == "ok" and stored in (reported[-1], reported[-1] + 1)
+    print(f"\nkill -9 after {len(reported)} commits: integrity {integrity}, "
+          f"stored coins {stored}, last reported {reported[-1]} -> {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    from src.core.game_state import GameState
+
+    game_state = GameState()
+    game_state.flush_interval = 3600
+    base = dict(game_state.data)
+    print(f"{'records':>8}{'write':>14}{'json ms':>10}{'sqlite ms':>11}{'speedup':>9}")
+    for size in SIZES:
+        game_state.data = {**base, "high_scores": {str(level): level * 10 for level in range(size)}}
+        game_state.save_data()
+        game_state.flush()
+
+        def coin(i):
+            game_state.add_coins(1)
+
+        def high_score(i):
+            game_state.data["high_scores"][str(i)] += 1
+            game_state.save_data(("high_scores", str(i)))
+
+        for label, mutate in (("coin", coin), ("high score", high_score)):
+            old = median_ms(lambda i: (mutate(i), legacy_flush(game_state.data, "legacy.json")))
+            game_state.dirty_paths.clear()
+            new = median_ms(lambda i: (mutate(i), game_state.flush()))
+            print(f"{size:>8}{label:>14}{old:>10.3f}{new:>11.3f}{old / new:>8.0f}x")
+        start = time.perf_counter()
+        with open("legacy.json") as f:
+            json.load(f)
+        json_load = time.perf_counter() - start
+        start = time.perf_counter()
+        stored = game_state.read_store()
+        sqlite_load = time.perf_counter() - start
+        assert stored == game_state.data
+        print(f"{size:>8}{'load':>14}{json_load * 1000:>10.3f}{sqlite_load * 1000:>11.3f}")
+    game_state.close()
+    ok = crash_check(root)
+    os.chdir(root)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        child(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,97 @@
+"""Benchmark: SceneManager.change_scene with and without the scene cache.
+
+Walks a menu -> map -> game -> game over -> shop -> settings tour repeatedly
+(headless, scratch directory) and reports the mean cost of each transition
+with cache_size 0 (a new scene object every time, the old behaviour) and with
+the default LRU cache, after one untimed lap so class-level caches (starfield
+tiles, text) are warm in both runs. Also reports the first entry into the
+game scene from the map in a fresh process (cold class-level caches) with and
+without an idle-frame warm_up beforehand.
+Run from the repository root:
+    python -m benchmarks.scene_switch
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+LAPS = 50
+TOUR = [
+    ("menu", {}),
+    ("mode_select", {}),
+    ("map", {}),
+    ("game", {"level": 1, "difficulty": "easy"}),
+    ("game_over", {"result": "defeat", "score": 0, "coins": 0}),
+    ("map", {}),
+    ("shop", {}),
+    ("menu", {}),
+    ("settings", {}),
+]
+
+
+def lap(manager, timings):
+    for name, args in TOUR:
+        start = time.perf_counter()
+        manager.change_scene(name, **args)
+        timings.setdefault(name, []).append(time.perf_counter() - start)
+
+
+def run(manager, cache_size):
+    manager.clear_cache()
+    manager.cache_size = cache_size
+    lap(manager, {})
+    timings = {}
+    for _ in range(LAPS):
+        lap(manager, timings)
+    return {name: sum(t) / len(t) * 1000 for name, t in timings.items()}
+
+
+def first_game_entry(root, warm):
+    sys.path.insert(0, root)
+    from src.core.engine import Engine
+
+    manager = Engine(headless=True).scene_manager
+    manager.change_scene("map")
+    if warm:
+        manager.warm_up()
+    start = time.perf_counter()
+    manager.change_scene("game", level=1, difficulty="easy")
+    print((time.perf_counter() - start) * 1000)
+
+
+def cold_entry(root, warm):
+    out = subprocess.run([sys.executable, "-m", "benchmarks.scene_switch", root, str(int(warm))],
+                         cwd=os.getcwd(), capture_output=True, text=True, check=True,
+                         env={**os.environ, "PYTHONPATH": root})
+    return float(out.stdout.split()[-1])
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    from src.core.engine import Engine
+    from src.utils.constants import SCENE_CACHE_SIZE
+
+    engine = Engine(headless=True)
+    manager = engine.scene_manager
+    fresh = run(manager, 0)
+    cached = run(manager, SCENE_CACHE_SIZE)
+    print(f"{LAPS} laps, mean change_scene cost (ms)")
+    print(f"{'scene':<13}{'fresh':>9}{'cached':>9}{'speedup':>9}")
+    for name in fresh:
+        print(f"{name:<13}{fresh[name]:>9.3f}{cached[name]:>9.3f}{fresh[name] / cached[name]:>8.1f}x")
+    total_fresh, total_cached = sum(fresh.values()), sum(cached.values())
+    print(f"{'whole tour':<13}{total_fresh:>9.3f}{total_cached:>9.3f}{total_fresh / total_cached:>8.1f}x")
+    print(f"cache stats: {manager.stats()}")
+    print(f"\nfirst map -> game entry in a new process: {cold_entry(root, False):.2f} ms, "
+          f"after warm_up {cold_entry(root, True):.2f} ms")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        first_game_entry(sys.argv[1], sys.argv[2] == "1")
+    else:
+        main()
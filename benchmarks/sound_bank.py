@@ -0,0 +1,71 @@
+"""Benchmark: building the sound bank at startup.
+
+Compares three ways of producing the effect bank in a scratch directory:
+the old per-sample Python loop behind AudioManager.generate_tone (timed for
+the same total sample count; it never produced a playable Sound), the numpy
+synthesizers on a cold cache, and loading the cached bank from disk on a
+warm launch. Reports the median of several runs.
+Run from the repository root:
+    python -m benchmarks.sound_bank
+"""
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+RUNS = 7
+
+
+def python_loop(frequency, duration, sample_rate):
+    """The per-sample loop generate_tone used before the numpy synthesizers"""
+    samples = int(sample_rate * duration)
+    waves = []
+    for i in range(samples):
+        t = float(i) / sample_rate
+        value = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
+        waves.append([value, value])
+    return waves
+
+
+def median_ms(fn):
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import shutil
+    from src.core import audio_manager
+    from src.core.audio_manager import AudioManager
+    from src.core.sound_synth import EFFECTS
+
+    manager = AudioManager()
+    sample_rate = manager.mixer_format()[0]
+    seconds = sum(params["duration"] for params in EFFECTS.values())
+
+    def cold():
+        shutil.rmtree(audio_manager.SOUND_CACHE_DIR, ignore_errors=True)
+        manager.load_bank()
+
+    legacy = median_ms(lambda: [python_loop(440, params["duration"], sample_rate) for params in EFFECTS.values()])
+    generated = median_ms(cold)
+    manager.load_bank()
+    cached = median_ms(manager.load_bank)
+    print(f"{len(EFFECTS)} effects, {seconds:.2f}s of audio at {sample_rate} Hz, median of {RUNS} runs")
+    print(f"{'python loop (legacy)':<26}{legacy:>9.2f} ms")
+    print(f"{'numpy synth, cold cache':<26}{generated:>9.2f} ms{legacy / generated:>8.1f}x")
+    print(f"{'cached bank, warm launch':<26}{cached:>9.2f} ms{legacy / cached:>8.1f}x")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: sprite drawing, per-sprite blit loop vs the batched RenderQueue.
+
+Fills a LayeredUpdates group with 200, 1,000 and 5,000 enemy, player and
+power-up sprites spread over the virtual screen and draws it onto a
+1920x1080 surface with a screen-shake offset, the old way (a Python loop
+calling blit per sprite with the offset added by hand) and through
+RenderQueue (one Surface.blits per frame), at full render scale and at the
+0.75 dynamic-resolution step. Runs with the images as loaded, converted to
+the display format, and as 4x4 stand-ins where pixel work is negligible and
+only the per-sprite submission cost is left. Reports the best of several
+runs in ms per frame and sprites per ms. Headless, scratch directory.
+Run from the repository root:
+    python -m benchmarks.sprite_blits
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+COUNTS = [200, 1000, 5000]
+FRAMES = 30
+REPEATS = 5
+SHAKE = (7, -4)
+
+
+def loop_draw(group, surface, scale, world_image):
+    shake_x, shake_y = SHAKE
+    for sprite in group:
+        surface.blit(world_image(sprite.image), (int((sprite.rect.x + shake_x) * scale),
+                                                 int((sprite.rect.y + shake_y) * scale)))
+
+
+def queue_draw(queue, group, surface, scale, world_image):
+    queue.add_group(group)
+    queue.submit(surface, SHAKE, scale, world_image if scale != 1.0 else None)
+
+
+def ms_per_frame(draw):
+    draw()
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            draw()
+        best = min(best, time.perf_counter() - start)
+    return best / FRAMES * 1000
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    import pygame
+    from src.core.engine import Engine
+    from src.core.render_queue import RenderQueue
+    from src.core.resolution_manager import ResolutionManager
+    from src.entities.entity import Entity
+    from src.utils.assets import AssetManager
+    from src.utils.constants import LAYER_ENEMIES, LAYER_PLAYER, LAYER_PROJECTILES, VIRTUAL_WIDTH, VIRTUAL_HEIGHT
+
+    Engine(headless=True)
+    images = AssetManager().images
+    loaded = [images['enemy_basic'], images['enemy_fast'], images['santa'], images['powerup_health']]
+    layers = [LAYER_ENEMIES, LAYER_ENEMIES, LAYER_PLAYER, LAYER_PROJECTILES]
+    res_mgr = ResolutionManager()
+    queue = RenderQueue()
+
+    tiny = [pygame.Surface((4, 4)).convert() for _ in loaded]
+    image_sets = (("as loaded", loaded), ("display format", [image.convert_alpha() for image in loaded]),
+                  ("4x4 (submission cost only)", tiny))
+    for label, kinds in image_sets:
+        print(f"images {label}")
+        print(f"{'sprites':>8}{'scale':>7}{'loop ms':>10}{'queue ms':>10}{'loop spr/ms':>13}"
+              f"{'queue spr/ms':>14}{'speedup':>9}")
+        rng = random.Random(5)
+        for count in COUNTS:
+            group = pygame.sprite.LayeredUpdates()
+            for i in range(count):
+                sprite = Entity([group], layers[i % len(layers)], kinds[i % len(kinds)])
+                sprite.rect.center = (rng.randint(0, VIRTUAL_WIDTH), rng.randint(0, VIRTUAL_HEIGHT))
+            for scale in (1.0, 0.75):
+                res_mgr.set_render_scale(scale)
+                surface = res_mgr.get_world_surface() if scale != 1.0 else pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+                world_image = res_mgr.world_image
+                loop = ms_per_frame(lambda: loop_draw(group, surface, scale, world_image))
+                batched = ms_per_frame(lambda: queue_draw(queue, group, surface, scale, world_image))
+                print(f"{count:>8}{scale:>7.2f}{loop:>10.3f}{batched:>10.3f}{count / loop:>13.0f}"
+                      f"{count / batched:>14.0f}{loop / batched:>8.2f}x")
+        res_mgr.set_render_scale(1.0)
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
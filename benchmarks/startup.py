@@ -0,0 +1,59 @@
+"""Benchmark: cold-start time to the intro scene with and without the asset cache.
+
+Each measurement runs in a fresh interpreter inside a scratch directory so the
+on-disk cache state is controlled. Run from the repository root:
+    python -m benchmarks.startup
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+RUNS = 5
+
+CHILD = r"""
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from src.utils.assets import AssetManager
+assets = AssetManager()
+assets.use_cache = {use_cache}
+load_assets = assets.load_assets
+timings = {{}}
+def timed_load():
+    t = time.perf_counter()
+    load_assets()
+    timings["assets"] = time.perf_counter() - t
+assets.load_assets = timed_load
+from src.core.engine import Engine
+engine = Engine(headless=True)
+engine.run_headless(max_frames=1)
+total = time.perf_counter() - start
+print(total * 1000, timings["assets"] * 1000)
+"""
+
+
+def measure(root, workdir, use_cache):
+    code = CHILD.format(root=root, use_cache=use_cache)
+    out = subprocess.run([sys.executable, "-c", code], cwd=workdir, capture_output=True, text=True, check=True)
+    total_ms, assets_ms = out.stdout.strip().splitlines()[-1].split()
+    return float(total_ms), float(assets_ms)
+
+
+def main():
+    root = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        no_cache = [measure(root, workdir, False) for _ in range(RUNS)]
+        populate = measure(root, workdir, True)  # first cached launch writes the cache
+        warm = [measure(root, workdir, True) for _ in range(RUNS)]
+    print(f"{'mode':<28}{'to intro ms':>12}{'load_assets ms':>16}  (median of {RUNS})")
+    for label, runs in (("no cache (regenerate)", no_cache),
+                        ("cache miss (generate+save)", [populate]),
+                        ("cache hit (frombuffer)", warm)):
+        total_ms = sorted(r[0] for r in runs)[len(runs) // 2]
+        assets_ms = sorted(r[1] for r in runs)[len(runs) // 2]
+        print(f"{label:<28}{total_ms:>12.1f}{assets_ms:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: mixer load under a combat stress pattern, raw Sound.play vs the voice manager.
+
+Replays a few seconds of heavy fighting in real time (dummy audio driver):
+a laser every 150 ms, a burst of up to 30 explosion triggers on combo
+frames, and frequent pickups. The raw run calls Sound.play() for every
+trigger on the same number of mixer channels, as play_sound used to; the
+managed run goes through AudioManager.play_sound with its channel groups,
+voice caps, trigger merging and stealing. Reports voices started, peak
+concurrent voices, laser/pickup triggers that found no channel (the raw
+path loses them once explosions fill the mixer) and the voice counters.
+Run from the repository root:
+    python -m benchmarks.voices
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+SECONDS = 3
+FRAME = 1 / 60
+
+
+def schedule():
+    """Per-frame trigger lists, the same for both runs"""
+    rng = random.Random(3)
+    frames = []
+    for frame in range(int(SECONDS / FRAME)):
+        triggers = []
+        if frame % 9 == 0:
+            triggers.append("laser")
+        if rng.random() < 0.08:
+            triggers += ["explosion"] * rng.randint(10, 30)
+        elif rng.random() < 0.2:
+            triggers.append("explosion")
+        if rng.random() < 0.05:
+            triggers.append("pickup")
+        frames.append(triggers)
+    return frames
+
+
+def busy_channels(pygame):
+    return sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels()))
+
+
+def run(pygame, frames, play):
+    lost = peak = 0
+    cost = 0.0
+    for triggers in frames:
+        frame_start = time.perf_counter()
+        for name in triggers:
+            start = time.perf_counter()
+            channel = play(name)
+            cost += time.perf_counter() - start
+            lost += channel is None and name != "explosion"
+        peak = max(peak, busy_channels(pygame))
+        time.sleep(max(0.0, FRAME - (time.perf_counter() - frame_start)))
+    pygame.mixer.stop()
+    time.sleep(0.1)
+    return lost, peak, cost
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from src.core.audio_manager import AudioManager
+
+    manager = AudioManager()
+    manager.load_bank()
+    frames = schedule()
+    triggers = sum(len(f) for f in frames)
+
+    started = 0
+
+    def raw_play(name):
+        nonlocal started
+        channel = manager.sounds[name].play()
+        started += channel is not None
+        return channel
+
+    pygame.mixer.set_reserved(0)
+    raw = run(pygame, frames, raw_play)
+    manager.setup_channels()
+    managed = run(pygame, frames, manager.play_sound)
+
+    channels = pygame.mixer.get_num_channels()
+    print(f"{SECONDS}s of combat, {triggers} triggers, {channels} mixer channels")
+    print(f"{'':<16}{'voices started':>15}{'peak voices':>13}{'lost laser/pickup':>19}{'us/trigger':>12}")
+    rows = (("raw Sound.play", started, raw), ("voice manager", manager.voice_stats()["played"], managed))
+    for label, voices, (lost, peak, cost) in rows:
+        print(f"{label:<16}{voices:>15}{peak:>13}{lost:>19}{cost / triggers * 1e6:>12.1f}")
+    stats = manager.voice_stats()
+    print(f"voice manager: played {stats['played']}, merged {stats['merged']}, "
+          f"stolen {stats['stolen']}, dropped {stats['dropped']}")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
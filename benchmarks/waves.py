@@ -0,0 +1,93 @@
+"""Benchmark: cost of wave planning, per-frame roll vs precompiled timeline.
+
+For a few level configs (up to a designer-sized late-game wave) reports the
+one-off compile time of the spawn timeline, then plays the first wave at
+60 fps and times WaveManager.update alone (enemy construction stubbed out
+in both, so only planning is measured) against the old per-frame timer and
+random() roll per spawn. The old timer spawns at most one enemy per tick, so
+"spawned" shows how much of each wave it gets out in the same time.
+Headless, scratch directory.
+Run from the repository root:
+    python -m benchmarks.waves
+"""
+import os
+import sys
+import tempfile
+import time
+
+FRAME = 1 / 60
+LEVELS = [(1, "easy"), (25, "hard"), (50, "extreme")]
+HUGE_WAVE = 20000
+
+
+class OldWaveManager:
+    """Wave logic before the schedule compiler (timer plus a roll per spawn)"""
+
+    def __init__(self, game_scene, rng, spawn_rate, enemies_to_spawn):
+        self.game_scene = game_scene
+        self.rng = rng
+        self.spawn_rate = spawn_rate
+        self.wave = 1
+        self.enemies_spawned = 0
+        self.enemies_to_spawn = enemies_to_spawn
+        self.spawn_timer = 0
+
+    def update(self, dt):
+        self.spawn_timer += dt * 1000
+        if self.spawn_timer >= self.spawn_rate / (1 + (self.wave * 0.1)):
+            self.spawn_timer = 0
+            if self.enemies_spawned < self.enemies_to_spawn:
+                fast_chance = min(0.1 * self.wave, 0.8)
+                self.game_scene.spawned.append('fast' if self.rng.random() < fast_chance else 'basic')
+                self.enemies_spawned += 1
+
+
+class Field:
+    """Stand-in scene: records spawns and never clears the wave"""
+
+    def __init__(self):
+        self.spawned = []
+        self.enemies = [None]
+
+
+def per_frame_us(manager, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        manager.update(FRAME)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    sys.path.insert(0, root)
+    from src.core.level_manager import LevelManager
+    from src.core.rng import RNG
+    from src.core.wave_manager import WaveManager
+    from src.utils.constants import ENEMY_SPAWN_RATE
+
+    RNG().seed(1)
+    WaveManager.spawn_enemy = lambda self, event: self.game_scene.spawned.append(event[1])
+    configs = [(f"level {level} {difficulty}", LevelManager().get_level_config(level, difficulty))
+               for level, difficulty in LEVELS]
+    huge = dict(configs[-1][1], enemy_count=HUGE_WAVE, wave_count=1, spawn_rate=0.02)
+    configs.append((f"{HUGE_WAVE}-enemy wave", huge))
+
+    print(f"{'config':<22}{'events':>8}{'compile ms':>12}{'frames':>8}"
+          f"{'old spawned':>13}{'us/frame':>10}{'new spawned':>13}{'us/frame':>10}")
+    for label, config in configs:
+        start = time.perf_counter()
+        manager = WaveManager(Field(), config)
+        compile_ms = (time.perf_counter() - start) * 1000
+        events = sum(len(wave) for wave in manager.timeline)
+        frames = int(manager.events[-1][0] / FRAME) + 1
+        new = per_frame_us(manager, frames)
+        old_manager = OldWaveManager(Field(), RNG(), ENEMY_SPAWN_RATE, len(manager.events))
+        old = per_frame_us(old_manager, frames)
+        print(f"{label:<22}{events:>8}{compile_ms:>12.2f}{frames:>8}{old_manager.enemies_spawned:>13}{old:>10.2f}"
+              f"{len(manager.game_scene.spawned):>13}{new:>10.2f}")
+    os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
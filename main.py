@@ -1,5 +1,59 @@
+import argparse
 from src.core.engine import Engine
+from src.core.rng import RNG
+from src.ui.text_cache import TextCache
+
+GAME_SCENES = ("game", "space_shooter")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Space Shooter Santa: Galactic Justice")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a display using a fixed timestep (CI / throughput testing)")
+    parser.add_argument("--frames", type=int, help="headless frame budget")
+    parser.add_argument("--seconds", type=float, help="headless wall-clock budget")
+    parser.add_argument("--scene", help="scene to start in instead of the intro")
+    parser.add_argument("--level", type=int, default=1, help="campaign level for game scenes")
+    parser.add_argument("--difficulty", default="easy", help="campaign difficulty for game scenes")
+    parser.add_argument("--seed", type=int, help="seed for gameplay randomness")
+    parser.add_argument("--record", metavar="FILE", help="record this session's input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recorded session frame by frame")
+    parser.add_argument("--trace", metavar="FILE", help="profile the run and write a Chrome trace to FILE")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    engine = Engine()
-    engine.run()
+    args = parse_args()
+    engine = Engine(headless=args.headless)
+    scene = args.scene or "intro"
+    scene_args = {}
+    if scene in GAME_SCENES:
+        scene_args = {"level": args.level, "difficulty": args.difficulty}
+    
+    if args.replay:
+        engine.start_replay(args.replay)
+    elif args.record:
+        engine.start_recording(args.record, scene, seed=args.seed, **scene_args)
+    else:
+        if args.seed is not None:
+            RNG().seed(args.seed)
+        if args.scene:
+            engine.scene_manager.change_scene(scene, **scene_args)
+    
+    if args.trace:
+        engine.trace_path = args.trace
+        engine.toggle_trace()
+    
+    if args.headless:
+        if args.frames is None and args.seconds is None and not args.replay:
+            args.frames = 10000
+        stats = engine.run_headless(max_frames=args.frames, max_seconds=args.seconds)
+        print(f"{stats['frames']} frames in {stats['elapsed']:.2f}s "
+              f"({stats['fps']:.0f} simulated FPS, {stats['simulated_seconds']:.1f}s of game time)")
+        if args.trace:
+            for name, ms in sorted(engine.profiler.averages().items(), key=lambda item: -item[1]):
+                print(f"  {name:<18}{ms:8.3f} ms")
+            text_stats = TextCache().stats()
+            print(f"  text cache: {text_stats['hits']} hits, {text_stats['misses']} misses, "
+                  f"{text_stats['evictions']} evictions, {text_stats['memory'] // 1024} KiB")
+            engine.toggle_trace()
+    else:
+        engine.run()
@@ -1,16 +1,27 @@
+import hashlib
+import json
+import marshal
+import os
+import time
+import numpy as np
 import pygame
+from src.core import sound_synth
 from src.utils.constants import *
 
+# Bump when the bank layout changes
+SOUND_BANK_VERSION = 1
+SOUND_CACHE_DIR = os.path.join('cache', 'sounds')
+
 class AudioManager:
     """Centralized audio management system"""
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AudioManager, cls).__new__(cls)
             cls._instance.initialized = False
         return cls._instance
-    
+
     def __init__(self):
         if self.initialized:
             return
@@ -19,50 +30,218 @@ class AudioManager:
         self.music_volume = 0.8
         self.sound_volume = 1.0
         self.current_music = None
+        self.use_cache = True
+        self.setup_channels()
         self.initialized = True
-    
-    def load_sound(self, name, filename=None):
-        """Load a sound effect (or generate procedurally)"""
-        # For now, generate placeholder sounds
-        # In production, you'd load actual audio files
+
+    def setup_channels(self):
+        """Reserve a block of mixer channels per sound category"""
+        self.channel_groups = {}
+        # Per channel index: (effect name, priority, start time) while a voice plays
+        self.voices = {}
+        self.last_trigger = {}
+        self.voice_counters = {"played": 0, "merged": 0, "stolen": 0, "dropped": 0}
+        if not pygame.mixer.get_init():
+            return
+        total = sum(SOUND_CHANNEL_GROUPS.values())
+        pygame.mixer.set_num_channels(total)
+        # Keep Sound.play() from grabbing a channel behind the voice manager's back
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for category, count in SOUND_CHANNEL_GROUPS.items():
+            self.channel_groups[category] = list(range(first, first + count))
+            first += count
+
+    def mixer_format(self):
+        """(sample_rate, size, channels) the mixer actually opened with"""
+        return pygame.mixer.get_init() or (44100, -16, 2)
+
+    def load_bank(self, effects=None):
+        """Synthesize every effect into self.sounds, reusing cached samples from the last launch.
+
+        Each effect is keyed on its recipe, the synth code and the mixer
+        format, so only changed effects are rendered again. Returns how many
+        were rendered and how many came from the cache.
+        """
+        effects = sound_synth.EFFECTS if effects is None else effects
+        sample_rate, size, channels = self.mixer_format()
+        code = self.synth_digest()
+        keys = {name: self.effect_key(name, params, code) for name, params in effects.items()}
+        cached = self.load_cached_bank(keys) if self.use_cache else {}
+        arrays = {}
+        for name, params in effects.items():
+            array = cached.get(name)
+            if array is None:
+                array = sound_synth.to_mixer(sound_synth.render(params, sample_rate), size, channels)
+            arrays[name] = array
+            self.sounds[name] = pygame.mixer.Sound(array=array)
+        rendered = len(effects) - len(cached)
+        if self.use_cache and rendered:
+            self.save_cached_bank(keys, arrays)
+        return {"rendered": rendered, "cached": len(cached)}
+
+    @staticmethod
+    def synth_digest():
+        """Hash of the synthesizer code, so edits invalidate the cached bank"""
+        digest = hashlib.sha256(f"{SOUND_BANK_VERSION}|{np.__version__}".encode())
+        for name in sorted(vars(sound_synth)):
+            value = getattr(sound_synth, name)
+            if callable(value) and hasattr(value, '__code__'):
+                digest.update(name.encode())
+                digest.update(marshal.dumps(value.__code__))
+        return digest.hexdigest()
+
+    def effect_key(self, name, params, code):
+        """Cache key for one effect: its recipe, the synth code and the mixer format"""
+        recipe = json.dumps([name, params, self.mixer_format(), code], sort_keys=True)
+        return hashlib.sha256(recipe.encode()).hexdigest()
+
+    def load_cached_bank(self, keys):
+        """Sample arrays from the on-disk bank whose keys still match"""
+        manifest_path = os.path.join(SOUND_CACHE_DIR, 'manifest.json')
+        data_path = os.path.join(SOUND_CACHE_DIR, 'bank.bin')
         try:
-            sound = pygame.mixer.Sound(buffer=self.generate_tone(440, 0.1))
-            self.sounds[name] = sound
-        except:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            data = bytearray(os.path.getsize(data_path))
+            with open(data_path, 'rb') as f:
+                f.readinto(data)
+            arrays = {}
+            for name, entry in manifest['sounds'].items():
+                if keys.get(name) != entry['key']:
+                    continue
+                array = np.frombuffer(data, dtype=entry['dtype'], count=int(np.prod(entry['shape'])),
+                                      offset=entry['offset'])
+                arrays[name] = array.reshape(entry['shape'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        return arrays
+
+    def save_cached_bank(self, keys, arrays):
+        """Write the bank as raw sample buffers plus a manifest"""
+        entries = {}
+        offset = 0
+        chunks = []
+        for name, array in arrays.items():
+            entries[name] = {'key': keys[name], 'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+            chunks.append(array.tobytes())
+            offset += array.nbytes
+        manifest = {'version': SOUND_BANK_VERSION, 'sounds': entries}
+        try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+            data_path = os.path.join(SOUND_CACHE_DIR, 'bank.bin')
+            manifest_path = os.path.join(SOUND_CACHE_DIR, 'manifest.json')
+            with open(data_path + '.tmp', 'wb') as f:
+                f.write(b''.join(chunks))
+            with open(manifest_path + '.tmp', 'w') as f:
+                json.dump(manifest, f)
+            # Data first so a manifest never points at a half-written buffer
+            os.replace(data_path + '.tmp', data_path)
+            os.replace(manifest_path + '.tmp', manifest_path)
+        except OSError:
             pass
-    
+
+    def load_sound(self, name, filename=None):
+        """Load a sound effect (synthesized from its recipe, or a placeholder tone)"""
+        if not pygame.mixer.get_init():
+            return
+        params = sound_synth.EFFECTS.get(name)
+        if params is None:
+            self.sounds[name] = pygame.mixer.Sound(buffer=self.generate_tone(440, 0.1))
+            return
+        sample_rate, size, channels = self.mixer_format()
+        self.sounds[name] = pygame.mixer.Sound(
+            array=sound_synth.to_mixer(sound_synth.render(params, sample_rate), size, channels))
+
     def play_sound(self, name, volume=1.0):
-        """Play a sound effect"""
-        if name in self.sounds:
-            sound = self.sounds[name]
-            sound.set_volume(self.sound_volume * volume)
-            sound.play()
-    
+        """Play a sound effect on its category's channels; returns the Channel or None if dropped
+
+        Repeat triggers within SOUND_MERGE_MS reuse the voice already started.
+        Past the effect's voice cap its oldest voice is restarted; with the
+        category full, the lowest-priority (then oldest) voice no more
+        important than this one is stolen, otherwise the trigger is dropped.
+        """
+        if name not in self.sounds or not self.channel_groups:
+            return None
+        config = SOUND_VOICES.get(name, SOUND_DEFAULT_VOICE)
+        now = time.perf_counter() * 1000
+        volume = self.sound_volume * volume
+        last = self.last_trigger.get(name)
+        if last and now - last[0] <= SOUND_MERGE_MS and self.voice_name(last[1]) == name:
+            self.voice_counters["merged"] += 1
+            channel = pygame.mixer.Channel(last[1])
+            channel.set_volume(max(channel.get_volume(), volume))
+            return channel
+        index = self.pick_channel(name, config)
+        if index is None:
+            self.voice_counters["dropped"] += 1
+            return None
+        channel = pygame.mixer.Channel(index)
+        if index in self.voices:
+            self.voice_counters["stolen"] += 1
+            channel.stop()
+        channel.set_volume(volume)
+        channel.play(self.sounds[name])
+        self.voices[index] = (name, config["priority"], now)
+        self.last_trigger[name] = (now, index)
+        self.voice_counters["played"] += 1
+        return channel
+
+    def voice_name(self, index):
+        """Effect playing on a channel, forgetting voices that have finished"""
+        voice = self.voices.get(index)
+        if voice and not pygame.mixer.Channel(index).get_busy():
+            del self.voices[index]
+            voice = None
+        return voice[0] if voice else None
+
+    def pick_channel(self, name, config):
+        """Free channel, channel to steal, or None to drop the trigger"""
+        group = self.channel_groups.get(config["category"], ())
+        playing = [index for index in group if self.voice_name(index) is not None]
+        same = [index for index in playing if self.voices[index][0] == name]
+        if len(same) >= config["max_voices"]:
+            return min(same, key=lambda index: self.voices[index][2])
+        free = [index for index in group if index not in self.voices]
+        if free:
+            return free[0]
+        victims = [index for index in playing if self.voices[index][1] <= config["priority"]]
+        if not victims:
+            return None
+        return min(victims, key=lambda index: self.voices[index][1:])
+
+    def voice_stats(self):
+        """Trigger counters plus the voices currently playing per category"""
+        active = {category: sum(self.voice_name(index) is not None for index in group)
+                  for category, group in self.channel_groups.items()}
+        return {**self.voice_counters, "active": active}
+
+    def reset_voice_stats(self):
+        for key in self.voice_counters:
+            self.voice_counters[key] = 0
+
     def play_music(self, name, loops=-1):
         """Play background music"""
         # In production, load and play actual music files
         pass
-    
+
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         self.music_volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.music_volume)
-    
+
     def set_sound_volume(self, volume):
         """Set sound effect volume (0.0 to 1.0)"""
         self.sound_volume = max(0.0, min(1.0, volume))
-    
+
     def generate_tone(self, frequency, duration):
-        """Generate a simple tone for placeholder audio"""
-        sample_rate = 44100
-        samples = int(sample_rate * duration)
-        wave = []
-        for i in range(samples):
-            value = int(32767 * 0.3 * pygame.math.sin(2.0 * 3.14159 * frequency * i / sample_rate))
-            wave.append([value, value])
-        return bytes(wave)
-    
+        """Generate a simple tone for placeholder audio, as raw bytes in the mixer's format"""
+        sample_rate, size, channels = self.mixer_format()
+        return sound_synth.to_mixer(sound_synth.tone(frequency, duration, sample_rate), size, channels).tobytes()
+
     def stop_all(self):
         """Stop all sounds"""
         pygame.mixer.stop()
         pygame.mixer.music.stop()
+        self.voices.clear()
+        self.last_trigger.clear()
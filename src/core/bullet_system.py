@@ -0,0 +1,384 @@
+import numpy as np
+import pygame
+import weakref
+from src.utils.constants import *
+from src.utils.assets import AssetManager
+
+def overlap_table(mask, other):
+    """Where other overlaps mask, for every offset at which their rects overlap.
+
+    A bool array indexed [dy + h - 1, dx + w - 1] by the offset (dx, dy) of
+    other's top-left from mask's, (w, h) being other's size.
+    """
+    table = mask.convolve(other)
+    w, h = table.get_size()
+    surface = table.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+    return np.frombuffer(pygame.image.tobytes(surface, 'RGBA'), dtype=np.uint8)[::4].reshape(h, w) > 0
+
+
+class Bullet:
+    """Sprite-like handle onto one slot of a BulletSystem.
+
+    Exposes the parts of the Projectile/Sprite interface the scene uses
+    (``rect``, ``image``, ``damage``, ``p_type``, ``alive``, ``kill``) while
+    the motion itself lives in the system's arrays. A removed bullet keeps
+    its last center, so hits read after a killing collision still land
+    where the bullet was.
+    """
+    __slots__ = ("system", "slot", "damage", "p_type", "target", "image", "last_center")
+
+    def __init__(self, system):
+        self.system = system
+        self.slot = -1
+        self.damage = 10
+        self.p_type = 'coke'
+        self.target = None
+        self.image = None
+        self.last_center = (0, 0)
+
+    @property
+    def position(self):
+        return pygame.math.Vector2(*self.system.pos[self.slot]) if self.slot >= 0 else pygame.math.Vector2(self.last_center)
+
+    @property
+    def velocity(self):
+        return pygame.math.Vector2(*self.system.vel[self.slot]) if self.slot >= 0 else pygame.math.Vector2()
+
+    @property
+    def rect(self):
+        if self.slot < 0:
+            return self.image.get_rect(center=self.last_center)
+        x, y = self.system.pos[self.slot]
+        return self.image.get_rect(center=(int(x), int(y)))
+
+    @property
+    def mask(self):
+        return AssetManager().get_mask(self.image)
+
+    def alive(self):
+        return self.slot >= 0
+
+    def kill(self):
+        if self.slot >= 0:
+            self.system.remove(self.slot)
+
+
+class BulletSystem:
+    """Structure-of-arrays projectile simulation.
+
+    Bullets are packed into the first ``count`` slots; integration, homing and
+    off-screen culling run as whole-array passes and removal swaps the last
+    bullet into the freed slot. Collision helpers mirror the
+    ``pygame.sprite`` ones the scene used, returning Bullet handles; with
+    ``precise`` the vectorized rect hits are confirmed in one more pass,
+    looked up in per-image overlap tables. ``draw`` issues a single
+    ``Surface.blits`` call.
+    """
+    def __init__(self, capacity=MAX_PROJECTILES):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.half = np.zeros((capacity, 2), dtype=np.int32)
+        self.size = np.zeros((capacity, 2), dtype=np.int32)
+        self.homing = np.zeros(capacity, dtype=bool)
+        # Index of each bullet's image in kind_images
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.kind_ids = {}
+        self.kind_images = []
+        # Every overlap_table built so far, raveled end to end; sprite image ->
+        # start of its table against each bullet kind
+        self.tables = np.zeros(0, dtype=bool)
+        self.table_starts = weakref.WeakKeyDictionary()
+        self.handles = []
+        self.images = []
+        self.max_free = PROJECTILE_POOL_MAX_FREE
+        self.free = []
+        # Handles removed since the last update(); held back so a bullet
+        # spawned in the same frame can't reuse one a collision result holds
+        self.released = []
+        self.peak = 0
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(list(self.handles))
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in ("pos", "vel", "half", "size", "homing", "kind"):
+            arr = getattr(self, name)
+            grown = np.zeros((self.capacity,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:self.count] = arr[:self.count]
+            setattr(self, name, grown)
+
+    def spawn(self, x, y, speed_x, speed_y, damage=10, p_type='coke', target=None, scale=1.0):
+        """Add a bullet and return its handle"""
+        from src.entities.projectile import ProjectileImages
+        if self.count == self.capacity:
+            self._grow()
+        if self.free:
+            bullet = self.free.pop()
+            self.reused += 1
+        else:
+            bullet = Bullet(self)
+            self.created += 1
+        image = ProjectileImages().image(p_type, scale)
+        i = self.count
+        w, h = image.get_size()
+        self.pos[i] = (x, y)
+        self.vel[i] = (speed_x, speed_y)
+        self.size[i] = (w, h)
+        self.half[i] = (w // 2, h // 2)
+        self.homing[i] = target is not None
+        kind = self.kind_ids.get(image)
+        if kind is None:
+            kind = self.kind_ids[image] = len(self.kind_images)
+            self.kind_images.append(image)
+        self.kind[i] = kind
+        bullet.slot = i
+        bullet.damage = damage
+        bullet.p_type = p_type
+        bullet.target = target
+        bullet.image = image
+        self.handles.append(bullet)
+        self.images.append(image)
+        self.count = i + 1
+        self.peak = max(self.peak, self.count)
+        return bullet
+
+    def remove(self, i):
+        """Remove the bullet in slot i, moving the last bullet into its place"""
+        last = self.count - 1
+        bullet = self.handles[i]
+        x, y = self.pos[i]
+        bullet.last_center = (int(x), int(y))
+        if i != last:
+            for arr in (self.pos, self.vel, self.half, self.size, self.homing, self.kind):
+                arr[i] = arr[last]
+            moved = self.handles[last]
+            moved.slot = i
+            self.handles[i] = moved
+            self.images[i] = self.images[last]
+        self.handles.pop()
+        self.images.pop()
+        self.count = last
+        bullet.slot = -1
+        bullet.target = None
+        if len(self.free) + len(self.released) < self.max_free:
+            self.released.append(bullet)
+
+    def _remove_many(self, indices):
+        # Descending order keeps every swapped-in bullet a live one
+        for i in sorted(indices.tolist(), reverse=True):
+            self.remove(i)
+
+    def _steer(self, dt):
+        n = self.count
+        idx = np.nonzero(self.homing[:n])[0]
+        if idx.size == 0:
+            return
+        targets = np.empty((idx.size, 2))
+        active = np.ones(idx.size, dtype=bool)
+        handles = self.handles
+        for k, i in enumerate(idx.tolist()):
+            target = handles[i].target
+            if target is not None and target.alive():
+                targets[k] = target.rect.center
+            else:
+                handles[i].target = None
+                self.homing[i] = False
+                active[k] = False
+        idx, targets = idx[active], targets[active]
+        if idx.size == 0:
+            return
+
+        pos, vel = self.pos[idx], self.vel[idx]
+        # Stop homing once the bullet has passed its target
+        moving_down = vel[:, 1] > 0
+        passed = np.where(moving_down, pos[:, 1] > targets[:, 1], pos[:, 1] < targets[:, 1])
+        direction = targets - pos
+        dist = np.hypot(direction[:, 0], direction[:, 1])
+        steer = ~passed & (dist > 0)
+        if not steer.any():
+            return
+        idx, vel, direction, dist = idx[steer], vel[steer], direction[steer], dist[steer]
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        steering = direction / dist[:, None] * speed[:, None] - vel
+        limit = PROJECTILE_HOMING_SPEED * dt
+        length = np.hypot(steering[:, 0], steering[:, 1])
+        over = length > limit
+        steering[over] *= (limit / length[over])[:, None]
+        self.vel[idx] = vel + steering
+
+    def bounds(self):
+        """Integer left, top, right, bottom arrays matching each bullet's rect"""
+        n = self.count
+        center = self.pos[:n].astype(np.int32)
+        left = center[:, 0] - self.half[:n, 0]
+        top = center[:, 1] - self.half[:n, 1]
+        return left, top, left + self.size[:n, 0], top + self.size[:n, 1]
+
+    def update(self, dt):
+        """Steer, integrate and cull every bullet"""
+        if self.released:
+            self.free.extend(self.released)
+            self.released.clear()
+        if self.count == 0:
+            return
+        # Projectile.update moves once in Entity.update and again after
+        # steering; bullets keep that effective speed
+        n = self.count
+        self.pos[:n] += self.vel[:n] * dt
+        self._steer(dt)
+        self.pos[:n] += self.vel[:n] * dt
+        left, top, right, bottom = self.bounds()
+        gone = (bottom < -50) | (top > VIRTUAL_HEIGHT + 50) | (right < -50) | (left > VIRTUAL_WIDTH + 50)
+        if gone.any():
+            self._remove_many(np.nonzero(gone)[0])
+
+    def _table_starts(self, image):
+        """Start in tables of image's overlap table with each bullet kind, built on first use"""
+        starts = self.table_starts.get(image)
+        if starts is None or len(starts) < len(self.kind_images):
+            starts = list(starts or ())
+            get_mask = AssetManager().get_mask
+            mask = get_mask(image)
+            parts = [self.tables]
+            end = self.tables.size
+            for other in self.kind_images[len(starts):]:
+                table = overlap_table(mask, get_mask(other))
+                starts.append(end)
+                parts.append(table.ravel())
+                end += table.size
+            self.tables = np.concatenate(parts)
+            self.table_starts[image] = starts
+        return starts
+
+    def _confirm(self, sprites, origins, pairs_s, pairs_b, left, top):
+        """Narrow phase: the rect candidate pairs whose masks overlap
+
+        From MASK_TABLE_MIN_PAIRS candidates on, each pair is one lookup in
+        the overlap table of its two images, settling them all in a single
+        array pass; fewer are cheaper to mask test one by one.
+        """
+        dx = left[pairs_b] - origins[pairs_s, 0]
+        dy = top[pairs_b] - origins[pairs_s, 1]
+        if pairs_s.size < MASK_TABLE_MIN_PAIRS:
+            get_mask = AssetManager().get_mask
+            kind_masks = [get_mask(image) for image in self.kind_images]
+            sprite_masks = {}
+            keep = []
+            for k, (s, kind, x, y) in enumerate(zip(pairs_s.tolist(), self.kind[pairs_b].tolist(),
+                                                    dx.tolist(), dy.tolist())):
+                mask = sprite_masks.get(s)
+                if mask is None:
+                    mask = sprite_masks[s] = sprites[s].mask
+                if mask.overlap(kind_masks[kind], (x, y)):
+                    keep.append(k)
+            return pairs_s[keep], pairs_b[keep]
+
+        # Per (sprite image, bullet kind): the row stride of their table and
+        # the cell for offset (0, 0)
+        kinds = {}
+        index = [kinds.setdefault(sprite.image, len(kinds)) for sprite in sprites]
+        sizes = [image.get_size() for image in self.kind_images]
+        zero, stride = [], []
+        for image in kinds:
+            width = image.get_width()
+            for start, (w, h) in zip(self._table_starts(image), sizes):
+                stride.append(width + w - 1)
+                zero.append(start + (h - 1) * (width + w - 1) + w - 1)
+        combo = np.array(index)[pairs_s] * len(sizes) + self.kind[pairs_b]
+        hit = self.tables[np.array(zero)[combo] + dy * np.array(stride)[combo] + dx]
+        return pairs_s[hit], pairs_b[hit]
+
+    def spritecollide(self, sprite, dokill, precise=False):
+        """Bullets overlapping a sprite, like pygame.sprite.spritecollide (collide_mask when precise)"""
+        if self.count == 0:
+            return []
+        rect = sprite.rect
+        left, top, right, bottom = self.bounds()
+        idx = np.nonzero((left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top))[0]
+        if precise and idx.size:
+            _, idx = self._confirm([sprite], np.array([rect.topleft]), np.zeros_like(idx), idx, left, top)
+        hits = [self.handles[i] for i in idx.tolist()]
+        if dokill and idx.size:
+            self._remove_many(idx)
+        return hits
+
+    def groupcollide(self, group, dokill_sprites, dokill_bullets, precise=False):
+        """{sprite: [bullets]} for a sprite group, like pygame.sprite.groupcollide
+
+        Every sprite is rect-tested against every bullet in one broadcast
+        pass. Each bullet hits at most one sprite (the first in group order)
+        when bullets are killed, exactly as with the sequential pygame helper.
+        """
+        crashed = {}
+        sprites = group.sprites()
+        if self.count == 0 or not sprites:
+            return crashed
+        left, top, right, bottom = self.bounds()
+        rects = [sprite.rect for sprite in sprites]
+        boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int32)
+        overlap = ((left < boxes[:, 2:3]) & (right > boxes[:, 0:1]) &
+                   (top < boxes[:, 3:4]) & (bottom > boxes[:, 1:2]))
+        # Row-major nonzero: pairs come out in sprite order, then bullet order
+        pairs_s, pairs_b = np.nonzero(overlap)
+        if precise and pairs_s.size:
+            pairs_s, pairs_b = self._confirm(sprites, boxes, pairs_s, pairs_b, left, top)
+        if dokill_bullets and pairs_s.size:
+            _, first = np.unique(pairs_b, return_index=True)
+            first.sort()
+            pairs_s, pairs_b = pairs_s[first], pairs_b[first]
+
+        handles = self.handles
+        for s, b in zip(pairs_s.tolist(), pairs_b.tolist()):
+            hits = crashed.get(sprites[s])
+            if hits is None:
+                crashed[sprites[s]] = [handles[b]]
+            else:
+                hits.append(handles[b])
+        if dokill_sprites:
+            for sprite in crashed:
+                sprite.kill()
+        if dokill_bullets and pairs_b.size:
+            self._remove_many(pairs_b)
+        return crashed
+
+    def draw(self, surface, offset=(0, 0), scale=1.0, image_for=None):
+        """Blit every bullet in one batch (scale maps virtual coordinates onto a reduced-resolution surface)"""
+        if self.count == 0:
+            return
+        left, top, _, _ = self.bounds()
+        xs = ((left + offset[0]) * scale).astype(np.int32).tolist()
+        ys = ((top + offset[1]) * scale).astype(np.int32).tolist()
+        images = self.images
+        if image_for is not None:
+            scaled = {image: image_for(image) for image in set(images)}
+            images = [scaled[image] for image in images]
+        surface.blits(zip(images, zip(xs, ys)), doreturn=False)
+
+    def queue(self, render_queue, layer=LAYER_PROJECTILES):
+        """Queue every bullet's image at its rect's top-left for a batched RenderQueue submit"""
+        if self.count == 0:
+            return
+        left, top, _, _ = self.bounds()
+        render_queue.extend(layer, self.images, zip(left.tolist(), top.tolist()))
+
+    def empty(self):
+        """Remove every bullet"""
+        while self.count:
+            self.remove(self.count - 1)
+
+    def stats(self):
+        return {
+            "live": self.count,
+            "free": len(self.free) + len(self.released),
+            "peak": self.peak,
+            "created": self.created,
+            "reused": self.reused,
+        }
@@ -0,0 +1,74 @@
+from src.utils.constants import *
+
+class DynamicResolution:
+    """Frame-time feedback controller for ResolutionManager.render_scale.
+
+    Steps the world render scale down through DYNAMIC_RES_STEPS when the
+    smoothed frame time stays over budget and back up once there is sustained
+    headroom. The thresholds and dwell times differ so it settles instead of
+    oscillating between two steps. Every step down is checked after it
+    settles: if it did not actually buy frame time (the world upscale can
+    cost more than the pixels saved) it is undone and backed off.
+    """
+    def __init__(self, resolution_manager, target_fps=FPS):
+        self.resolution_manager = resolution_manager
+        self.enabled = False
+        self.budget_ms = 1000.0 / target_fps
+        self.average_ms = self.budget_ms
+        self.step_index = 0
+        self.over_frames = 0
+        self.under_frames = 0
+        self.frame = 0
+        self.baseline_ms = 0.0
+        self.pending_check = 0
+        self.blocked_until = 0
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.step_index = 0
+        self.average_ms = self.budget_ms
+        self.over_frames = 0
+        self.under_frames = 0
+        self.pending_check = 0
+        self.blocked_until = 0
+        self.resolution_manager.set_render_scale(DYNAMIC_RES_STEPS[0])
+
+    def update(self, frame_ms):
+        """Feed the work time of the last frame (excluding any frame-cap sleep)"""
+        if not self.enabled:
+            return
+        self.frame += 1
+        self.average_ms += (frame_ms - self.average_ms) * DYNAMIC_RES_SMOOTHING
+
+        if self.pending_check:
+            self.pending_check -= 1
+            if self.pending_check == 0 and self.average_ms > self.baseline_ms * DYNAMIC_RES_MIN_GAIN:
+                self.step_index -= 1
+                self._apply()
+                self.blocked_until = self.frame + DYNAMIC_RES_RETRY_FRAMES
+            return
+
+        if self.average_ms > self.budget_ms * DYNAMIC_RES_DOWN_RATIO:
+            self.over_frames += 1
+            self.under_frames = 0
+        elif self.average_ms < self.budget_ms * DYNAMIC_RES_UP_RATIO:
+            self.under_frames += 1
+            self.over_frames = 0
+        else:
+            self.over_frames = 0
+            self.under_frames = 0
+
+        can_step_down = self.step_index < len(DYNAMIC_RES_STEPS) - 1 and self.frame >= self.blocked_until
+        if self.over_frames >= DYNAMIC_RES_DOWN_FRAMES and can_step_down:
+            self.baseline_ms = self.average_ms
+            self.step_index += 1
+            self._apply()
+            self.pending_check = DYNAMIC_RES_SETTLE_FRAMES
+        elif self.under_frames >= DYNAMIC_RES_UP_FRAMES and self.step_index > 0:
+            self.step_index -= 1
+            self._apply()
+
+    def _apply(self):
+        self.over_frames = 0
+        self.under_frames = 0
+        self.resolution_manager.set_render_scale(DYNAMIC_RES_STEPS[self.step_index])
@@ -1,11 +1,20 @@
-import pygame
+import copy
+import os
 import sys
+import time
+import pygame
 from src.utils.constants import *
 from src.core.scene_manager import SceneManager
 from src.core.settings import Settings
 from src.core.resolution_manager import ResolutionManager
+from src.core.dynamic_resolution import DynamicResolution
 from src.core.audio_manager import AudioManager
+from src.core.game_state import GameState
+from src.core.input_manager import InputManager
+from src.core.profiler import Profiler
+from src.core.rng import RNG
 from src.utils.assets import AssetManager
+from src.ui.text_cache import TextCache
 from src.scenes.menu_scene import MenuScene
 from src.scenes.mode_select_scene import ModeSelectScene
 from src.scenes.game_scene import SpaceShooterScene
@@ -18,23 +27,42 @@ from src.scenes.shop_scene import ShopScene
 from src.scenes.game_over_scene import GameOverScene
 
 class Engine:
-    def __init__(self):
+    def __init__(self, headless=False):
+        self.headless = headless
+        if headless:
+            # Render-less run (CI, benchmarks): SDL dummy drivers, no window
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self.settings = Settings()
         self.resolution_manager = ResolutionManager()
+        self.dynamic_resolution = DynamicResolution(self.resolution_manager)
         self.audio_manager = AudioManager()
+        self.input_manager = InputManager()
+        self.profiler = Profiler()
+        self.trace_path = None # Default output for toggle_trace
         
         self.screen = None
         self.apply_display_settings()
         
         self.clock = pygame.time.Clock()
+        self.dynamic_resolution.set_enabled(self.settings.dynamic_resolution)
         self.asset_manager = AssetManager()
         self.asset_manager.load_assets()
+        self.audio_manager.load_bank()
         
         # Performance tracking
         self.fps_history = []
         self.frame_time = 0
         
+        # Retained-mode presentation: virtual rects the last step changed
+        # (None = everything) and the idle frame cap for static scenes
+        self.dirty_rects = None
+        self.fps_rect = None
+        self.fps_text = None
+        self.last_input = 0
+        self.idle = False
+        
         self.scene_manager = SceneManager(self)
         self.scene_manager.add_scene("menu", MenuScene)
         self.scene_manager.add_scene("mode_select", ModeSelectScene)
@@ -68,16 +96,95 @@ class Engine:
         pygame.display.set_caption(TITLE)
         
         # Configure resolution manager
+        self.resolution_manager.scale_mode = self.settings.scale_mode
         self.resolution_manager.set_resolution(width, height)
         
+        # A new mode can bring a new pixel format; images follow it
+        if hasattr(self, 'asset_manager'):
+            self.asset_manager.finalize_images()
+        
         # Update audio settings
         self.audio_manager.set_music_volume(self.settings.music_volume)
         self.audio_manager.set_sound_volume(self.settings.sound_volume)
 
+    def step(self, dt, events):
+        """Advance the current scene by one frame and render to the virtual surface"""
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.scene_manager.quit_game()
+            elif event.type == pygame.VIDEORESIZE:
+                self.settings.resolution_width = event.w
+                self.settings.resolution_height = event.h
+                self.resolution_manager.set_resolution(event.w, event.h)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.set_enabled(not self.profiler.enabled)
+                elif event.key == pygame.K_F4:
+                    self.toggle_trace()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                if self.scene_manager.current_scene:
+                    self.scene_manager.current_scene.mark_dirty()
+        
+        # Get virtual surface for rendering
+        virtual_surface = self.resolution_manager.get_virtual_surface()
+        
+        profiler = self.profiler
+        with profiler.scope("input"):
+            self.scene_manager.process_input(events)
+        with profiler.scope("update"):
+            self.scene_manager.update(dt)
+        with profiler.scope("draw"):
+            self.dirty_rects = self.scene_manager.draw(virtual_surface)
+        return virtual_surface
+
+    def toggle_trace(self, path=None):
+        """Start a Chrome-trace capture, or stop the running one and write it out"""
+        if self.profiler.tracing:
+            path = path or self.trace_path or time.strftime("trace_%Y%m%d_%H%M%S.json")
+            count = self.profiler.stop_trace(path)
+            print(f"Wrote {count} trace events to {path}")
+        else:
+            self.profiler.set_enabled(True)
+            self.profiler.start_trace()
+
+    def start_recording(self, path, scene="intro", seed=None, **scene_args):
+        """Seed the RNG, enter a scene and record every following frame of input to path"""
+        seed = RNG().seed(seed)
+        # Recorded sessions start from freshly built scenes, like their replays
+        self.scene_manager.clear_cache()
+        header = {
+            "seed": seed,
+            "scene": scene,
+            "scene_args": scene_args,
+            "game_state": copy.deepcopy(GameState().data)
+        }
+        self.scene_manager.change_scene(scene, **scene_args)
+        self.input_manager.start_recording(path, header)
+
+    def start_replay(self, path):
+        """Restore the recorded starting conditions and replay the session frame by frame"""
+        header = self.input_manager.start_replay(path)
+        RNG().seed(header["seed"])
+        game_state = GameState()
+        game_state.persistent = False
+        game_state.data = copy.deepcopy(header["game_state"])
+        self.scene_manager.clear_cache()
+        self.scene_manager.change_scene(header["scene"], **header.get("scene_args", {}))
+        return header
+
     def run(self):
         while self.scene_manager.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            dt = self.clock.tick(IDLE_FPS if self.idle else FPS) / 1000.0  # Delta time in seconds
+            dt, events = self.input_manager.begin_frame(dt, pygame.event.get())
+            if self.input_manager.replay_finished:
+                break
+            now = pygame.time.get_ticks()
+            if events:
+                self.last_input = now
             self.frame_time = dt
+            self.profiler.begin_frame()
+            # Work time of the previous frame, excluding the frame-cap sleep
+            self.dynamic_resolution.update(self.clock.get_rawtime())
             
             # Track FPS
             if self.settings.show_fps:
@@ -86,33 +193,99 @@ class Engine:
                 if len(self.fps_history) > 60:
                     self.fps_history.pop(0)
             
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.scene_manager.quit_game()
-                elif event.type == pygame.VIDEORESIZE:
-                    self.settings.resolution_width = event.w
-                    self.settings.resolution_height = event.h
-                    self.resolution_manager.set_resolution(event.w, event.h)
-            
-            # Get virtual surface for rendering
-            virtual_surface = self.resolution_manager.get_virtual_surface()
-            
-            self.scene_manager.process_input(events)
-            self.scene_manager.update(dt)
-            self.scene_manager.draw(virtual_surface)
-            
-            # Draw FPS if enabled
+            scene = self.scene_manager.current_scene
+            fps_text = None
             if self.settings.show_fps and self.fps_history:
                 avg_fps = sum(self.fps_history) / len(self.fps_history)
                 font = self.asset_manager.fonts['hud']
-                fps_text = font.render(f"FPS: {int(avg_fps)}", True, NEON_GREEN)
-                virtual_surface.blit(fps_text, (VIRTUAL_WIDTH - 120, 10))
+                fps_label = f"FPS: {int(avg_fps)}"
+                if self.resolution_manager.render_scale != 1.0:
+                    fps_label += f" @{int(self.resolution_manager.render_scale * 100)}%"
+                fps_text = TextCache().render(font, fps_label, True, NEON_GREEN)
+                fps_rect = fps_text.get_rect(topleft=(VIRTUAL_WIDTH - max(120, fps_text.get_width() + 20), 10))
+                if fps_rect != self.fps_rect or fps_text is not self.fps_text:
+                    # Retained scenes repaint under the old label before the new one goes on top
+                    scene.mark_dirty(fps_rect)
+                    if self.fps_rect:
+                        scene.mark_dirty(self.fps_rect)
+                    self.fps_rect, self.fps_text = fps_rect, fps_text
+            if self.profiler.enabled:
+                scene.mark_dirty() # The overlay covers whatever it drew last frame
+            
+            virtual_surface = self.step(dt, events)
+            dirty = self.dirty_rects
+            
+            # Draw FPS if enabled (only when its area was repainted, so the label never blends onto itself)
+            if fps_text and (dirty is None or self.fps_rect.collidelist(dirty) != -1):
+                virtual_surface.blit(fps_text, self.fps_rect)
+            
+            if self.profiler.enabled:
+                self.profiler.draw_overlay(virtual_surface, self.asset_manager.fonts['hud'])
             
-            # Present to actual screen with scaling
-            self.resolution_manager.present(self.screen)
-            pygame.display.flip()
+            # Present to actual screen with scaling, only the changed rects for retained scenes
+            with self.profiler.scope("present"):
+                if dirty is None or dirty:
+                    updated = self.resolution_manager.present(self.screen, dirty)
+                    if updated is None:
+                        pygame.display.flip()
+                    else:
+                        pygame.display.update(updated)
+            self.profiler.end_frame()
             
+            # Static scene and no input for a while: drop to the idle frame cap
+            scene = self.scene_manager.current_scene
+            self.idle = (scene is not None and scene.retained and not self.profiler.enabled
+                         and now - self.last_input >= IDLE_DELAY_MS)
+            if self.idle and self.input_manager.mode == "live":
+                # Spare frame time: pre-build a scene the player is likely to open next
+                # (never while recording or replaying: it runs on wall-clock timing)
+                self.scene_manager.warm_up()
+            
+        self.input_manager.stop()
+        if self.profiler.tracing:
+            self.toggle_trace()
+        GameState().close()
         self.settings.save()
         pygame.quit()
         sys.exit()
+
+    def run_headless(self, max_frames=None, max_seconds=None, dt=1.0 / FPS):
+        """Step scenes with a fixed timestep as fast as possible, without presenting.
+
+        Stops after max_frames simulated frames, max_seconds of wall-clock time,
+        at the end of a replay, or when a scene quits the game. Returns throughput stats.
+        """
+        if max_frames is None and max_seconds is None and self.input_manager.mode != "replay":
+            raise ValueError("run_headless needs a frame budget or a wall-clock budget")
+        
+        frames = 0
+        simulated = 0.0
+        start = time.perf_counter()
+        deadline = start + max_seconds if max_seconds is not None else None
+        while self.scene_manager.running:
+            if max_frames is not None and frames >= max_frames:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            pygame.event.pump()
+            frame_dt, events = self.input_manager.begin_frame(dt, [])
+            if self.input_manager.replay_finished:
+                break
+            self.frame_time = frame_dt
+            self.profiler.begin_frame()
+            frame_start = time.perf_counter()
+            self.step(frame_dt, events)
+            self.dynamic_resolution.update((time.perf_counter() - frame_start) * 1000)
+            self.profiler.end_frame()
+            frames += 1
+            simulated += frame_dt
+        
+        elapsed = time.perf_counter() - start
+        self.input_manager.stop()
+        GameState().flush()
+        return {
+            "frames": frames,
+            "elapsed": elapsed,
+            "simulated_seconds": simulated,
+            "fps": frames / elapsed if elapsed > 0 else 0.0
+        }
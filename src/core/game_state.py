@@ -1,26 +1,131 @@
+import atexit
 import json
 import os
+import sqlite3
+import threading
 
-SAVE_FILE = "save_data.json"
+SAVE_DB = "save_data.db"
+SAVE_FILE = "save_data.json" # Pre-SQLite save, imported into SAVE_DB on first launch
+FLUSH_INTERVAL = 2.0 # Seconds between write-behind flushes
+
+def record_key(path):
+    # Escaped so a "/" inside a key is not read back as nesting
+    return "/".join(part.replace("%", "%25").replace("/", "%2F") for part in path)
+
+def key_part(text):
+    """One path component of a stored key, unescaped"""
+    return text.replace("%2F", "/").replace("%25", "%") if "%" in text else text
+
+def flatten(value, path, records):
+    """Append the (key, JSON) records storing value at path: one per dict entry, recursively"""
+    if isinstance(value, dict) and (value or not path):
+        for key, item in value.items():
+            flatten(item, path + (str(key),), records)
+    else:
+        records.append((record_key(path), json.dumps(value)))
+    return records
+
+# lookup result for a path that no longer exists (None is a stored value)
+MISSING = object()
+
+def lookup(data, path):
+    """Value at path in nested dicts, or MISSING"""
+    for part in path:
+        if not isinstance(data, dict) or part not in data:
+            return MISSING
+        data = data[part]
+    return data
 
 class GameState:
+    """Persistent player progress with write-behind saving.
+
+    The state lives in SQLite, one row per leaf of the nested ``data``
+    dict keyed by its path ("level_difficulties/3"). Mutations name the
+    paths they changed; a background thread rewrites just those rows every
+    ``flush_interval`` seconds in one transaction, so gameplay never
+    blocks on disk and a crash leaves the last committed flush. ``flush``
+    forces a synchronous write.
+    """
     _instance = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(GameState, cls).__new__(cls)
+            cls._instance.persistent = True # False during replays so they never touch the save file
+            cls._instance.flush_interval = FLUSH_INTERVAL
+            cls._instance.lock = threading.RLock()
+            # Held for a whole flush, snapshot through commit, so flushes
+            # commit in the order they snapshot; taken before lock
+            cls._instance.db_lock = threading.Lock()
+            # Paths changed since the last flush; () is the whole state
+            cls._instance.dirty_paths = set()
+            cls._instance.wake = threading.Event()
+            cls._instance.writer = None
+            cls._instance.db = None
             cls._instance.load_data()
+            cls._instance.start_writer()
         return cls._instance
     
     def load_data(self):
-        if os.path.exists(SAVE_FILE):
-            try:
-                with open(SAVE_FILE, 'r') as f:
-                    self.data = json.load(f)
-            except:
-                self.create_default_data()
-        else:
+        try:
+            self.db = self.open_store()
+            self.data = self.read_store()
+        except sqlite3.Error:
+            self.db = None
+            self.data = {}
+        if self.data:
+            return
+        legacy = self.read_legacy_save()
+        if legacy is None:
             self.create_default_data()
+            return
+        self.data = legacy
+        self.save_data()
+        self.flush()
+        if not self.dirty:
+            # Imported and committed: the JSON file is no longer the live save
+            try:
+                os.replace(SAVE_FILE, SAVE_FILE + ".imported")
+            except OSError:
+                pass
+
+    def open_store(self):
+        db = sqlite3.connect(SAVE_DB, check_same_thread=False, isolation_level=None)
+        # WAL: a flush appends its pages and commits atomically, and SQLite
+        # folds the log back into the database (checkpoints) on its own
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID")
+        return db
+
+    def read_store(self):
+        """Rebuild the nested data dict from the stored rows"""
+        data = {}
+        with self.db_lock:
+            rows = self.db.execute("SELECT key, value FROM state ORDER BY key").fetchall()
+        # One decode for every value instead of a json.loads per row
+        values = json.loads("[" + ",".join(value for _, value in rows) + "]")
+        # Sorted keys keep siblings together: walk down to each parent once
+        parent_key, node = "", data
+        for (key, _), value in zip(rows, values):
+            parent, _, leaf = key.rpartition("/")
+            if parent != parent_key:
+                parent_key, node = parent, data
+                for part in parent.split("/") if parent else ():
+                    node = node.setdefault(key_part(part), {})
+            node[key_part(leaf)] = value
+        return data
+
+    def read_legacy_save(self):
+        """The state from an existing save_data.json, or None"""
+        if not os.path.exists(SAVE_FILE):
+            return None
+        try:
+            with open(SAVE_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and data else None
             
     def create_default_data(self):
         self.data = {
@@ -41,17 +146,19 @@ class GameState:
         self.save_data()
         
     def add_coins(self, amount):
-        self.data["coins"] = self.data.get("coins", 0) + amount
-        self.save_data()
+        with self.lock:
+            self.data["coins"] = self.data.get("coins", 0) + amount
+            self.save_data("coins")
         
     def add_xp(self, amount):
-        self.data["xp"] = self.data.get("xp", 0) + amount
-        # Simple level up logic: Level * 1000 XP needed
-        needed = self.data.get("level", 1) * 1000
-        if self.data["xp"] >= needed:
-            self.data["xp"] -= needed
-            self.data["level"] = self.data.get("level", 1) + 1
-        self.save_data()
+        with self.lock:
+            self.data["xp"] = self.data.get("xp", 0) + amount
+            # Simple level up logic: Level * 1000 XP needed
+            needed = self.data.get("level", 1) * 1000
+            if self.data["xp"] >= needed:
+                self.data["xp"] -= needed
+                self.data["level"] = self.data.get("level", 1) + 1
+            self.save_data("xp", "level")
         
     def get_player_stats(self):
         lvl = self.data.get("level", 1)
@@ -60,9 +167,95 @@ class GameState:
             "health_bonus": (lvl - 1) * 10
         }
 
-    def save_data(self):
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(self.data, f)
+    def save_data(self, *paths):
+        """Mark changed entries; the writer thread persists them on its next flush
+
+        Each path is a top-level key or a tuple of keys down to the entry
+        that changed. With no paths the whole state is rewritten.
+        """
+        with self.lock:
+            if not paths:
+                self.dirty_paths.add(())
+            for path in paths:
+                self.dirty_paths.add((path,) if isinstance(path, str) else tuple(path))
+
+    @property
+    def dirty(self):
+        return bool(self.dirty_paths)
+
+    def request_flush(self):
+        """Wake the writer now instead of waiting out the interval (e.g. on scene change)"""
+        self.wake.set()
+
+    def flush(self):
+        """Synchronously write the changed entries, if any"""
+        if not self.persistent or self.db is None or not self.dirty_paths:
+            return
+        with self.db_lock:
+            with self.lock:
+                paths, self.dirty_paths = self.dirty_paths, set()
+                if () in paths:
+                    paths = {()}
+                try:
+                    changes = []
+                    for path in paths:
+                        # A removal that emptied its dict rewrites the dict (kept as an empty leaf)
+                        while len(path) > 1 and lookup(self.data, path[:-1]) == {}:
+                            path = path[:-1]
+                        value = lookup(self.data, path)
+                        changes.append((path, [] if value is MISSING else flatten(value, path, [])))
+                except (RuntimeError, TypeError, ValueError):
+                    # Mutated mid-serialization from outside the lock; retry next flush
+                    self.dirty_paths |= paths
+                    return
+            try:
+                self.write_records(changes)
+            except sqlite3.Error:
+                with self.lock:
+                    self.dirty_paths |= paths
+
+    def write_records(self, changes):
+        """Replace the rows under each changed path in one transaction"""
+        db = self.db
+        db.execute("BEGIN")
+        try:
+            for path, records in changes:
+                if not path:
+                    db.execute("DELETE FROM state")
+                else:
+                    key = record_key(path)
+                    # The entry itself and everything under it ('0' sorts right after '/')
+                    db.execute("DELETE FROM state WHERE key = ? OR (key >= ? AND key < ?)", (key, key + "/", key + "0"))
+                    # Ancestors stored as empty-dict leaves now have children
+                    db.executemany("DELETE FROM state WHERE key = ?",
+                                   [(record_key(path[:i]),) for i in range(1, len(path))])
+                db.executemany("INSERT INTO state VALUES (?, ?)", records)
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+
+    def start_writer(self):
+        if self.writer is not None:
+            return
+        self.writer = threading.Thread(target=self._writer_loop, name="GameStateWriter", daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    def _writer_loop(self):
+        while self.writer is not None:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the writer thread and write any pending changes"""
+        writer = self.writer
+        self.writer = None
+        if writer is not None:
+            self.wake.set()
+            writer.join()
+        self.flush()
             
     def is_level_unlocked(self, level):
         return level <= self.data["unlocked_level"]
@@ -81,27 +274,29 @@ class GameState:
         return difficulty in self.data["level_difficulties"][str(level)]
         
     def complete_level(self, level, difficulty):
-        # Unlock next difficulty for this level
-        diff_order = ["easy", "medium", "hard", "extreme"]
-        try:
-            idx = diff_order.index(difficulty)
-            if idx < len(diff_order) - 1:
-                next_diff = diff_order[idx + 1]
-                if str(level) not in self.data["level_difficulties"]:
-                    self.data["level_difficulties"][str(level)] = []
-                if next_diff not in self.data["level_difficulties"][str(level)]:
-                    self.data["level_difficulties"][str(level)].append(next_diff)
-        except ValueError:
-            pass
+        with self.lock:
+            # Unlock next difficulty for this level
+            diff_order = ["easy", "medium", "hard", "extreme"]
+            try:
+                idx = diff_order.index(difficulty)
+                if idx < len(diff_order) - 1:
+                    next_diff = diff_order[idx + 1]
+                    if str(level) not in self.data["level_difficulties"]:
+                        self.data["level_difficulties"][str(level)] = []
+                    if next_diff not in self.data["level_difficulties"][str(level)]:
+                        self.data["level_difficulties"][str(level)].append(next_diff)
+            except ValueError:
+                pass
             
-        # Unlock next level (easy) if we beat any difficulty of current level? 
-        # Or maybe require beating at least Easy to unlock next level?
-        # Let's say beating Easy unlocks next level Easy.
-        if difficulty == "easy":
-            if level == self.data["unlocked_level"]:
-                self.data["unlocked_level"] += 1
-                next_level_str = str(level + 1)
-                if next_level_str not in self.data["level_difficulties"]:
-                    self.data["level_difficulties"][next_level_str] = ["easy"]
+            # Unlock next level (easy) if we beat any difficulty of current level? 
+            # Or maybe require beating at least Easy to unlock next level?
+            # Let's say beating Easy unlocks next level Easy.
+            if difficulty == "easy":
+                if level == self.data["unlocked_level"]:
+                    self.data["unlocked_level"] += 1
+                    next_level_str = str(level + 1)
+                    if next_level_str not in self.data["level_difficulties"]:
+                        self.data["level_difficulties"][next_level_str] = ["easy"]
                     
-        self.save_data()
+            self.save_data("unlocked_level", ("level_difficulties", str(level)),
+                           ("level_difficulties", str(level + 1)))
@@ -0,0 +1,189 @@
+import json
+import struct
+import zlib
+import pygame
+
+# Keys gameplay code is allowed to poll. Anything else reads as released so a
+# recording always captures everything the game could have looked at.
+WATCHED_KEYS = [
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+    pygame.K_SPACE, pygame.K_z, pygame.K_RETURN, pygame.K_ESCAPE
+]
+KEY_BITS = {key: bit for bit, key in enumerate(WATCHED_KEYS)}
+
+RECORDING_MAGIC = b"SSSREC1\n"
+
+# Recorded event types and their compact codes
+EVENT_CODES = {
+    pygame.KEYDOWN: 1,
+    pygame.KEYUP: 2,
+    pygame.MOUSEBUTTONDOWN: 3,
+    pygame.MOUSEBUTTONUP: 4,
+    pygame.MOUSEMOTION: 5,
+    pygame.QUIT: 6
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+FRAME_FORMAT = struct.Struct("<dHBhhH")  # dt, key mask, mouse buttons, mouse x, mouse y, event count
+KEY_EVENT = struct.Struct("<i")
+BUTTON_EVENT = struct.Struct("<Bhh")
+MOTION_EVENT = struct.Struct("<hh")
+
+
+class KeyState:
+    """Snapshot of the watched keys, indexable like pygame.key.get_pressed()"""
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        bit = KEY_BITS.get(key)
+        return bit is not None and bool(self.mask >> bit & 1)
+
+    @classmethod
+    def from_pygame(cls, pressed):
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if pressed[key]:
+                mask |= 1 << bit
+        return cls(mask)
+
+
+class InputManager:
+    """Per-frame input source with session recording and frame-exact replay.
+
+    Gameplay polls keys and mouse through here rather than pygame directly.
+    In live mode that is a thin wrapper; while recording every frame's dt,
+    input state and events are captured; in replay they are fed back instead
+    of the real devices.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(InputManager, cls).__new__(cls)
+            cls._instance.initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.initialized:
+            return
+        self.mode = "live"  # live, record, replay
+        self.keys = KeyState()
+        self.mouse_buttons = 0
+        self.mouse_position = (0, 0)
+        self.header = {}
+        self.frames = []
+        self.frame_index = 0
+        self.replay_finished = False
+        self.record_path = None
+        self.initialized = True
+
+    def get_pressed(self):
+        """Current key state (only WATCHED_KEYS are tracked)"""
+        return self.keys
+
+    def get_mouse_pressed(self):
+        return tuple(bool(self.mouse_buttons >> i & 1) for i in range(3))
+
+    def get_mouse_pos(self):
+        return self.mouse_position
+
+    def begin_frame(self, dt, events):
+        """Latch this frame's input. Returns the (dt, events) the frame should use."""
+        if self.mode == "replay":
+            if self.frame_index >= len(self.frames):
+                self.replay_finished = True
+                return dt, events
+            dt, self.keys, self.mouse_buttons, self.mouse_position, recorded = self.frames[self.frame_index]
+            self.frame_index += 1
+            # Let the real window still be closed mid-replay
+            return dt, recorded + [e for e in events if e.type == pygame.QUIT]
+
+        self.keys = KeyState.from_pygame(pygame.key.get_pressed())
+        buttons = pygame.mouse.get_pressed()
+        self.mouse_buttons = sum(1 << i for i in range(3) if buttons[i])
+        self.mouse_position = pygame.mouse.get_pos()
+
+        if self.mode == "record":
+            recorded = [e for e in events if e.type in EVENT_CODES]
+            self.frames.append((dt, self.keys, self.mouse_buttons, self.mouse_position, recorded))
+        return dt, events
+
+    def start_recording(self, path, header):
+        """Capture every following frame; header describes how the session started"""
+        self.mode = "record"
+        self.record_path = path
+        self.header = header
+        self.frames = []
+
+    def start_replay(self, path):
+        """Load a recording and feed it back from the next frame on. Returns its header."""
+        self.header, self.frames = self.load(path)
+        self.mode = "replay"
+        self.frame_index = 0
+        self.replay_finished = False
+        return self.header
+
+    def stop(self):
+        """Return to live input, writing out any in-progress recording"""
+        if self.mode == "record" and self.record_path:
+            self.save(self.record_path)
+        self.mode = "live"
+        self.record_path = None
+
+    def save(self, path):
+        body = bytearray()
+        for dt, keys, buttons, (mx, my), events in self.frames:
+            body += FRAME_FORMAT.pack(dt, keys.mask, buttons, mx, my, len(events))
+            for event in events:
+                code = EVENT_CODES[event.type]
+                body.append(code)
+                if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                    body += KEY_EVENT.pack(event.key)
+                elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    body += BUTTON_EVENT.pack(event.button, *event.pos)
+                elif event.type == pygame.MOUSEMOTION:
+                    body += MOTION_EVENT.pack(*event.pos)
+
+        header = dict(self.header, frames=len(self.frames))
+        with open(path, 'wb') as f:
+            f.write(RECORDING_MAGIC)
+            f.write(json.dumps(header).encode('utf-8') + b"\n")
+            f.write(zlib.compress(bytes(body), 9))
+
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            if f.read(len(RECORDING_MAGIC)) != RECORDING_MAGIC:
+                raise ValueError(f"{path} is not an input recording")
+            header = json.loads(f.readline().decode('utf-8'))
+            body = zlib.decompress(f.read())
+
+        frames = []
+        offset = 0
+        while offset < len(body):
+            dt, mask, buttons, mx, my, count = FRAME_FORMAT.unpack_from(body, offset)
+            offset += FRAME_FORMAT.size
+            events = []
+            for _ in range(count):
+                event_type = EVENT_TYPES[body[offset]]
+                offset += 1
+                if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                    (key,) = KEY_EVENT.unpack_from(body, offset)
+                    offset += KEY_EVENT.size
+                    events.append(pygame.event.Event(event_type, key=key))
+                elif event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    button, x, y = BUTTON_EVENT.unpack_from(body, offset)
+                    offset += BUTTON_EVENT.size
+                    events.append(pygame.event.Event(event_type, button=button, pos=(x, y)))
+                elif event_type == pygame.MOUSEMOTION:
+                    x, y = MOTION_EVENT.unpack_from(body, offset)
+                    offset += MOTION_EVENT.size
+                    events.append(pygame.event.Event(event_type, pos=(x, y)))
+                else:
+                    events.append(pygame.event.Event(event_type))
+            frames.append((dt, KeyState(mask), buttons, (mx, my), events))
+        return header, frames
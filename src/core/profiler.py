@@ -0,0 +1,161 @@
+import json
+import time
+from collections import deque
+import pygame
+from src.utils.constants import *
+
+class _NullScope:
+    """Shared do-nothing scope handed out while the profiler is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.begin(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.end()
+        return False
+
+
+class Profiler:
+    """Named-scope frame profiler with a rolling overlay and Chrome-trace export.
+
+    While disabled, ``scope`` returns a shared no-op context manager and
+    ``begin``/``end`` return immediately, so instrumentation can stay in the
+    frame loop permanently.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Profiler, cls).__new__(cls)
+            cls._instance.initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.initialized:
+            return
+        self.enabled = False
+        self.history = deque(maxlen=PROFILER_HISTORY)
+        self.frame_totals = {}
+        self.stack = []
+        self.tracing = False
+        self.trace_events = []
+        self.trace_origin = 0.0
+        self.initialized = True
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.stack.clear()
+        self.frame_totals = {}
+        if not enabled:
+            self.history.clear()
+
+    def scope(self, name):
+        """Context manager timing a named block"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def begin(self, name):
+        if not self.enabled:
+            return
+        self.stack.append((name, time.perf_counter()))
+
+    def end(self):
+        if not self.enabled or not self.stack:
+            return
+        name, start = self.stack.pop()
+        now = time.perf_counter()
+        self.frame_totals[name] = self.frame_totals.get(name, 0.0) + (now - start)
+        if self.tracing and len(self.trace_events) < PROFILER_MAX_TRACE_EVENTS:
+            self.trace_events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.trace_origin) * 1e6,
+                "dur": (now - start) * 1e6,
+                "pid": 0,
+                "tid": 0
+            })
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_totals = {}
+        self.begin("frame")
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        # Close anything left open (e.g. a scene that returned mid-scope)
+        while self.stack:
+            self.end()
+        self.history.append(self.frame_totals)
+
+    def averages(self):
+        """Average milliseconds per frame for each scope over the rolling window"""
+        if not self.history:
+            return {}
+        totals = {}
+        for frame in self.history:
+            for name, seconds in frame.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        count = len(self.history)
+        return {name: seconds * 1000 / count for name, seconds in totals.items()}
+
+    def start_trace(self):
+        """Begin capturing scope events for Chrome's trace viewer"""
+        self.tracing = True
+        self.trace_events = []
+        self.trace_origin = time.perf_counter()
+
+    def stop_trace(self, path):
+        """Write captured events as Chrome-trace JSON (chrome://tracing, Perfetto)"""
+        self.tracing = False
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+        count = len(self.trace_events)
+        self.trace_events = []
+        return count
+
+    def draw_overlay(self, surface, font):
+        """Rolling per-scope breakdown, widest bar = frame budget at target FPS"""
+        averages = self.averages()
+        if not averages:
+            return
+        budget_ms = 1000.0 / FPS
+        x = VIRTUAL_WIDTH - 470
+        y = 50
+        line_h = font.get_linesize()
+        rows = sorted(averages.items(), key=lambda item: item[1], reverse=True)
+
+        panel = pygame.Surface((450, line_h * (len(rows) + 1) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surface.blit(panel, (x - 10, y - 5))
+
+        header = font.render(f"budget {budget_ms:.1f} ms{'  [TRACE]' if self.tracing else ''}", True, WHITE)
+        surface.blit(header, (x, y))
+        for i, (name, ms) in enumerate(rows):
+            row_y = y + line_h * (i + 1)
+            color = RED if ms > budget_ms else NEON_GREEN
+            bar_w = int(min(1.0, ms / budget_ms) * 150)
+            pygame.draw.rect(surface, color, (x + 270, row_y + 6, bar_w, line_h - 12))
+            surface.blit(font.render(name, True, color), (x, row_y))
+            surface.blit(font.render(f"{ms:.2f}", True, color), (x + 190, row_y))
@@ -0,0 +1,72 @@
+from itertools import groupby
+
+class RenderQueue:
+    """Per-frame draw list of (image, position) pairs bucketed by layer.
+
+    Sprite groups and bullet systems queue their images at virtual
+    coordinates; ``submit`` applies the camera/shake offset and render scale
+    to every position in one pass and hands the whole frame, lowest layer
+    first, to a single ``Surface.blits`` call.
+    """
+
+    def __init__(self):
+        # layer -> ([images], [(x, y)]); lists are reused frame to frame
+        self.layers = {}
+
+    def bucket(self, layer):
+        entry = self.layers.get(layer)
+        if entry is None:
+            entry = self.layers[layer] = ([], [])
+        return entry
+
+    def add(self, image, position, layer=0):
+        images, positions = self.bucket(layer)
+        images.append(image)
+        positions.append(position)
+
+    def extend(self, layer, images, positions):
+        """Queue parallel sequences of images and (x, y) positions on one layer"""
+        bucket_images, bucket_positions = self.bucket(layer)
+        bucket_images.extend(images)
+        bucket_positions.extend(positions)
+
+    def add_group(self, group):
+        """Queue every sprite of a group at its rect's top-left, keeping a LayeredUpdates group's layers"""
+        sprites = group.sprites()
+        if not hasattr(group, 'get_layer_of_sprite'):
+            self.extend(0, [sprite.image for sprite in sprites], [sprite.rect.topleft for sprite in sprites])
+            return
+        # LayeredUpdates keeps its sprites sorted by layer: one pass, split into runs
+        for layer, run in groupby(sprites, group.get_layer_of_sprite):
+            run = list(run)
+            self.extend(layer, [sprite.image for sprite in run], [sprite.rect.topleft for sprite in run])
+
+    def __len__(self):
+        return sum(len(images) for images, _ in self.layers.values())
+
+    def submit(self, surface, offset=(0, 0), scale=1.0, image_for=None):
+        """Blit everything queued onto surface in one call and empty the queue
+
+        image_for maps each source image to the one to blit (e.g. a copy
+        pre-scaled for a reduced-resolution world surface).
+        """
+        ox, oy = offset
+        images = []
+        positions = []
+        for layer in sorted(self.layers):
+            layer_images, layer_positions = self.layers[layer]
+            images += layer_images
+            positions += layer_positions
+            layer_images.clear()
+            layer_positions.clear()
+        if not images:
+            return
+        if scale != 1.0:
+            positions = [(int((x + ox) * scale), int((y + oy) * scale)) for x, y in positions]
+        elif ox or oy:
+            positions = [(x + ox, y + oy) for x, y in positions]
+        if image_for is not None:
+            # A frame has few distinct images; map each once, not per sprite
+            mapped = {image: image_for(image) for image in set(images)}
+            images = [mapped[image] for image in images]
+        surface.blits(zip(images, positions), doreturn=False)
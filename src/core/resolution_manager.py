@@ -1,3 +1,5 @@
+import weakref
+from fractions import Fraction
 import pygame
 from src.utils.constants import *
 
@@ -23,6 +25,17 @@ class ResolutionManager:
         self.offset_x = 0
         self.offset_y = 0
         self.virtual_surface = None
+        self.scale_mode = "nearest"  # nearest, smooth, integer
+        self.viewport = pygame.Rect(0, 0, self.virtual_width, self.virtual_height)
+        # Reusable present targets: a subsurface of the screen covering the viewport
+        self.present_screen = None
+        self.present_target = None
+        self.bars_dirty = True
+        # Dynamic resolution: scenes may draw their world layer at a reduced
+        # scale and upscale it into the virtual surface before the UI pass
+        self.render_scale = 1.0
+        self.world_surface = None
+        self.world_images = weakref.WeakKeyDictionary()
         self.initialized = True
     
     def set_resolution(self, width, height):
@@ -36,6 +49,9 @@ class ResolutionManager:
         
         # Use uniform scaling to preserve aspect ratio
         self.scale = min(scale_x, scale_y)
+        if self.scale_mode == "integer" and self.scale >= 1:
+            # Whole-number factor keeps pixels crisp at the cost of wider bars
+            self.scale = float(int(self.scale))
         
         # Calculate scaled dimensions
         scaled_width = int(self.virtual_width * self.scale)
@@ -50,6 +66,20 @@ class ResolutionManager:
         
         self.scale_x = self.scale
         self.scale_y = self.scale
+        self.viewport = pygame.Rect(self.offset_x, self.offset_y, scaled_width, scaled_height)
+        # Exact virtual-to-viewport ratios; partial presents snap to their
+        # denominators so every region scales onto whole screen pixels
+        self.present_ratio = (Fraction(scaled_width, self.virtual_width),
+                              Fraction(scaled_height, self.virtual_height))
+        self.present_screen = None
+        self.bars_dirty = True
+
+    def set_scale_mode(self, mode):
+        """Select nearest, smooth or integer presentation scaling"""
+        if mode not in SCALE_MODES:
+            mode = "nearest"
+        self.scale_mode = mode
+        self.set_resolution(self.screen_width, self.screen_height)
     
     def to_virtual(self, screen_x, screen_y):
         """Convert screen coordinates to virtual coordinates"""
@@ -71,13 +101,92 @@ class ResolutionManager:
         """Get the virtual rendering surface"""
         return self.virtual_surface
     
-    def present(self, screen):
-        """Blit the virtual surface to the actual screen with scaling"""
-        if self.virtual_surface:
-            scaled_surf = pygame.transform.scale(
-                self.virtual_surface,
-                (int(self.virtual_width * self.scale), int(self.virtual_height * self.scale))
-            )
-            # Fill letterbox bars
+    def set_render_scale(self, scale):
+        """Set the world-layer render scale (1.0 = full virtual resolution)"""
+        if scale != self.render_scale:
+            self.render_scale = scale
+            self.world_surface = None
+            self.world_images = weakref.WeakKeyDictionary()
+
+    def get_world_surface(self):
+        """Reusable reduced-resolution render target for the current render scale"""
+        if self.render_scale == 1.0:
+            return self.virtual_surface
+        if self.world_surface is None:
+            self.world_surface = pygame.Surface((int(self.virtual_width * self.render_scale),
+                                                 int(self.virtual_height * self.render_scale)))
+        return self.world_surface
+
+    def world_image(self, image):
+        """An image pre-scaled to the current render scale, cached per source surface"""
+        if self.render_scale == 1.0:
+            return image
+        scaled = self.world_images.get(image)
+        if scaled is None:
+            w, h = image.get_size()
+            scaled = pygame.transform.scale(image, (max(1, round(w * self.render_scale)),
+                                                    max(1, round(h * self.render_scale))))
+            self.world_images[image] = scaled
+        return scaled
+
+    def present(self, screen, rects=None):
+        """Scale the virtual surface straight into the screen's viewport.
+
+        With rects (dirty regions in virtual coordinates) only those areas are
+        scaled and the screen rects they cover are returned for
+        pygame.display.update; None means the whole screen was presented.
+        """
+        if not self.virtual_surface:
+            return None
+        if screen is not self.present_screen or self.bars_dirty:
+            # Letterbox bars only need clearing when the screen or viewport changes
             screen.fill(BLACK)
-            screen.blit(scaled_surf, (self.offset_x, self.offset_y))
+            self.present_screen = screen
+            self.present_target = screen.subsurface(self.viewport)
+            self.bars_dirty = False
+            rects = None
+        if self.scale_mode == "smooth" and self.scale > 1:
+            # smoothscale's upscaling filter samples relative to the whole
+            # image, so a sub-region wouldn't line up with its neighbours
+            rects = None
+        
+        if rects is None:
+            if self.viewport.size == self.virtual_surface.get_size():
+                screen.blit(self.virtual_surface, self.viewport.topleft)
+            elif self.scale_mode == "smooth":
+                pygame.transform.smoothscale(self.virtual_surface, self.viewport.size, self.present_target)
+            else:
+                pygame.transform.scale(self.virtual_surface, self.viewport.size, self.present_target)
+            return None
+        
+        updated = []
+        bounds = self.virtual_surface.get_rect()
+        ratio_x, ratio_y = self.present_ratio
+        step_x, step_y = ratio_x.denominator, ratio_y.denominator
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            # Snap outwards to the ratio grid, so the region maps onto the
+            # same screen pixels a full present would give it
+            left = rect.left // step_x * step_x
+            top = rect.top // step_y * step_y
+            right = min(bounds.width, -(-rect.right // step_x) * step_x)
+            bottom = min(bounds.height, -(-rect.bottom // step_y) * step_y)
+            rect = pygame.Rect(left, top, right - left, bottom - top)
+            target = pygame.Rect(int(left * ratio_x), int(top * ratio_y),
+                                 int(right * ratio_x) - int(left * ratio_x),
+                                 int(bottom * ratio_y) - int(top * ratio_y))
+            if target.width <= 0 or target.height <= 0:
+                continue
+            if self.viewport.size == bounds.size:
+                screen.blit(self.virtual_surface, target.move(self.viewport.topleft), rect)
+            else:
+                source = self.virtual_surface.subsurface(rect)
+                dest = self.present_target.subsurface(target)
+                if self.scale_mode == "smooth":
+                    pygame.transform.smoothscale(source, target.size, dest)
+                else:
+                    pygame.transform.scale(source, target.size, dest)
+            updated.append(target.move(self.viewport.topleft))
+        return updated
@@ -0,0 +1,40 @@
+import random
+import numpy as np
+
+class RNG:
+    """Seedable random source shared by gameplay systems.
+
+    Entities, waves and VFX draw from here instead of the global ``random``
+    module, so a seeded run (and an input replay on top of it) is reproducible.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RNG, cls).__new__(cls)
+            cls._instance.python = random.Random()
+            cls._instance.numpy = np.random.default_rng()
+            cls._instance.current_seed = None
+        return cls._instance
+
+    def seed(self, value=None):
+        """Reseed both streams in place; picks a fresh seed if none is given"""
+        if value is None:
+            value = random.SystemRandom().randrange(2 ** 32)
+        self.current_seed = value
+        self.python.seed(value)
+        # Reseed in place so generators already handed out stay in sync
+        self.numpy.bit_generator.state = np.random.PCG64(value).state
+        return value
+
+    def random(self):
+        return self.python.random()
+
+    def uniform(self, a, b):
+        return self.python.uniform(a, b)
+
+    def randint(self, a, b):
+        return self.python.randint(a, b)
+
+    def choice(self, seq):
+        return self.python.choice(seq)
@@ -1,18 +1,107 @@
+from collections import OrderedDict
+from src.core.game_state import GameState
+from src.utils.constants import SCENE_CACHE_SIZE
+
 class SceneManager:
+    """Owns the current scene and an LRU cache of live, previously visited ones.
+
+    Leaving a cacheable scene exits and suspends it into the cache; coming
+    back resumes and re-enters the same instance instead of constructing a
+    new one. During idle frames ``warm_up`` pre-builds the current scene's
+    ``next_scenes`` so the first visit is cheap too.
+    """
     def __init__(self, engine):
         self.engine = engine
         self.scenes = {}
         self.current_scene = None
+        self.current_scene_name = None
+        self.current_scene_args = {}
+        self.previous_scene = None
+        self.previous_scene_name = None
         self.running = True
+        self.retained_surface = None # Surface the current retained scene last drew into
+        self.cache = OrderedDict() # name -> parked scene, least recently used first
+        self.cache_size = SCENE_CACHE_SIZE
+        self.warm_queue = []
+        self.built = 0
+        self.reused = 0
+        self.warmed = 0
+        self.evicted = 0
 
     def add_scene(self, name, scene_class):
         self.scenes[name] = scene_class
 
     def change_scene(self, name, **kwargs):
         if name in self.scenes:
-            self.current_scene = self.scenes[name](self)
-            if hasattr(self.current_scene, 'setup') and kwargs:
-                self.current_scene.setup(**kwargs)
+            GameState().request_flush()
+            # Take the target out first so parking the outgoing scene can't evict it
+            scene = self.cache.pop(name, None)
+            previous = self.current_scene
+            if previous:
+                previous.exit()
+                if name != self.current_scene_name:
+                    self.previous_scene = previous
+                    self.previous_scene_name = self.current_scene_name
+                    self.park(self.current_scene_name, previous)
+                elif previous.cacheable and self.cache_size > 0:
+                    # Re-entering the current scene restarts the same instance
+                    previous.suspend()
+                    scene = previous
+            
+            if scene is not None:
+                scene.resume()
+                self.reused += 1
+            else:
+                scene = self.scenes[name](self)
+                self.built += 1
+            self.current_scene_name = name
+            self.current_scene_args = kwargs
+            self.current_scene = scene
+            self.retained_surface = None
+            scene.enter(**kwargs)
+            self.warm_queue = [n for n in scene.next_scenes if n in self.scenes]
+
+    def park(self, name, scene):
+        """Suspend a scene into the cache, evicting the least recently used beyond cache_size"""
+        if not scene.cacheable or self.cache_size <= 0:
+            return
+        scene.suspend()
+        self.cache[name] = scene
+        self.cache.move_to_end(name)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+            self.evicted += 1
+
+    def warm_up(self):
+        """Pre-build one queued next scene into a free cache slot; True if one was built"""
+        while self.warm_queue:
+            name = self.warm_queue.pop(0)
+            if name in self.cache or name == self.current_scene_name or len(self.cache) >= self.cache_size:
+                continue
+            scene = self.scenes[name](self)
+            if not scene.cacheable:
+                continue
+            # Speculative entries sit at the LRU end, first to go once visited scenes fill the cache
+            self.cache[name] = scene
+            self.cache.move_to_end(name, last=False)
+            self.built += 1
+            self.warmed += 1
+            return True
+        return False
+
+    def clear_cache(self):
+        """Drop every parked scene so the next visits construct fresh ones"""
+        self.cache.clear()
+        self.warm_queue = []
+
+    def stats(self):
+        return {
+            "cached": len(self.cache),
+            "built": self.built,
+            "reused": self.reused,
+            "warmed": self.warmed,
+            "evicted": self.evicted,
+        }
 
     def quit_game(self):
         self.running = False
@@ -26,5 +115,27 @@ class SceneManager:
             self.current_scene.update(dt)
 
     def draw(self, screen):
-        if self.current_scene:
-            self.current_scene.draw(screen)
+        """Draw the current scene; returns the virtual rects it changed, None for all of it"""
+        scene = self.current_scene
+        if not scene:
+            return None
+        if not scene.retained:
+            scene.draw(screen)
+            return None
+        
+        rects = scene.take_dirty()
+        if screen is not self.retained_surface:
+            # New scene or a recreated virtual surface: nothing retained to build on
+            self.retained_surface = screen
+            rects = None
+        if rects is None:
+            scene.draw(screen)
+            return None
+        if not rects:
+            return rects
+        # Redraw the whole scene clipped to the dirty area; draw stays a plain full-frame pass
+        area = rects[0].unionall(rects[1:]).clip(screen.get_rect())
+        screen.set_clip(area)
+        scene.draw(screen)
+        screen.set_clip(None)
+        return rects
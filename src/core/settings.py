@@ -21,6 +21,8 @@ class Settings:
         self.achievements = {}
         self.particle_quality = 'high'  # low, medium, high, ultra
         self.show_fps = False
+        self.scale_mode = 'nearest'  # nearest, smooth, integer
+        self.dynamic_resolution = False
         
         # Try to load from file
         try:
@@ -37,6 +39,8 @@ class Settings:
                     self.achievements = data.get('achievements', {})
                     self.particle_quality = data.get('particle_quality', 'high')
                     self.show_fps = data.get('show_fps', False)
+                    self.scale_mode = data.get('scale_mode', 'nearest')
+                    self.dynamic_resolution = data.get('dynamic_resolution', False)
         except:
             pass
 
@@ -51,7 +55,9 @@ class Settings:
             'high_score': self.high_score,
             'achievements': self.achievements,
             'particle_quality': self.particle_quality,
-            'show_fps': self.show_fps
+            'show_fps': self.show_fps,
+            'scale_mode': self.scale_mode,
+            'dynamic_resolution': self.dynamic_resolution
         }
         try:
             os.makedirs('config', exist_ok=True)
@@ -0,0 +1,103 @@
+import numpy as np
+
+# Effect recipes: synthesizer name plus its parameters. The sound bank
+# cache keys every effect on these, so tweaking one only re-renders that one.
+EFFECTS = {
+    "laser": {"synth": "laser", "duration": 0.16, "start_hz": 1800, "end_hz": 280, "volume": 0.35},
+    "explosion": {"synth": "explosion", "duration": 0.7, "rumble_hz": 55, "smoothing": 24, "volume": 0.6, "seed": 7},
+    "pickup": {"synth": "pickup", "duration": 0.22, "notes_hz": [660, 880, 1320], "volume": 0.4},
+    "boss_alarm": {"synth": "boss_alarm", "duration": 1.2, "low_hz": 520, "high_hz": 820, "rate_hz": 2.5, "volume": 0.45},
+}
+
+
+def timeline(duration, sample_rate):
+    """Sample times in seconds"""
+    return np.arange(int(sample_rate * duration)) / sample_rate
+
+
+def envelope(n, sample_rate, attack=0.005, release=0.05):
+    """Linear attack and release ramps around a flat sustain, so effects never click"""
+    env = np.ones(n)
+    a = min(n, int(sample_rate * attack))
+    r = min(n - a, int(sample_rate * release))
+    if a:
+        env[:a] = np.linspace(0.0, 1.0, a, endpoint=False)
+    if r:
+        env[n - r:] = np.linspace(1.0, 0.0, r)
+    return env
+
+
+def sweep_phase(freq, sample_rate):
+    """Phase of an oscillator whose frequency changes every sample"""
+    return 2 * np.pi * np.cumsum(freq) / sample_rate
+
+
+def tone(frequency, duration, sample_rate, volume=0.3):
+    """Plain sine tone"""
+    t = timeline(duration, sample_rate)
+    return volume * np.sin(2 * np.pi * frequency * t) * envelope(t.size, sample_rate)
+
+
+def laser(sample_rate, duration, start_hz, end_hz, volume):
+    """Exponential downward chirp, square-ish for bite"""
+    t = timeline(duration, sample_rate)
+    freq = start_hz * (end_hz / start_hz) ** (t / duration)
+    wave = np.tanh(3 * np.sin(sweep_phase(freq, sample_rate)))
+    decay = np.exp(-4 * t / duration)
+    return volume * wave * decay * envelope(t.size, sample_rate, release=0.02)
+
+
+def explosion(sample_rate, duration, rumble_hz, smoothing, volume, seed):
+    """Low-passed noise burst over a sinking rumble"""
+    t = timeline(duration, sample_rate)
+    noise = np.random.default_rng(seed).uniform(-1, 1, t.size)
+    # Moving average as a cheap low-pass
+    kernel = np.ones(smoothing) / smoothing
+    noise = np.convolve(noise, kernel, mode="same")
+    noise /= np.abs(noise).max() or 1.0
+    rumble = np.sin(sweep_phase(rumble_hz * (1 - 0.5 * t / duration), sample_rate))
+    decay = np.exp(-5 * t / duration)
+    return volume * (0.75 * noise + 0.25 * rumble) * decay * envelope(t.size, sample_rate, release=0.1)
+
+
+def pickup(sample_rate, duration, notes_hz, volume):
+    """Rising arpeggio of triangle-wave notes"""
+    t = timeline(duration, sample_rate)
+    step = np.minimum((t / duration * len(notes_hz)).astype(int), len(notes_hz) - 1)
+    freq = np.asarray(notes_hz, dtype=np.float64)[step]
+    phase = sweep_phase(freq, sample_rate) / (2 * np.pi)
+    wave = 4 * np.abs(phase - np.floor(phase + 0.5)) - 1
+    return volume * wave * envelope(t.size, sample_rate, release=0.04)
+
+
+def boss_alarm(sample_rate, duration, low_hz, high_hz, rate_hz, volume):
+    """Two-tone siren swept by a slow LFO"""
+    t = timeline(duration, sample_rate)
+    lfo = 0.5 * (1 - np.cos(2 * np.pi * rate_hz * t))
+    freq = low_hz + (high_hz - low_hz) * lfo
+    wave = np.tanh(2 * np.sin(sweep_phase(freq, sample_rate)))
+    return volume * wave * envelope(t.size, sample_rate, attack=0.03, release=0.15)
+
+
+SYNTHS = {"laser": laser, "explosion": explosion, "pickup": pickup, "boss_alarm": boss_alarm}
+
+
+def render(params, sample_rate):
+    """Mono float samples in [-1, 1] for an effect recipe"""
+    args = {k: v for k, v in params.items() if k != "synth"}
+    return SYNTHS[params["synth"]](sample_rate, **args)
+
+
+def to_mixer(samples, size, channels):
+    """Convert float samples to the mixer's sample format, one column per channel"""
+    samples = np.clip(samples, -1.0, 1.0)
+    if size == 32:
+        pcm = samples.astype(np.float32)
+    else:
+        bits = abs(size)
+        peak = 2 ** (bits - 1) - 1
+        pcm = samples * peak if size < 0 else samples * peak + peak + 1
+        pcm = pcm.astype(f"{'i' if size < 0 else 'u'}{bits // 8}")
+    if channels == 1:
+        return pcm
+    return np.ascontiguousarray(np.repeat(pcm[:, None], channels, axis=1))
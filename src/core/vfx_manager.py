@@ -1,9 +1,84 @@
 import random
+import numpy as np
 import pygame
 from src.utils.constants import *
+from src.core.rng import RNG
 
 class ParticlePool:
-    """Object pool for efficient particle management"""
+    """Structure-of-arrays particle pool backed by fixed-capacity NumPy buffers.
+
+    Live particles are packed into the first ``count`` slots of each array so
+    update and culling run as whole-array operations instead of per-dict work.
+    """
+    def __init__(self, max_particles=PARTICLE_POOL_SIZE):
+        self.max_particles = max_particles
+        self.count = 0
+        self.pos = np.zeros((max_particles, 2), dtype=np.float32)
+        self.vel = np.zeros((max_particles, 2), dtype=np.float32)
+        self.life = np.zeros(max_particles, dtype=np.float32)
+        self.max_life = np.ones(max_particles, dtype=np.float32)
+        self.size = np.zeros(max_particles, dtype=np.float32)
+        # RGBA; RGB colors are stored opaque and keep full alpha while fading
+        self.color = np.zeros((max_particles, 4), dtype=np.float32)
+        self.fade_alpha = np.zeros(max_particles, dtype=bool)
+        self.rng = RNG().numpy
+
+    def emit(self, x, y, color, count=10, velocity_range=(-3, 3), life_range=(20, 40), size_range=(2, 5)):
+        """Emit particles at a position"""
+        count = min(count, self.max_particles - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        rng = self.rng
+        self.pos[start:end] = (x, y)
+        self.vel[start:end] = rng.uniform(velocity_range[0], velocity_range[1], (count, 2))
+        self.life[start:end] = rng.integers(life_range[0], life_range[1] + 1, count)
+        self.max_life[start:end] = rng.integers(life_range[0], life_range[1] + 1, count)
+        self.size[start:end] = rng.uniform(size_range[0], size_range[1], count)
+        self.color[start:end] = (*color[:3], color[3] if len(color) > 3 else 255)
+        self.fade_alpha[start:end] = len(color) > 3
+        self.count = end
+
+    def update(self, dt):
+        """Update all active particles and compact out the dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.life[:n] -= 1
+        np.maximum(self.size[:n] - 0.05, 0, out=self.size[:n])
+
+        alive = self.life[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for arr in (self.pos, self.vel, self.life, self.max_life, self.size, self.color, self.fade_alpha):
+                arr[:live] = arr[:n][alive]
+        self.count = live
+
+    def draw(self, surface, scale=1.0):
+        """Render all particles (scale maps virtual coordinates onto a reduced-resolution surface)"""
+        n = self.count
+        if n == 0:
+            return
+        alpha = np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+        faded = self.color[:n] * alpha[:, None]
+        # Like the list pool: an RGBA color fades its alpha too, an RGB one stays opaque
+        faded[:, 3] = np.where(self.fade_alpha[:n], faded[:, 3], 255)
+        colors = np.clip(faded, 0, 255).astype(np.int32).tolist()
+        sizes = np.maximum((self.size[:n] * scale).astype(np.int32), 1).tolist()
+        points = (self.pos[:n] * scale).astype(np.int32).tolist()
+
+        draw_circle = pygame.draw.circle
+        for color, point, size in zip(colors, points, sizes):
+            draw_circle(surface, color, point, size)
+
+    def clear(self):
+        """Clear all particles"""
+        self.count = 0
+
+
+class ListParticlePool:
+    """Reference list-of-dicts particle pool (kept for benchmarking)"""
     def __init__(self, max_particles=PARTICLE_POOL_SIZE):
         self.particles = []
         self.max_particles = max_particles
@@ -102,3 +177,89 @@ class TrailEffect:
     def clear(self):
         """Clear the trail"""
         self.positions.clear()
+
+
+class Starfield:
+    """Parallax starfield pre-rendered into scrolling layer tiles.
+
+    Each layer is one screen-sized, RLE colorkeyed tile drawn once per theme
+    and shared between scenes; a frame is a fill plus two wrapped blits per
+    layer, so the cost stays flat however many stars the layers hold.
+    """
+    _tiles = {}
+    _backdrops = {}
+
+    def __init__(self, bg_color, star_color=None, layers=STARFIELD_LAYERS, speed_scale=1.0, seed=0):
+        self.bg_color = bg_color
+        self.speeds = [layer[0] * speed_scale for layer in layers]
+        self.offsets = [0.0] * len(layers)
+        key = (star_color, tuple(layers), seed)
+        tiles = Starfield._tiles.get(key)
+        if tiles is None:
+            tiles = self._render_layers(star_color, layers, seed)
+            Starfield._tiles[key] = tiles
+        self.tiles = tiles
+        self.scaled = {1.0: tiles}
+
+    @staticmethod
+    def _render_layers(star_color, layers, seed):
+        rng = random.Random(seed)
+        tiles = []
+        for _, count, radius, brightness in layers:
+            tile = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+            tile.fill(STARFIELD_COLORKEY)
+            for _ in range(count):
+                if star_color is None:
+                    # Grey stars of varying brightness
+                    level = rng.randint(100, 255)
+                    color = (level, level, level)
+                else:
+                    color = star_color
+                color = tuple(max(1, int(c * brightness)) for c in color[:3])
+                # Keep stars clear of the wrap seam
+                pos = (rng.randint(0, VIRTUAL_WIDTH), rng.randint(radius, VIRTUAL_HEIGHT - radius))
+                pygame.draw.circle(tile, color, pos, radius)
+            tile.set_colorkey(STARFIELD_COLORKEY, pygame.RLEACCEL)
+            tiles.append(tile)
+        return tiles
+
+    @classmethod
+    def backdrop(cls, bg_color, star_color, count=100, radius_range=(1, 2), seed=42):
+        """A static, cached background with stars baked in (one opaque blit per frame)"""
+        key = (bg_color, star_color, count, radius_range, seed)
+        surface = cls._backdrops.get(key)
+        if surface is None:
+            rng = random.Random(seed)
+            surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+            surface.fill(bg_color)
+            for _ in range(count):
+                pos = (rng.randint(0, VIRTUAL_WIDTH), rng.randint(0, VIRTUAL_HEIGHT))
+                pygame.draw.circle(surface, star_color, pos, rng.randint(*radius_range))
+            cls._backdrops[key] = surface
+        return surface
+
+    def _tiles_at(self, scale):
+        tiles = self.scaled.get(scale)
+        if tiles is None:
+            size = (max(1, round(VIRTUAL_WIDTH * scale)), max(1, round(VIRTUAL_HEIGHT * scale)))
+            tiles = []
+            for tile in self.tiles:
+                scaled = pygame.transform.scale(tile, size)
+                scaled.set_colorkey(STARFIELD_COLORKEY, pygame.RLEACCEL)
+                tiles.append(scaled)
+            self.scaled[scale] = tiles
+        return tiles
+
+    def update(self, dt):
+        """Scroll every layer at its own speed"""
+        for i, speed in enumerate(self.speeds):
+            self.offsets[i] = (self.offsets[i] + speed * dt) % VIRTUAL_HEIGHT
+
+    def draw(self, surface, scale=1.0):
+        """Fill the background and blit the layers, far to near"""
+        surface.fill(self.bg_color)
+        for tile, offset in zip(self._tiles_at(scale), self.offsets):
+            height = tile.get_height()
+            y = int(offset * scale)
+            surface.blit(tile, (0, y))
+            surface.blit(tile, (0, y - height))
@@ -1,15 +1,20 @@
 import pygame
-import random
 from src.entities.enemy import Enemy
 from src.utils.constants import *
+from src.core.level_manager import LevelManager
+from src.core.wave_schedule import compile_level, WAVE_COOLDOWN
 
 class WaveManager:
-    def __init__(self, game_scene):
+    """Plays back a level's spawn timeline, compiled once from its config"""
+    def __init__(self, game_scene, config=None):
         self.game_scene = game_scene
+        if config is None:
+            config = LevelManager().get_level_config(1, "easy")
+        self.timeline = compile_level(config, Enemy.SPEED_RANGES)
         self.wave = 1
-        self.enemies_spawned = 0
-        self.enemies_to_spawn = 10
-        self.spawn_timer = 0
+        self.events = self.timeline[0]
+        self.cursor = 0
+        self.wave_time = 0
         self.wave_in_progress = True
         self.wave_cooldown = 0
 
@@ -20,30 +25,29 @@ class WaveManager:
                 self.start_next_wave()
             return
 
-        self.spawn_timer += dt * 1000
-        if self.spawn_timer >= ENEMY_SPAWN_RATE / (1 + (self.wave * 0.1)): # Spawn faster each wave
-            self.spawn_timer = 0
-            if self.enemies_spawned < self.enemies_to_spawn:
-                self.spawn_enemy()
-            elif len(self.game_scene.enemies) == 0:
-                self.wave_complete()
+        self.wave_time += dt
+        events = self.events
+        # Only the events that are due this frame are touched
+        while self.cursor < len(events) and events[self.cursor][0] <= self.wave_time:
+            self.spawn_enemy(events[self.cursor])
+            self.cursor += 1
+        if self.cursor == len(events) and len(self.game_scene.enemies) == 0:
+            self.wave_complete()
 
-    def spawn_enemy(self):
-        # Difficulty scaling
-        fast_chance = min(0.1 * self.wave, 0.8)
-        enemy_type = 'fast' if random.random() < fast_chance else 'basic'
-        
-        Enemy([self.game_scene.all_sprites, self.game_scene.enemies], enemy_type)
-        self.enemies_spawned += 1
+    def spawn_enemy(self, event):
+        time, enemy_type, x, y, vx, vy = event
+        Enemy.spawn([self.game_scene.all_sprites, self.game_scene.enemies], enemy_type, (x, y), (vx, vy))
 
     def wave_complete(self):
         self.wave_in_progress = False
-        self.wave_cooldown = 3.0 # 3 seconds between waves
+        self.wave_cooldown = WAVE_COOLDOWN
         print(f"Wave {self.wave} Complete!")
 
     def start_next_wave(self):
         self.wave += 1
-        self.enemies_spawned = 0
-        self.enemies_to_spawn = int(10 * (1.2 ** (self.wave - 1)))
+        # Past the level's last scheduled wave, its final wave repeats until the boss shows up
+        self.events = self.timeline[min(self.wave, len(self.timeline)) - 1]
+        self.cursor = 0
+        self.wave_time = 0
         self.wave_in_progress = True
         print(f"Starting Wave {self.wave}")
@@ -0,0 +1,71 @@
+from src.core.rng import RNG
+from src.utils.constants import *
+
+# Formations: member offsets (px) from the group anchor; negative dy
+# trails behind the leader, off the top of the screen
+FORMATIONS = {
+    "single": [(0, 0)],
+    "pair": [(-45, 0), (45, 0)],
+    "line": [(-180, 0), (-90, 0), (0, 0), (90, 0), (180, 0)],
+    "column": [(0, 0), (0, -70), (0, -140), (0, -210)],
+    "v": [(0, 0), (-60, -55), (60, -55), (-120, -110), (120, -110)],
+    "swarm": [(-70, -20), (0, 0), (70, -25), (-40, -80), (35, -90), (0, -150)],
+}
+
+# Wave n uses WAVE_DEFINITIONS[n - 1] (the last one repeats): formations are
+# cycled in order until the wave's enemy budget is spent, one group every
+# `interval` x the level's spawn_rate seconds; `mix` weights each group's type
+WAVE_DEFINITIONS = [
+    {"formations": ["single", "single", "pair"], "mix": {"basic": 0.9, "fast": 0.1}, "interval": 0.6},
+    {"formations": ["pair", "single", "line"], "mix": {"basic": 0.8, "fast": 0.2}, "interval": 0.8},
+    {"formations": ["column", "pair", "v"], "mix": {"basic": 0.7, "fast": 0.3}, "interval": 1.0},
+    {"formations": ["v", "line", "single", "single"], "mix": {"basic": 0.6, "fast": 0.4}, "interval": 1.0},
+    {"formations": ["swarm", "column", "v", "pair"], "mix": {"basic": 0.5, "fast": 0.5}, "interval": 1.2},
+    {"formations": ["swarm", "line", "v", "swarm"], "mix": {"basic": 0.3, "fast": 0.7}, "interval": 1.3},
+]
+WAVE_GROWTH = 1.2  # each wave is this much bigger than the one before
+WAVE_COOLDOWN = 3.0  # seconds between clearing a wave and starting the next
+
+
+def pick_type(mix, roll):
+    """Enemy type for a roll in [0, 1) against the mix weights"""
+    total = sum(mix.values())
+    for enemy_type, weight in mix.items():
+        roll -= weight / total
+        if roll < 0:
+            return enemy_type
+    return enemy_type
+
+
+def compile_wave(number, config, speed_ranges, rng, definitions=WAVE_DEFINITIONS):
+    """Spawn events (time, type, x, y, vx, vy) for one wave, sorted by time"""
+    definition = definitions[min(number, len(definitions)) - 1]
+    budget = max(1, round(config["enemy_count"] * WAVE_GROWTH ** (number - 1)))
+    # Groups come a little faster each wave, as the old per-frame timer did
+    interval = definition["interval"] * config["spawn_rate"] / (1 + number * 0.1)
+    events = []
+    time = 0.0
+    group = 0
+    while budget > 0:
+        offsets = FORMATIONS[definition["formations"][group % len(definition["formations"])]][:budget]
+        enemy_type = pick_type(definition["mix"], rng.random())
+        # One velocity for the whole group so the formation holds its shape
+        vx = rng.uniform(-60, 60)
+        vy = rng.uniform(*speed_ranges[enemy_type])
+        low = max(40 - dx for dx, dy in offsets)
+        high = min(VIRTUAL_WIDTH - 40 - dx for dx, dy in offsets)
+        x = rng.randint(low, high)
+        y = rng.randint(-200, -80)
+        for dx, dy in offsets:
+            events.append((time, enemy_type, x + dx, y + dy, vx, vy))
+        budget -= len(offsets)
+        group += 1
+        time += interval
+    return events
+
+
+def compile_level(config, speed_ranges, rng=None, definitions=WAVE_DEFINITIONS):
+    """Spawn timeline for every wave of a level, built once when the level starts"""
+    rng = rng or RNG()
+    return [compile_wave(number, config, speed_ranges, rng, definitions)
+            for number in range(1, config["wave_count"] + 1)]
@@ -1,10 +1,10 @@
 import pygame
-import random
 import math
 from src.entities.entity import Entity
 from src.entities.projectile import Projectile
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.rng import RNG
 
 class Boss(Entity):
     def __init__(self, groups, projectile_groups, player, level=1, difficulty="easy"):
@@ -47,10 +47,10 @@ class Boss(Entity):
         elif self.state == "idle":
             self.state_timer -= dt
             if self.state_timer <= 0:
-                self.state = random.choice(["moving", "attacking", "laser_charge"])
-                self.state_timer = random.uniform(2.0, 4.0)
+                self.state = RNG().choice(["moving", "attacking", "laser_charge"])
+                self.state_timer = RNG().uniform(2.0, 4.0)
                 if self.state == "moving":
-                    self.target_x = random.randint(150, VIRTUAL_WIDTH - 150)
+                    self.target_x = RNG().randint(150, VIRTUAL_WIDTH - 150)
                 elif self.state == "laser_charge":
                     self.state_timer = 2.0 # Charge time
                     self.laser_width = 2
@@ -108,7 +108,5 @@ class Boss(Entity):
             
         for offset in offsets:
             # 40% slower speed (400 * 0.6 = 240)
-            p = Projectile(self.projectile_groups, self.rect.centerx + offset, self.rect.bottom, 240, damage=15, p_type='pepsi')
-            # Make them bigger as requested
-            p.image = pygame.transform.scale(p.image, (int(p.rect.width * 1.5), int(p.rect.height * 1.5)))
-            p.rect = p.image.get_rect(center=p.rect.center)
+            # Bigger bottles as requested (pre-scaled once by the pool)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx + offset, self.rect.bottom, 240, damage=15, p_type='pepsi', scale=1.5)
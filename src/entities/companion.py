@@ -11,13 +11,7 @@ class Companion(Entity):
         self.c_type = c_type
         self.projectile_groups = projectile_groups
         
-        assets = AssetManager()
-        if c_type == "sprite":
-            self.image = assets.images.get('companion_sprite', pygame.Surface((20, 40)))
-        else:
-            self.image = pygame.Surface((20, 20))
-            self.image.fill(GREEN)
-            
+        self.image = AssetManager().image_for('companion', c_type)
         self.rect = self.image.get_rect()
         self.offset = pygame.math.Vector2(-40, 20) # Relative to player
         self.position = pygame.math.Vector2(player.rect.center) + self.offset
@@ -42,9 +36,4 @@ class Companion(Entity):
             
     def shoot(self):
         # Sprite shoots "Lemon Lime" lasers (Green/Yellow)
-        p = Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -300, damage=15, p_type='sprite_juice')
-        # Custom color for sprite juice if not defined in assets
-        if not hasattr(p, 'image') or p.image.get_height() < 5:
-            p.image = pygame.Surface((6, 16))
-            p.image.fill((50, 255, 50)) # Neon Green
-            p.rect = p.image.get_rect(center=p.rect.center)
+        Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -300, damage=15, p_type='sprite_juice')
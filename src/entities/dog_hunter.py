@@ -2,6 +2,7 @@ import pygame
 from src.entities.entity import Entity
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.input_manager import InputManager
 
 class DogHunter(Entity):
     def __init__(self, groups):
@@ -15,7 +16,7 @@ class DogHunter(Entity):
         self.max_energy = 100
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        keys = InputManager().get_pressed()
         self.velocity.xy = (0, 0)
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.velocity.x = -self.speed
@@ -1,32 +1,43 @@
 import pygame
-import random
-from src.entities.entity import Entity
+from src.entities.entity import Entity, EntityPool
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.rng import RNG
 
 class Enemy(Entity):
-    def __init__(self, groups, enemy_type='basic'):
+    # Downward speed range (px/s) per type; wave schedules draw from these too
+    SPEED_RANGES = {'basic': (120, 250), 'fast': (300, 450)}
+
+    def __init__(self, groups, enemy_type='basic', position=None, velocity=None):
         super().__init__(groups, LAYER_ENEMIES)
+        self.reset(enemy_type, position, velocity)
+
+    def reset(self, enemy_type='basic', position=None, velocity=None):
+        """Arm for a new spawn (fresh or out of the pool)"""
         self.enemy_type = enemy_type
+        rng = RNG()
         
         if enemy_type == 'basic':
             self.image = AssetManager().images['enemy_basic']
-            self.speed = random.uniform(120, 250)
             self.health = 1
             self.score_value = 100
         elif enemy_type == 'fast':
             self.image = AssetManager().images['enemy_fast']
-            self.speed = random.uniform(300, 450)
             self.health = 1
             self.score_value = 150
             
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(
-            random.randint(40, VIRTUAL_WIDTH - 40),
-            random.randint(-200, -80)
-        )
-        self.velocity = pygame.math.Vector2(random.uniform(-60, 60), self.speed)
+        # Scheduled spawns arrive with their position and velocity precomputed
+        if position is None:
+            position = (rng.randint(40, VIRTUAL_WIDTH - 40), rng.randint(-200, -80))
+        if velocity is None:
+            velocity = (rng.uniform(-60, 60), rng.uniform(*self.SPEED_RANGES[enemy_type]))
+        self.position.update(position)
+        self.velocity.update(velocity)
+        self.speed = self.velocity.y
         self.rect.center = self.position
+        self.active = True
+        self.pooled = False
 
     def update(self, dt):
         super().update(dt)
@@ -34,3 +45,5 @@ class Enemy(Entity):
         # Wrap around or kill
         if self.rect.top > VIRTUAL_HEIGHT + 20:
             self.kill()
+
+Enemy.pool = EntityPool(Enemy)
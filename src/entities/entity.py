@@ -1,20 +1,68 @@
 import pygame
 from src.utils.constants import *
+from src.utils.assets import AssetManager
+
+class EntityPool:
+    """Free list of killed entities of one type.
+
+    ``acquire`` re-arms a free entity through its ``reset`` (same arguments
+    as the constructor after ``groups``) before constructing anything new;
+    ``Entity.kill`` hands pooled types back here.
+    """
+
+    def __init__(self, entity_type, max_free=ENTITY_POOL_MAX_FREE):
+        self.entity_type = entity_type
+        self.max_free = max_free
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, groups, *args, **kwargs):
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+            entity.add_to_groups(groups)
+            self.reused += 1
+            return entity
+        self.created += 1
+        return self.entity_type(groups, *args, **kwargs)
+
+    def release(self, entity):
+        if len(self.free) < self.max_free:
+            self.free.append(entity)
+
+    def clear(self):
+        self.free.clear()
+
+    def stats(self):
+        return {"free": len(self.free), "created": self.created, "reused": self.reused}
+
 
 class Entity(pygame.sprite.Sprite):
-    def __init__(self, groups=None, layer=LAYER_BACKGROUND):
+    # Set to an EntityPool on types that recycle their killed instances
+    pool = None
+
+    def __init__(self, groups=None, layer=LAYER_BACKGROUND, image=None):
         super().__init__()
         self.render_layer = layer
-        self.image = pygame.Surface((32, 32))
-        self.image.fill(WHITE)
-        self.rect = self.image.get_rect()
+        # Subclasses assign their real image (and rect) themselves
+        self.image = image
+        self.rect = image.get_rect() if image is not None else None
         self.position = pygame.math.Vector2(0, 0)
         self.velocity = pygame.math.Vector2(0, 0)
         self.active = True
+        self.pooled = False
 
         if groups:
             self.add_to_groups(groups)
 
+    @classmethod
+    def spawn(cls, groups, *args, **kwargs):
+        """Construct, or re-arm a killed instance when the type is pooled"""
+        if cls.pool is not None:
+            return cls.pool.acquire(groups, *args, **kwargs)
+        return cls(groups, *args, **kwargs)
+
     def add_to_groups(self, groups):
         if not isinstance(groups, (list, tuple, set)):
             groups = [groups]
@@ -25,6 +73,17 @@ class Entity(pygame.sprite.Sprite):
             else:
                 group.add(self)
 
+    def kill(self):
+        super().kill()
+        if self.pool is not None and not self.pooled:
+            self.pooled = True
+            self.pool.release(self)
+
+    @property
+    def mask(self):
+        """Pixel mask of the current image, shared through AssetManager"""
+        return AssetManager().get_mask(self.image)
+
     def update(self, dt):
         self.position += self.velocity * dt
         self.rect.center = round(self.position.x), round(self.position.y)
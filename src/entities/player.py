@@ -3,6 +3,8 @@ from src.entities.entity import Entity
 from src.entities.projectile import Projectile
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.input_manager import InputManager
+from src.core.audio_manager import AudioManager
 
 class Player(Entity):
     def __init__(self, groups, projectile_groups):
@@ -60,7 +62,8 @@ class Player(Entity):
         self.auto_fire = enabled
 
     def _handle_keyboard(self):
-        keys = pygame.key.get_pressed()
+        input_manager = InputManager()
+        keys = input_manager.get_pressed()
 
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.velocity.x = -self.speed
@@ -77,12 +80,13 @@ class Player(Entity):
         else:
             self.velocity.y = 0
 
-        return keys[pygame.K_SPACE] or keys[pygame.K_z] or pygame.mouse.get_pressed()[0]
+        return keys[pygame.K_SPACE] or keys[pygame.K_z] or input_manager.get_mouse_pressed()[0]
 
     def _handle_pointer(self):
         from src.core.resolution_manager import ResolutionManager
         res_mgr = ResolutionManager()
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        input_manager = InputManager()
+        mouse_x, mouse_y = input_manager.get_mouse_pos()
         virtual_x, virtual_y = res_mgr.to_virtual(mouse_x, mouse_y)
         
         self.velocity.x = 0
@@ -91,7 +95,7 @@ class Player(Entity):
         elif virtual_x > self.position.x + 10:
             self.velocity.x = self.speed
 
-        return pygame.mouse.get_pressed()[0]
+        return input_manager.get_mouse_pressed()[0]
         
     def update(self, dt):
         # Update powerup timers
@@ -127,24 +131,25 @@ class Player(Entity):
             
         if (firing or self.auto_fire) and self.shoot_cooldown <= 0:
             self.shoot()
+            AudioManager().play_sound('laser', 0.5)
             self.shoot_cooldown = base_cooldown
 
     def shoot(self):
         # Determine shot pattern
         if self.powerups["cola_burst"] > 0:
             # Triple parallel
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
-            Projectile(self.projectile_groups, self.rect.centerx - 20, self.rect.top + 10, -BULLET_SPEED)
-            Projectile(self.projectile_groups, self.rect.centerx + 20, self.rect.top + 10, -BULLET_SPEED)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx - 20, self.rect.top + 10, -BULLET_SPEED)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx + 20, self.rect.top + 10, -BULLET_SPEED)
         elif self.powerups["spread_shot"] > 0:
             # 5-way spread
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.9, speed_x=-100)
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.9, speed_x=100)
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.8, speed_x=-200)
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.8, speed_x=200)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.9, speed_x=-100)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.9, speed_x=100)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.8, speed_x=-200)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED * 0.8, speed_x=200)
         else:
-            Projectile(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
+            Projectile.spawn(self.projectile_groups, self.rect.centerx, self.rect.top, -BULLET_SPEED)
 
     def update_stats(self):
         from src.core.game_state import GameState
@@ -1,43 +1,21 @@
 import pygame
-from src.entities.entity import Entity
+from src.entities.entity import Entity, EntityPool
 from src.utils.constants import *
 from src.utils.assets import AssetManager
 
 class PowerUp(Entity):
     def __init__(self, groups, x, y, power_type='health'):
         super().__init__(groups, LAYER_PROJECTILES)
+        self.reset(x, y, power_type)
+
+    def reset(self, x, y, power_type='health'):
+        """Arm for a new drop (fresh or out of the pool)"""
         self.power_type = power_type
-        assets = AssetManager()
-        if power_type == 'health':
-            self.image = assets.images.get('powerup_health', pygame.Surface((20, 20)))
-        elif power_type == 'cola_burst':
-            self.image = assets.images.get('powerup_cola', pygame.Surface((20, 20)))
-            if 'powerup_cola' not in assets.images:
-                self.image.fill(RED)
-        elif power_type == 'spread_shot':
-            self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, NEON_PURPLE, (12, 12), 12)
-            pygame.draw.circle(self.image, WHITE, (12, 12), 8, 2)
-            # 3 dots in triangle
-            pygame.draw.circle(self.image, WHITE, (12, 6), 2)
-            pygame.draw.circle(self.image, WHITE, (6, 16), 2)
-            pygame.draw.circle(self.image, WHITE, (18, 16), 2)
-        elif power_type == 'rapid_fire':
-            self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-            pygame.draw.rect(self.image, GOLD, (4, 4, 16, 16), border_radius=4)
-            pygame.draw.polygon(self.image, WHITE, [(8, 8), (16, 12), (8, 16)]) # Play icon
-        elif power_type == 'shield':
-            self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, NEON_BLUE, (12, 12), 12)
-            pygame.draw.circle(self.image, WHITE, (12, 12), 10, 2)
-            pygame.draw.line(self.image, WHITE, (6, 12), (18, 12), 2)
-            pygame.draw.line(self.image, WHITE, (12, 6), (12, 18), 2)
-        else:
-            self.image = pygame.Surface((20, 20))
-            self.image.fill(NEON_BLUE)
+        self.image = AssetManager().image_for('powerup', power_type)
         self.rect = self.image.get_rect(center=(x, y))
-        self.position = pygame.math.Vector2(x, y)
-        self.velocity = pygame.math.Vector2(0, 120)
+        self.position.update(x, y)
+        self.velocity.update(0, 120)
+        self.pooled = False
 
     def update(self, dt):
         self.position.y += self.velocity.y * dt
@@ -62,3 +40,5 @@ class PowerUp(Entity):
             player.activate_powerup('shield', 5.0)
             return 150
         return 0
+
+PowerUp.pool = EntityPool(PowerUp)
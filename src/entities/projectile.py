@@ -1,38 +1,68 @@
 import pygame
 from src.entities.entity import Entity
+from src.core.bullet_system import BulletSystem
 from src.utils.constants import *
 from src.utils.assets import AssetManager
 
+class ProjectileImages:
+    """Projectile images shared by every shot of a kind.
+
+    Looked up once per (type, scale) through AssetManager.image_for and
+    pre-scaled, so neither BulletSystem nor Projectile builds surfaces per
+    shot. Registered with AssetManager, which empties the cache whenever it
+    rebuilds the atlas pages (e.g. on a display format change).
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ProjectileImages, cls).__new__(cls)
+            cls._instance.images = {}
+            AssetManager().register_image_cache(cls._instance.images)
+        return cls._instance
+
+    def image(self, p_type, scale=1.0):
+        """Shared image for a projectile type, pre-scaled once"""
+        key = (p_type, scale)
+        image = self.images.get(key)
+        if image is None:
+            image = AssetManager().image_for('projectile', p_type)
+            if scale != 1.0:
+                w, h = image.get_size()
+                image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+            self.images[key] = image
+        return image
+
+
 class Projectile(Entity):
-    def __init__(self, groups, x, y, speed_y, damage=10, p_type='coke', target=None, speed_x=0):
-        super().__init__(groups, LAYER_PROJECTILES)
+    def __init__(self, groups, x, y, speed_y, damage=10, p_type='coke', target=None, speed_x=0, scale=1.0):
+        super().__init__(groups, LAYER_PROJECTILES, ProjectileImages().image(p_type, scale))
+        self.homing_speed = PROJECTILE_HOMING_SPEED # Turn speed
+        self.reset(x, y, speed_y, damage, p_type, target, speed_x, scale)
+
+    @classmethod
+    def spawn(cls, groups, x, y, speed_y, damage=10, p_type='coke', target=None, speed_x=0, scale=1.0):
+        """Fire a projectile: into a BulletSystem when one is among groups,
+        otherwise as a Projectile sprite"""
+        if not isinstance(groups, (list, tuple, set)):
+            groups = [groups]
+        for group in groups:
+            if isinstance(group, BulletSystem):
+                return group.spawn(x, y, speed_x, speed_y, damage, p_type, target, scale)
+        return cls(groups, x, y, speed_y, damage, p_type, target, speed_x, scale)
+
+    def reset(self, x, y, speed_y, damage=10, p_type='coke', target=None, speed_x=0, scale=1.0):
+        """Re-arm this sprite for a new shot"""
         self.p_type = p_type
         self.damage = damage
         self.target = target
-        self.homing_speed = 200 # Turn speed
-        
-        # Asset selection based on type
-        assets = AssetManager()
-        if p_type == 'coke':
-            self.image = assets.images.get('projectile_coke', pygame.Surface((10, 20)))
-        elif p_type == 'pepsi':
-            self.image = assets.images.get('projectile_pepsi', pygame.Surface((12, 24)))
-        elif p_type == 'snowball':
-            # Snowball is just a small white circle if asset missing, but we have enemy_fast as snowball
-            # Let's use a smaller version or just a white circle
-            self.image = pygame.Surface((16, 16), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, WHITE, (8, 8), 8)
-        elif p_type == 'sprite_juice':
-            self.image = assets.images.get('projectile_sprite_juice', pygame.Surface((10, 20)))
-        else:
-            self.image = pygame.Surface((8, 16))
-            self.image.fill(NEON_BLUE)
-            
+        self.image = ProjectileImages().image(p_type, scale)
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(x, y)
-        self.velocity = pygame.math.Vector2(speed_x, speed_y)
+        self.position.update(x, y)
+        self.velocity.update(speed_x, speed_y)
         self.rect.center = (x, y)
-        
+        self.active = True
+
         # Trail / VFX properties
         self.emit_trail = True
         self.trail_timer = 0
@@ -1,19 +1,25 @@
-import random
 import pygame
-from src.entities.entity import Entity
+from src.entities.entity import Entity, EntityPool
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.rng import RNG
 
 class RoboCritter(Entity):
     def __init__(self, groups):
         super().__init__(groups, LAYER_ENEMIES)
+        self.reset()
+
+    def reset(self):
+        """Arm for a new spawn (fresh or out of the pool)"""
+        rng = RNG()
         self.image = AssetManager().images['robo_critter']
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(random.randint(60, VIRTUAL_WIDTH - 60),
-                                            random.randint(60, VIRTUAL_HEIGHT // 2))
+        self.position.update(rng.randint(60, VIRTUAL_WIDTH - 60),
+                             rng.randint(60, VIRTUAL_HEIGHT // 2))
         self.rect.center = self.position
-        self.velocity = pygame.math.Vector2(random.choice([-240, 240]), random.uniform(-60, 60))
+        self.velocity.update(rng.choice([-240, 240]), rng.uniform(-60, 60))
         self.health = 1
+        self.pooled = False
 
     def update(self, dt):
         self.position += self.velocity * dt
@@ -21,4 +27,6 @@ class RoboCritter(Entity):
             self.velocity.x *= -1
         if self.position.y <= 40 or self.position.y >= VIRTUAL_HEIGHT - 40:
             self.velocity.y *= -1
-        self.rect.center = (int(self.position.x), int(self.position.y))
\ No newline at end of file
+        self.rect.center = (int(self.position.x), int(self.position.y))
+
+RoboCritter.pool = EntityPool(RoboCritter)
@@ -4,9 +4,12 @@ from src.utils.constants import *
 class AndroidSpaceScene(SpaceShooterScene):
     def __init__(self, manager):
         super().__init__(manager)
+        self.exit_scene = "mode_select"
+
+    def reset(self):
+        super().reset()
         self.player.set_control_mode("pointer")
         self.player.set_auto_fire(True)
-        self.exit_scene = "mode_select"
         self.mobile_bonus = 0
 
     def update(self, dt):
@@ -1,6 +1,57 @@
+import pygame
+
 class Scene:
+    # Retained scenes keep their last frame on the virtual surface and only
+    # redraw (and present) the regions they mark dirty
+    retained = False
+    # Cacheable scenes are parked by SceneManager when left and reused on
+    # the next visit; next_scenes names the likely follow-ups to pre-build
+    cacheable = True
+    next_scenes = ()
+
     def __init__(self, manager):
         self.manager = manager
+        self.dirty_rects = []
+        self.full_redraw = True
+
+    def mark_dirty(self, rect=None):
+        """Queue a virtual-space region for redraw; no rect means the whole surface"""
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def mark_widgets(self, widgets):
+        """Queue the bounds of every widget whose look changed since the last frame"""
+        for widget in widgets:
+            if widget.dirty:
+                widget.dirty = False
+                self.mark_dirty(widget.bounds)
+
+    def take_dirty(self):
+        """Regions to redraw this frame (None = everything) and reset the queue"""
+        rects = None if self.full_redraw else self.dirty_rects
+        self.dirty_rects = []
+        self.full_redraw = False
+        return rects
+
+    def enter(self, **kwargs):
+        """Becoming the current scene, fresh or from the cache; kwargs come from change_scene"""
+        self.mark_dirty()
+        if kwargs and hasattr(self, 'setup'):
+            self.setup(**kwargs)
+
+    def exit(self):
+        """No longer the current scene"""
+        pass
+
+    def suspend(self):
+        """Parked in the scene cache after exit; drop per-visit state worth freeing"""
+        pass
+
+    def resume(self):
+        """Taken back out of the cache; restore the state a fresh instance would start in"""
+        pass
 
     def process_input(self, events):
         pass
@@ -6,6 +6,7 @@ from src.entities.dog_treat import DogTreat
 from src.entities.robo_critter import RoboCritter
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.render_queue import RenderQueue
 
 class DogHuntScene(Scene):
     def __init__(self, manager):
@@ -13,14 +14,28 @@ class DogHuntScene(Scene):
         self.all_sprites = pygame.sprite.Group()
         self.treats = pygame.sprite.Group()
         self.critters = pygame.sprite.Group()
+        self.render_queue = RenderQueue()
+        self.exit_scene = "mode_select"
+        self.font = AssetManager().fonts['hud']
+        self.reset()
+
+    def reset(self):
+        """Start a new 60 second hunt"""
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
         self.dog = DogHunter([self.all_sprites])
         self.score = 0
         self.timer = 60.0
-        self.exit_scene = "mode_select"
-        self.font = AssetManager().fonts['hud']
         self.treat_timer = 0
         self.critter_timer = 0
 
+    def suspend(self):
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+
+    def resume(self):
+        self.reset()
+
     def process_input(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -40,10 +55,10 @@ class DogHuntScene(Scene):
         self.critter_timer += dt
         if self.treat_timer >= 1.5:
             self.treat_timer = 0
-            DogTreat([self.all_sprites, self.treats])
+            DogTreat.spawn([self.all_sprites, self.treats])
         if self.critter_timer >= 3.0:
             self.critter_timer = 0
-            RoboCritter([self.all_sprites, self.critters])
+            RoboCritter.spawn([self.all_sprites, self.critters])
 
         treat_hits = pygame.sprite.spritecollide(self.dog, self.treats, True)
         for _ in treat_hits:
@@ -63,9 +78,9 @@ class DogHuntScene(Scene):
         for y in range(0, VIRTUAL_HEIGHT, 100):
             pygame.draw.line(screen, (25, 50, 40), (0, y), (VIRTUAL_WIDTH, y), 1)
         
-        self.all_sprites.draw(screen)
-        self.treats.draw(screen)
-        self.critters.draw(screen)
+        # Treats and critters are in all_sprites too, so one pass draws everything once
+        self.render_queue.add_group(self.all_sprites)
+        self.render_queue.submit(screen)
 
         # HUD
         score = self.font.render(f"Treats Collected: {self.score}", True, GOLD)
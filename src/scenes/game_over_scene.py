@@ -5,6 +5,9 @@ from src.utils.assets import AssetManager
 from src.ui.components import Button, Label
 
 class GameOverScene(Scene):
+    retained = True
+    next_scenes = ("map", "shop")
+
     def __init__(self, manager):
         super().__init__(manager)
         self.assets = AssetManager()
@@ -17,16 +20,28 @@ class GameOverScene(Scene):
         
         self.buttons = []
         self.labels = []
+        self.backdrop = None # Dimmed copy of the last game frame
+        self.retry_scene = "game"
+        self.retry_args = {}
+
+    def resume(self):
+        self.backdrop = None
         
     def setup(self, result="defeat", score=0, coins=0):
         self.result = result
         self.score = score
         self.coins = coins
+        # RETRY restarts the run that just ended, at its level and difficulty
+        source = self.manager.previous_scene
+        if source is not None and hasattr(source, 'current_level'):
+            self.retry_scene = self.manager.previous_scene_name
+            self.retry_args = {"level": source.current_level, "difficulty": source.current_difficulty}
         self.create_ui()
         
     def create_ui(self):
         self.buttons = []
         self.labels = []
+        self.mark_dirty()
         
         title_text = "GAME OVER" if self.result == "defeat" else "VICTORY!"
         title_color = RED if self.result == "defeat" else GREEN
@@ -46,7 +61,7 @@ class GameOverScene(Scene):
         # Buttons
         # Retry only if defeat or just always? Always is fine.
         self.buttons.append(Button(VIRTUAL_WIDTH // 2 - 100, 350, 200, 50, "RETRY", self.font_menu, 
-                                 lambda: self.manager.change_scene("game", level=self.manager.scenes['game'].current_level, difficulty=self.manager.scenes['game'].current_difficulty)))
+                                 lambda: self.manager.change_scene(self.retry_scene, **self.retry_args)))
         
         self.buttons.append(Button(VIRTUAL_WIDTH // 2 - 100, 420, 200, 50, "MAP", self.font_menu, 
                                  lambda: self.manager.change_scene("map")))
@@ -59,11 +74,16 @@ class GameOverScene(Scene):
             btn.update(dt)
 
     def draw(self, screen):
-        # Dark overlay
-        overlay = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
+        # Dark overlay over the final game frame, dimmed once and kept so
+        # partial redraws don't darken it further
+        if self.backdrop is None:
+            overlay = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(200)
+            screen.blit(overlay, (0, 0))
+            self.backdrop = screen.copy()
+        else:
+            screen.blit(self.backdrop, (0, 0))
         
         for label in self.labels:
             label.draw(screen)
@@ -75,3 +95,4 @@ class GameOverScene(Scene):
         for event in events:
             for btn in self.buttons:
                 btn.handle_event(event)
+        self.mark_widgets(self.buttons)
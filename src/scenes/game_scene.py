@@ -1,5 +1,4 @@
 import pygame
-import random
 from src.scenes.base_scene import Scene
 from src.entities.player import Player
 from src.entities.enemy import Enemy
@@ -9,52 +8,108 @@ from src.utils.constants import *
 from src.utils.assets import AssetManager
 from src.core.wave_manager import WaveManager
 from src.core.level_manager import LevelManager
+from src.core.audio_manager import AudioManager
 from src.core.game_state import GameState
-from src.core.vfx_manager import ParticlePool, ScreenShake
+from src.core.vfx_manager import ParticlePool, ScreenShake, Starfield
+from src.core.spatial_hash import SpatialHash
+from src.core.bullet_system import BulletSystem
+from src.core.render_queue import RenderQueue
+from src.core.rng import RNG
+from src.core.profiler import Profiler
+from src.core.resolution_manager import ResolutionManager
 from src.ui.components import ProgressBar, Label
+from src.ui.text_cache import TextCache
 
 class SpaceShooterScene(Scene):
+    next_scenes = ("game_over",)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.all_sprites = pygame.sprite.LayeredUpdates()
         self.enemies = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
-        self.enemy_projectiles = pygame.sprite.Group()
+        self.projectiles = BulletSystem()
+        self.enemy_projectiles = BulletSystem()
         self.powerups = pygame.sprite.Group()
         
-        self.player = Player([self.all_sprites], [self.all_sprites, self.projectiles])
-        self.exit_scene = "map"
+        # Collision broadphase
+        self.collision_grid = SpatialHash()
+        self.collision_grid.register("enemies", self.enemies)
+        self.collision_grid.register("powerups", self.powerups)
+        # Batched per-layer draw list, reused every frame
+        self.render_queue = RenderQueue()
+        # Confirm rect hits against cached pixel masks (no hits on transparent corners)
+        self.precise_collisions = True
         
+        self.exit_scene = "map"
         self.level_manager = LevelManager()
+        self.audio_manager = AudioManager()
         self.game_state = GameState()
+        self.font_hud = AssetManager().fonts['hud']
+        self.particle_pool = ParticlePool()
+
+        # UI Components
+        self.health_bar = ProgressBar(20, VIRTUAL_HEIGHT - 60, 300, 30, 100)
+        self.boss_health_bar = ProgressBar(VIRTUAL_WIDTH // 2 - 200, 50, 400, 20, 1000, color=RED)
+        self.score_label = Label(20, 20, "Score: 0", self.font_hud, GOLD)
+        self.level_label = Label(VIRTUAL_WIDTH - 150, 20, "Level 1", self.font_hud, WHITE)
+        self.zone_label = Label(VIRTUAL_WIDTH // 2 - 100, VIRTUAL_HEIGHT // 2 - 50, "", AssetManager().fonts['title'], WHITE)
+        
+        # Background
+        self.bg_color = BLACK
+        self.starfield = Starfield(self.bg_color, WHITE)
+        self.reset()
+
+    def reset(self):
+        """Back to the just-constructed state: empty world, new player, level 1 defaults
+
+        The spawn timeline is compiled by setup on entering, never here, so
+        building or resuming the scene draws nothing from the gameplay RNG.
+        """
+        self.clear_world()
+        self.player = Player([self.all_sprites], self.projectiles)
         self.current_level = 1
         self.current_difficulty = "easy"
         self.boss = None
         self.boss_spawned = False
         self.level_complete = False
         
-        self.wave_manager = WaveManager(self)
+        self.wave_manager = None
         self.score = 0
         self.coins_collected = 0
         self.combo = 0
         self.combo_timer = 0
-        self.font_hud = AssetManager().fonts['hud']
         
         # VFX Systems
-        self.particle_pool = ParticlePool()
         self.screen_shake = ScreenShake()
         
-        # UI Components
-        self.health_bar = ProgressBar(20, VIRTUAL_HEIGHT - 60, 300, 30, 100)
-        self.boss_health_bar = ProgressBar(VIRTUAL_WIDTH // 2 - 200, 50, 400, 20, 1000, color=RED)
-        self.score_label = Label(20, 20, "Score: 0", self.font_hud, GOLD)
-        self.level_label = Label(VIRTUAL_WIDTH - 150, 20, "Level 1", self.font_hud, WHITE)
-        self.zone_label = Label(VIRTUAL_WIDTH // 2 - 100, VIRTUAL_HEIGHT // 2 - 50, "", AssetManager().fonts['title'], WHITE)
+        # Bars animate toward their targets; start a run from empty ones
+        for bar in (self.health_bar, self.boss_health_bar):
+            bar.value = bar.target_value = 0
+        self.boss_health_bar.max_value = 1000
         self.show_zone_timer = 0
-        
-        # Background
-        self.stars = []
-        self.bg_color = BLACK
+
+    def clear_world(self):
+        """Remove every sprite, bullet and particle"""
+        self.enemies.empty()
+        self.projectiles.empty()
+        self.enemy_projectiles.empty()
+        self.powerups.empty()
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+        self.particle_pool.clear()
+
+    def suspend(self):
+        # A parked scene holds no entities; resume builds a fresh run
+        self.clear_world()
+
+    def resume(self):
+        self.reset()
+
+    def enter(self, **kwargs):
+        super().enter(**kwargs)
+        if not kwargs:
+            # Entered without a level (e.g. android_shooter): level 1 defaults
+            self.setup()
 
     def setup(self, level=1, difficulty="easy"):
         self.current_level = level
@@ -65,15 +120,8 @@ class SpaceShooterScene(Scene):
         self.bg_color = self.config.get("bg_color", BLACK)
         star_color = self.config.get("star_color", WHITE)
         
-        # Generate stars
-        self.stars = []
-        for _ in range(100):
-            self.stars.append({
-                'pos': [random.randint(0, VIRTUAL_WIDTH), random.randint(0, VIRTUAL_HEIGHT)],
-                'speed': random.randint(20, 100),
-                'size': random.randint(1, 3),
-                'color': star_color
-            })
+        # Parallax stars, pre-rendered per theme
+        self.starfield = Starfield(self.bg_color, star_color)
             
         # Zone Name
         self.zone_label.set_text(self.config.get("name", "Unknown Sector"))
@@ -103,12 +151,12 @@ class SpaceShooterScene(Scene):
         unlocked_companions = self.game_state.data.get("unlocked_companions", [])
         # For testing, let's give a companion if level > 1 or if unlocked
         if "sprite_bot" in unlocked_companions or self.current_level > 1: # Free trial at level 2
-             Companion([self.all_sprites], [self.all_sprites, self.projectiles], self.player, "sprite")
+             Companion([self.all_sprites], self.projectiles, self.player, "sprite")
                 
         self.level_label.set_text(f"Level {level} - {difficulty.upper()}")
         
-        # Configure wave manager (simplified for now)
-        # In a real implementation, WaveManager would take the config
+        # Compile this level's spawn timeline up front
+        self.wave_manager = WaveManager(self, self.config)
         
     def process_input(self, events):
         for event in events:
@@ -118,18 +166,20 @@ class SpaceShooterScene(Scene):
 
     def update(self, dt):
         # Update background stars
-        for star in self.stars:
-            star['pos'][1] += star['speed'] * dt
-            if star['pos'][1] > VIRTUAL_HEIGHT:
-                star['pos'][1] = 0
-                star['pos'][0] = random.randint(0, VIRTUAL_WIDTH)
+        self.starfield.update(dt)
 
         # Update zone label timer
         if self.show_zone_timer > 0:
             self.show_zone_timer -= dt
 
-        self.all_sprites.update(dt)
-        self.particle_pool.update(dt)
+        profiler = Profiler()
+        with profiler.scope("sprites.update"):
+            self.all_sprites.update(dt)
+        with profiler.scope("bullets.update"):
+            self.projectiles.update(dt)
+            self.enemy_projectiles.update(dt)
+        with profiler.scope("particles.update"):
+            self.particle_pool.update(dt)
         self.screen_shake.update(dt)
         
         if self.level_complete:
@@ -158,8 +208,12 @@ class SpaceShooterScene(Scene):
             self.combo = 0
         
         # Collisions - Projectiles hit Enemies
-        hits = pygame.sprite.groupcollide(self.enemies, self.projectiles, True, True)
+        profiler.begin("collisions")
+        self.collision_grid.rebuild()
+        hits = self.projectiles.groupcollide(self.enemies, True, True, self.precise_collisions)
         for hit in hits:
+            # A combo kills many at once; the voice manager merges these into one voice
+            self.audio_manager.play_sound('explosion', 0.6)
             score_gain = hit.score_value * (1 + self.combo * 0.1)
             self.score += int(score_gain)
             self.combo += 1
@@ -171,32 +225,33 @@ class SpaceShooterScene(Scene):
             
             # XP & Coins
             self.game_state.add_xp(10)
-            coin_amount = random.randint(1, 5)
+            coin_amount = RNG().randint(1, 5)
             self.game_state.add_coins(coin_amount)
             self.coins_collected += coin_amount
             
             # Rudolph (basic enemy) drops Powerups
             if getattr(hit, 'enemy_type', '') == 'basic':
-                roll = random.random()
+                roll = RNG().random()
                 if roll < 0.1:
-                    PowerUp([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'cola_burst')
+                    PowerUp.spawn([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'cola_burst')
                 elif roll < 0.2:
-                    PowerUp([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'spread_shot')
+                    PowerUp.spawn([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'spread_shot')
                 elif roll < 0.3:
-                    PowerUp([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'rapid_fire')
+                    PowerUp.spawn([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'rapid_fire')
                 elif roll < 0.35:
-                    PowerUp([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'shield')
-            elif random.random() < POWERUP_CHANCE:
-                PowerUp([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'health')
+                    PowerUp.spawn([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'shield')
+            elif RNG().random() < POWERUP_CHANCE:
+                PowerUp.spawn([self.all_sprites, self.powerups], hit.rect.centerx, hit.rect.centery, 'health')
                 
         # Projectiles hit Boss
         if self.boss:
-            boss_hits = pygame.sprite.spritecollide(self.boss, self.projectiles, True)
+            boss_hits = self.projectiles.spritecollide(self.boss, True, self.precise_collisions)
             for p in boss_hits:
                 damage = self.player.damage_mult * 10 # Base damage 10
                 self.boss.health -= damage
                 self.particle_pool.emit(p.rect.centerx, p.rect.centery, RED, 5)
                 if self.boss.health <= 0:
+                    self.audio_manager.play_sound('explosion')
                     self.boss.kill()
                     self.boss = None
                     
@@ -210,7 +265,7 @@ class SpaceShooterScene(Scene):
                     break
             
         # Enemies hit Player
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, True)
+        hits = self.collision_grid.spritecollide(self.player, "enemies", True, self.precise_collisions)
         if hits:
             damage = 10 * len(hits)
             self.player.health -= damage
@@ -223,7 +278,7 @@ class SpaceShooterScene(Scene):
                 self.manager.change_scene("game_over", result="defeat", score=self.score, coins=self.coins_collected)
                 
         # Enemy Projectiles hit Player (Boss Pepsi)
-        p_hits = pygame.sprite.spritecollide(self.player, self.enemy_projectiles, True)
+        p_hits = self.enemy_projectiles.spritecollide(self.player, True, self.precise_collisions)
         for p in p_hits:
             damage = p.damage if hasattr(p, 'damage') else 10
             self.player.health -= damage
@@ -236,13 +291,16 @@ class SpaceShooterScene(Scene):
             if self.player.health <= 0:
                 self.manager.change_scene("game_over", result="defeat", score=self.score, coins=self.coins_collected)
 
-        # Powerup collection
-        power_hits = pygame.sprite.spritecollide(self.player, self.powerups, True)
+        # Powerup collection (pick up drops spawned by this frame's kills)
+        self.collision_grid.rebuild("powerups")
+        power_hits = self.collision_grid.spritecollide(self.player, "powerups", True)
         for powerup in power_hits:
             bonus = powerup.apply(self.player)
             self.score += bonus
+            self.audio_manager.play_sound('pickup')
             self.particle_pool.emit(powerup.rect.centerx, powerup.rect.centery, 
                                    NEON_BLUE, 10)
+        profiler.end()
         
         # Update UI
         self.health_bar.set_value(self.player.health)
@@ -257,10 +315,11 @@ class SpaceShooterScene(Scene):
         for e in self.enemies:
             e.kill()
         
-        self.boss = Boss([self.all_sprites], [self.all_sprites, self.enemy_projectiles], 
+        self.boss = Boss([self.all_sprites], self.enemy_projectiles, 
                         self.player, self.current_level, self.current_difficulty)
         self.boss_health_bar.max_value = self.boss.max_health
         self.boss_health_bar.set_value(self.boss.health)
+        self.audio_manager.play_sound('boss_alarm')
 
     def handle_level_complete(self):
         self.level_complete = True
@@ -284,16 +343,23 @@ class SpaceShooterScene(Scene):
         # Apply screen shake
         shake_x, shake_y = self.screen_shake.get_offset()
         
-        # Background with stars
-        screen.fill(self.bg_color)
+        # World layer renders at the dynamic resolution scale, UI at full resolution
+        res_mgr = ResolutionManager()
+        scale = res_mgr.render_scale
+        world = res_mgr.get_world_surface() if scale != 1.0 else screen
         
-        # Draw stars
-        for star in self.stars:
-            pygame.draw.circle(screen, star['color'], (int(star['pos'][0]), int(star['pos'][1])), star['size'])
+        # Background with stars
+        self.starfield.draw(world, scale)
         
-        # Draw sprites with shake
-        for sprite in self.all_sprites:
-            screen.blit(sprite.image, (sprite.rect.x + shake_x, sprite.rect.y + shake_y))
+        # Sprites by layer, then bullets above them, in one batched blit with shake applied
+        profiler = Profiler()
+        with profiler.scope("sprites.draw"):
+            queue = self.render_queue
+            queue.add_group(self.all_sprites)
+            self.projectiles.queue(queue)
+            self.enemy_projectiles.queue(queue)
+            image_for = res_mgr.world_image if scale != 1.0 else None
+            queue.submit(world, (shake_x, shake_y), scale, image_for)
             
         # Draw Boss Laser
         if self.boss and self.boss.state in ["laser_charge", "laser_fire"]:
@@ -302,17 +368,22 @@ class SpaceShooterScene(Scene):
                                    self.boss.laser_width, 
                                    VIRTUAL_HEIGHT - self.boss.rect.bottom)
             
+            draw_rect = laser_rect
+            if scale != 1.0:
+                draw_rect = pygame.Rect(int(laser_rect.x * scale), int(laser_rect.y * scale),
+                                        max(1, int(laser_rect.width * scale)), max(1, int(laser_rect.height * scale)))
+            
             if self.boss.state == "laser_charge":
                 # Warning line
-                pygame.draw.rect(screen, (255, 0, 0, 100), laser_rect) # Transparent red not supported directly in draw.rect without surface
+                pygame.draw.rect(world, (255, 0, 0, 100), draw_rect) # Transparent red not supported directly in draw.rect without surface
                 # Use surface for transparency
-                s = pygame.Surface((laser_rect.width, laser_rect.height), pygame.SRCALPHA)
+                s = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
                 s.fill((255, 0, 0, 100))
-                screen.blit(s, laser_rect.topleft)
+                world.blit(s, draw_rect.topleft)
             else:
                 # Full beam
-                pygame.draw.rect(screen, NEON_BLUE, laser_rect)
-                pygame.draw.rect(screen, WHITE, laser_rect, 4)
+                pygame.draw.rect(world, NEON_BLUE, draw_rect)
+                pygame.draw.rect(world, WHITE, draw_rect, max(1, int(4 * scale)))
                 
                 # Check collision with player
                 if laser_rect.colliderect(self.player.rect):
@@ -323,17 +394,24 @@ class SpaceShooterScene(Scene):
                         self.manager.change_scene("game_over", result="defeat", score=self.score, coins=self.coins_collected)
         
         # Draw particles
-        self.particle_pool.draw(screen)
+        with profiler.scope("particles.draw"):
+            self.particle_pool.draw(world, scale)
+        
+        if world is not screen:
+            with profiler.scope("world.upscale"):
+                pygame.transform.scale(world, screen.get_size(), screen)
         
         # UI Layer
+        profiler.begin("ui")
         self.score_label.draw(screen)
         self.health_bar.draw(screen)
         self.level_label.draw(screen)
         
         # XP / Coins Display
-        xp_text = self.font_hud.render(f"XP: {self.game_state.data.get('xp', 0)} | Lvl: {self.game_state.data.get('level', 1)}", True, NEON_PURPLE)
+        text_cache = TextCache()
+        xp_text = text_cache.render(self.font_hud, f"XP: {self.game_state.data.get('xp', 0)} | Lvl: {self.game_state.data.get('level', 1)}", True, NEON_PURPLE)
         screen.blit(xp_text, (20, 60))
-        coin_text = self.font_hud.render(f"Coins: {self.game_state.data.get('coins', 0)}", True, GOLD)
+        coin_text = text_cache.render(self.font_hud, f"Coins: {self.game_state.data.get('coins', 0)}", True, GOLD)
         screen.blit(coin_text, (20, 90))
         
         # Draw Zone Name
@@ -345,15 +423,16 @@ class SpaceShooterScene(Scene):
             self.boss_health_bar.draw(screen)
         
         # Wave info
-        wave_surf = self.font_hud.render(f"Wave: {self.wave_manager.wave}", True, GOLD)
+        wave_surf = text_cache.render(self.font_hud, f"Wave: {self.wave_manager.wave}", True, GOLD)
         screen.blit(wave_surf, (VIRTUAL_WIDTH // 2 - 70, 20))
         
         # Combo display
         if self.combo > 1:
-            combo_text = self.font_hud.render(f"COMBO x{self.combo}!", True, NEON_PINK)
+            combo_text = text_cache.render(self.font_hud, f"COMBO x{self.combo}!", True, NEON_PINK)
             combo_rect = combo_text.get_rect(center=(VIRTUAL_WIDTH // 2, 80))
             screen.blit(combo_text, combo_rect)
         
         # Controls hint
-        hint = self.font_hud.render("ESC: Exit | Arrow/WASD: Move | Space/Z: Fire", True, WHITE)
+        hint = text_cache.render(self.font_hud, "ESC: Exit | Arrow/WASD: Move | Space/Z: Fire", True, WHITE)
         screen.blit(hint, (20, VIRTUAL_HEIGHT - 30))
+        profiler.end()
@@ -2,8 +2,12 @@ import pygame
 from src.scenes.base_scene import Scene
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.vfx_manager import Starfield
 
 class IntroScene(Scene):
+    cacheable = False # Shown once per launch
+    next_scenes = ("menu",)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.font_title = AssetManager().fonts['title']
@@ -35,14 +39,7 @@ class IntroScene(Scene):
         self.skip_text = self.font_text.render("Press SPACE to Skip", True, (100, 100, 100))
         
         # Stars for background
-        self.stars = []
-        import random
-        for _ in range(100):
-            self.stars.append([
-                random.randint(0, VIRTUAL_WIDTH),
-                random.randint(0, VIRTUAL_HEIGHT),
-                random.randint(1, 3)
-            ])
+        self.backdrop = Starfield.backdrop(BLACK, (200, 200, 200), radius_range=(1, 3), seed=7)
             
         self.anim_timer = 0
 
@@ -61,11 +58,8 @@ class IntroScene(Scene):
             self.manager.change_scene("menu")
 
     def draw(self, screen):
-        screen.fill(BLACK)
-        
-        # Draw stars
-        for star in self.stars:
-            pygame.draw.circle(screen, (200, 200, 200), (star[0], star[1]), star[2])
+        # Background with stars
+        screen.blit(self.backdrop, (0, 0))
             
         # Draw scrolling text
         for i, line in enumerate(self.story_lines):
@@ -3,9 +3,14 @@ from src.scenes.base_scene import Scene
 from src.utils.constants import *
 from src.utils.assets import AssetManager
 from src.ui.components import Button, Label
+from src.ui.text_cache import TextCache
 from src.core.game_state import GameState
+from src.core.vfx_manager import Starfield
 
 class MapScene(Scene):
+    retained = True
+    next_scenes = ("game",)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.game_state = GameState()
@@ -24,6 +29,14 @@ class MapScene(Scene):
         
         # Keyboard Navigation
         self.selected_index = 0 # Index in self.buttons (0 is Back, 1-50 are levels)
+
+    def resume(self):
+        # Levels may have been unlocked since the last visit
+        self.refresh_levels()
+        self.selected_level = None
+        self.difficulty_buttons = []
+        self.show_difficulty_select = False
+        self.selected_index = 0
         
     def create_ui(self):
         self.labels.append(Label(VIRTUAL_WIDTH // 2 - 150, 30, "GALACTIC MAP", self.title_font, GOLD))
@@ -66,11 +79,22 @@ class MapScene(Scene):
                 btn.enabled = False
                 
             self.buttons.append(btn)
+
+    def refresh_levels(self):
+        """Re-sync the existing level nodes with GameState and clear their input state"""
+        for level, btn in enumerate(self.buttons[1:], start=1):
+            is_unlocked = self.game_state.is_level_unlocked(level)
+            if is_unlocked != btn.enabled:
+                btn.enabled = is_unlocked
+                btn.set_color(NEON_BLUE if is_unlocked else (50, 50, 50))
+        for btn in self.buttons:
+            btn.hovered = btn.pressed = False
             
     def select_level(self, level):
         self.selected_level = level
         self.show_difficulty_select = True
         self.create_difficulty_ui()
+        self.mark_dirty()
         
     def create_difficulty_ui(self):
         self.difficulty_buttons = []
@@ -104,6 +128,7 @@ class MapScene(Scene):
     def close_difficulty_select(self):
         self.show_difficulty_select = False
         self.difficulty_buttons = []
+        self.mark_dirty()
 
     def start_game(self, difficulty):
         # Pass level config to game scene
@@ -118,17 +143,9 @@ class MapScene(Scene):
                 btn.update(dt)
 
     def draw(self, screen):
-        # Background - Galaxy Map Style
-        screen.fill((5, 5, 20))
-        
-        # Draw stars (static for map)
-        import random
-        random.seed(42) # Consistent stars
-        for _ in range(100):
-            sx = random.randint(0, VIRTUAL_WIDTH)
-            sy = random.randint(0, VIRTUAL_HEIGHT)
-            pygame.draw.circle(screen, (200, 200, 255), (sx, sy), random.randint(1, 2))
-        random.seed() # Reset seed
+        # Background - Galaxy Map Style, stars baked into a cached backdrop
+        screen.blit(Starfield.backdrop((5, 5, 20), (200, 200, 255), seed=42), (0, 0))
+        text_cache = TextCache()
             
         # Draw connecting lines (Paths)
         if not self.show_difficulty_select:
@@ -162,13 +179,13 @@ class MapScene(Scene):
             pygame.draw.circle(screen, WHITE, center, radius, 2) # Border
             
             # Text
-            text_surf = btn.font.render(btn.text, True, BLACK if btn.enabled else (100, 100, 100))
+            text_surf = text_cache.render(btn.font, btn.text, True, BLACK if btn.enabled else (100, 100, 100))
             text_rect = text_surf.get_rect(center=center)
             screen.blit(text_surf, text_rect)
             
         # Stats Display
         stats_text = f"Coins: {self.game_state.data.get('coins', 0)} | XP: {self.game_state.data.get('xp', 0)}"
-        stats_surf = self.assets.fonts['hud'].render(stats_text, True, GOLD)
+        stats_surf = text_cache.render(self.assets.fonts['hud'], stats_text, True, GOLD)
         screen.blit(stats_surf, (VIRTUAL_WIDTH - 300, 40))
             
         if self.show_difficulty_select:
@@ -181,13 +198,14 @@ class MapScene(Scene):
             pygame.draw.rect(screen, (50, 50, 80), (VIRTUAL_WIDTH//2 - 200, VIRTUAL_HEIGHT//2 - 200, 400, 500), border_radius=20)
             pygame.draw.rect(screen, WHITE, (VIRTUAL_WIDTH//2 - 200, VIRTUAL_HEIGHT//2 - 200, 400, 500), 2, border_radius=20)
             
-            title = self.font.render(f"LEVEL {self.selected_level}", True, WHITE)
+            title = text_cache.render(self.font, f"LEVEL {self.selected_level}", True, WHITE)
             screen.blit(title, (VIRTUAL_WIDTH//2 - title.get_width()//2, VIRTUAL_HEIGHT//2 - 180))
             
             for btn in self.difficulty_buttons:
                 btn.draw(screen)
                 
     def process_input(self, events):
+        selected = self.selected_index
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -219,3 +237,20 @@ class MapScene(Scene):
                     btn.handle_event(event)
                     if btn.hovered:
                         self.selected_index = i
+        
+        if self.show_difficulty_select:
+            self.mark_widgets(self.difficulty_buttons)
+        else:
+            for btn in self.buttons:
+                if btn.dirty:
+                    btn.dirty = False
+                    self.mark_dirty(self.node_bounds(btn))
+            if self.selected_index != selected:
+                self.mark_dirty(self.node_bounds(self.buttons[selected]))
+                self.mark_dirty(self.node_bounds(self.buttons[self.selected_index]))
+
+    def node_bounds(self, btn):
+        """Area of a level node as drawn: the glow circle around the button's center"""
+        glow = pygame.Rect(0, 0, 70, 70)
+        glow.center = btn.rect.center
+        return glow.union(btn.bounds)
@@ -1,11 +1,13 @@
 import pygame
 import math
-import random
 from src.scenes.base_scene import Scene
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.core.vfx_manager import Starfield
 
 class MenuScene(Scene):
+    next_scenes = ("mode_select", "shop", "settings")
+
     def __init__(self, manager):
         super().__init__(manager)
         self.font_title = AssetManager().fonts['title']
@@ -18,16 +20,13 @@ class MenuScene(Scene):
         ]
         self.selected_index = 0
         
-        # Persistent stars
-        self.stars = []
-        import random
-        for _ in range(100):
-            self.stars.append({
-                'pos': [random.randint(0, VIRTUAL_WIDTH), random.randint(0, VIRTUAL_HEIGHT)],
-                'speed': random.randint(10, 50),
-                'size': random.randint(1, 3),
-                'brightness': random.randint(100, 255)
-            })
+        # Persistent stars (grey, drifting slower than in game)
+        self.starfield = Starfield((5, 5, 15), speed_scale=0.4)
+        self.pulse_timer = 0
+
+    def resume(self):
+        self.selected_index = 0
+        self.starfield = Starfield((5, 5, 15), speed_scale=0.4)
         self.pulse_timer = 0
 
     def process_input(self, events):
@@ -70,18 +69,11 @@ class MenuScene(Scene):
     def update(self, dt):
         self.pulse_timer += dt * 5
         # Update stars
-        for star in self.stars:
-            star['pos'][1] += star['speed'] * dt
-            if star['pos'][1] > VIRTUAL_HEIGHT:
-                star['pos'][1] = 0
-                star['pos'][0] = random.randint(0, VIRTUAL_WIDTH)
+        self.starfield.update(dt)
 
     def draw(self, screen):
         # Animated background
-        screen.fill((5, 5, 15))
-        for star in self.stars:
-            pygame.draw.circle(screen, (star['brightness'], star['brightness'], star['brightness']), 
-                             (int(star['pos'][0]), int(star['pos'][1])), star['size'])
+        self.starfield.draw(screen)
         
         # Title with glow effect
         title_surf = self.font_title.render(TITLE, True, NEON_BLUE)
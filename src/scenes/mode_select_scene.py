@@ -2,8 +2,12 @@ import pygame
 from src.scenes.base_scene import Scene
 from src.utils.constants import *
 from src.utils.assets import AssetManager
+from src.ui.text_cache import TextCache
 
 class ModeSelectScene(Scene):
+    retained = True
+    next_scenes = ("map",)
+
     def __init__(self, manager):
         super().__init__(manager)
         assets = AssetManager()
@@ -16,18 +20,29 @@ class ModeSelectScene(Scene):
         ]
         self.selected_index = 0
 
+    def resume(self):
+        self.selected_index = 0
+
     def process_input(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.manager.change_scene("menu")
                 elif event.key == pygame.K_UP:
-                    self.selected_index = (self.selected_index - 1) % len(self.options)
+                    self.select((self.selected_index - 1) % len(self.options))
                 elif event.key == pygame.K_DOWN:
-                    self.selected_index = (self.selected_index + 1) % len(self.options)
+                    self.select((self.selected_index + 1) % len(self.options))
                 elif event.key == pygame.K_RETURN:
                     self.launch_mode()
 
+    def select(self, index):
+        self.mark_dirty(self.card_rect(self.selected_index))
+        self.selected_index = index
+        self.mark_dirty(self.card_rect(index))
+
+    def card_rect(self, index):
+        return pygame.Rect(VIRTUAL_WIDTH // 2 - 400, 350 + index * 150, 800, 120)
+
     def launch_mode(self):
         target = self.options[self.selected_index]['scene']
         self.manager.change_scene(target)
@@ -37,16 +52,16 @@ class ModeSelectScene(Scene):
 
     def draw(self, screen):
         screen.fill((5, 5, 20))
+        text_cache = TextCache()
         
         # Title
-        title_surf = self.font_title.render("MODE SELECT", True, NEON_PURPLE)
+        title_surf = text_cache.render(self.font_title, "MODE SELECT", True, NEON_PURPLE)
         title_rect = title_surf.get_rect(center=(VIRTUAL_WIDTH // 2, 180))
         screen.blit(title_surf, title_rect)
 
         # Mode cards
         for i, option in enumerate(self.options):
-            card_y = 350 + i * 150
-            card_rect = pygame.Rect(VIRTUAL_WIDTH // 2 - 400, card_y, 800, 120)
+            card_rect = self.card_rect(i)
             
             # Card background
             if i == self.selected_index:
@@ -59,10 +74,10 @@ class ModeSelectScene(Scene):
                 color = WHITE
             
             # Mode title
-            text = self.font_menu.render(option['label'], True, color)
+            text = text_cache.render(self.font_menu, option['label'], True, color)
             text_rect = text.get_rect(center=(card_rect.centerx, card_rect.centery))
             screen.blit(text, text_rect)
 
         # Controls hint
-        hint = AssetManager().fonts['hud'].render("ESC: Menu | ↑↓: Navigate | ENTER: Select", True, (200, 200, 200))
+        hint = text_cache.render(AssetManager().fonts['hud'], "ESC: Menu | ↑↓: Navigate | ENTER: Select", True, (200, 200, 200))
         screen.blit(hint, (VIRTUAL_WIDTH // 2 - 250, VIRTUAL_HEIGHT - 60))
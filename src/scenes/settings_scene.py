@@ -3,8 +3,12 @@ from src.scenes.base_scene import Scene
 from src.core.settings import Settings
 from src.utils.assets import AssetManager
 from src.utils.constants import *
+from src.ui.text_cache import TextCache
 
 class SettingsScene(Scene):
+    retained = True
+    next_scenes = ("menu",)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.settings = Settings()
@@ -17,6 +21,8 @@ class SettingsScene(Scene):
             {"label": "Resolution", "type": "resolution"},
             {"label": "Fullscreen", "type": "toggle", "attr": "fullscreen"},
             {"label": "VSync", "type": "toggle", "attr": "vsync"},
+            {"label": "Scaling", "type": "scale_mode"},
+            {"label": "Dynamic Resolution", "type": "toggle", "attr": "dynamic_resolution"},
             {"label": "Music Volume", "type": "range", "attr": "music_volume", "step": 0.1, "min": 0.0, "max": 1.0},
             {"label": "Sound Volume", "type": "range", "attr": "sound_volume", "step": 0.1, "min": 0.0, "max": 1.0},
             {"label": "Particle Quality", "type": "quality"},
@@ -25,23 +31,35 @@ class SettingsScene(Scene):
         ]
         self.selected_index = 0
 
+    def resume(self):
+        self.selected_index = 0
+
     def process_input(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.leave()
                 elif event.key == pygame.K_UP:
-                    self.selected_index = (self.selected_index - 1) % len(self.options)
+                    self.select((self.selected_index - 1) % len(self.options))
                 elif event.key == pygame.K_DOWN:
-                    self.selected_index = (self.selected_index + 1) % len(self.options)
+                    self.select((self.selected_index + 1) % len(self.options))
                 elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
                     direction = -1 if event.key == pygame.K_LEFT else 1
                     self.adjust_option(direction)
                 elif event.key == pygame.K_RETURN:
                     self.select_option()
 
+    def select(self, index):
+        self.mark_dirty(self.row_rect(self.selected_index))
+        self.selected_index = index
+        self.mark_dirty(self.row_rect(index))
+
+    def row_rect(self, index):
+        return pygame.Rect(0, 250 + index * 70, VIRTUAL_WIDTH, 70)
+
     def adjust_option(self, direction):
         option = self.options[self.selected_index]
+        self.mark_dirty(self.row_rect(self.selected_index))
         
         if option['type'] == 'resolution':
             current_res = (self.settings.resolution_width, self.settings.resolution_height)
@@ -52,6 +70,14 @@ class SettingsScene(Scene):
             idx = (idx + direction) % len(self.resolutions)
             self.settings.resolution_width, self.settings.resolution_height = self.resolutions[idx]
             self.manager.engine.apply_display_settings()
+        elif option['type'] == 'scale_mode':
+            try:
+                idx = SCALE_MODES.index(self.settings.scale_mode)
+            except ValueError:
+                idx = 0
+            idx = (idx + direction) % len(SCALE_MODES)
+            self.settings.scale_mode = SCALE_MODES[idx]
+            self.manager.engine.resolution_manager.set_scale_mode(self.settings.scale_mode)
         elif option['type'] == 'quality':
             try:
                 idx = self.particle_qualities.index(self.settings.particle_quality)
@@ -64,6 +90,8 @@ class SettingsScene(Scene):
             setattr(self.settings, option['attr'], not current)
             if option['attr'] in ('fullscreen', 'vsync'):
                 self.manager.engine.apply_display_settings()
+            elif option['attr'] == 'dynamic_resolution':
+                self.manager.engine.dynamic_resolution.set_enabled(self.settings.dynamic_resolution)
         elif option['type'] == 'range':
             value = getattr(self.settings, option['attr'])
             value += option['step'] * direction
@@ -86,7 +114,8 @@ class SettingsScene(Scene):
 
     def draw(self, screen):
         screen.fill((20, 20, 30))
-        title = self.font_menu.render("SETTINGS", True, NEON_PURPLE)
+        text_cache = TextCache()
+        title = text_cache.render(self.font_menu, "SETTINGS", True, NEON_PURPLE)
         screen.blit(title, (VIRTUAL_WIDTH // 2 - title.get_width() // 2, 120))
 
         for idx, option in enumerate(self.options):
@@ -96,6 +125,8 @@ class SettingsScene(Scene):
             
             if option['type'] == 'resolution':
                 value = f"{self.settings.resolution_width}x{self.settings.resolution_height}"
+            elif option['type'] == 'scale_mode':
+                value = self.settings.scale_mode.upper()
             elif option['type'] == 'quality':
                 value = self.settings.particle_quality.upper()
             elif option['type'] == 'range':
@@ -103,8 +134,8 @@ class SettingsScene(Scene):
             elif option['type'] == 'toggle':
                 value = "ON" if getattr(self.settings, option['attr']) else "OFF"
             
-            text = self.font_menu.render(f"{label}: {value}", True, color)
+            text = text_cache.render(self.font_menu, f"{label}: {value}", True, color)
             screen.blit(text, (VIRTUAL_WIDTH // 2 - text.get_width() // 2, 250 + idx * 70))
 
-        hint = self.font_hud.render("←→: Adjust | ↑↓: Navigate | ENTER: Toggle | ESC: Back", True, WHITE)
+        hint = text_cache.render(self.font_hud, "←→: Adjust | ↑↓: Navigate | ENTER: Toggle | ESC: Back", True, WHITE)
         screen.blit(hint, (VIRTUAL_WIDTH // 2 - hint.get_width() // 2, VIRTUAL_HEIGHT - 60))
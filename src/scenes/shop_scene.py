@@ -3,15 +3,20 @@ from src.scenes.base_scene import Scene
 from src.utils.constants import *
 from src.utils.assets import AssetManager
 from src.ui.components import Button, Label
+from src.ui.text_cache import TextCache
 from src.core.game_state import GameState
 
 class ShopScene(Scene):
+    retained = True
+    next_scenes = ("menu",)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.game_state = GameState()
         self.assets = AssetManager()
         self.font = self.assets.fonts['menu']
         self.title_font = self.assets.fonts['title']
+        self.desc_font = pygame.font.SysFont("Arial", 16)
         
         self.items = [
             {"id": "skin_robo", "type": "skin", "name": "Robo-Santa", "cost": 100, "desc": "Beep Boop Ho Ho Ho"},
@@ -24,10 +29,15 @@ class ShopScene(Scene):
         self.buttons = []
         self.labels = []
         self.create_ui()
+
+    def resume(self):
+        # Coins and unlocks may have changed since the last visit
+        self.create_ui()
         
     def create_ui(self):
         self.buttons = []
         self.labels = []
+        self.mark_dirty()
         
         # Title
         self.labels.append(Label(VIRTUAL_WIDTH // 2 - 100, 30, "GALACTIC SHOP", self.title_font, GOLD))
@@ -103,12 +113,12 @@ class ShopScene(Scene):
                 skins = self.game_state.data.get('unlocked_skins', [])
                 skins.append(item['id'])
                 self.game_state.data['unlocked_skins'] = skins
-                self.game_state.save_data()
+                self.game_state.save_data('unlocked_skins')
             elif item['type'] == 'companion':
                 comps = self.game_state.data.get('unlocked_companions', [])
                 comps.append(item['id'])
                 self.game_state.data['unlocked_companions'] = comps
-                self.game_state.save_data()
+                self.game_state.save_data('unlocked_companions')
             elif item['type'] == 'upgrade':
                 upgrades = self.game_state.data.get('upgrades', {})
                 if item['id'] == 'upgrade_damage':
@@ -116,7 +126,7 @@ class ShopScene(Scene):
                 elif item['id'] == 'upgrade_health':
                     upgrades['health'] = upgrades.get('health', 0) + 1
                 self.game_state.data['upgrades'] = upgrades
-                self.game_state.save_data()
+                self.game_state.save_data('upgrades')
                 
             self.create_ui() # Refresh UI
 
@@ -125,7 +135,7 @@ class ShopScene(Scene):
             self.game_state.data['current_skin'] = item['id']
         elif item['type'] == 'companion':
             self.game_state.data['current_companion'] = item['id']
-        self.game_state.save_data()
+        self.game_state.save_data('current_skin', 'current_companion')
         self.create_ui()
 
     def update(self, dt):
@@ -148,11 +158,12 @@ class ShopScene(Scene):
                 pygame.draw.rect(screen, (100, 100, 120), rect, 2, border_radius=10)
                 
                 # Name
-                name_surf = self.assets.fonts['hud'].render(item['name'], True, WHITE)
+                text_cache = TextCache()
+                name_surf = text_cache.render(self.assets.fonts['hud'], item['name'], True, WHITE)
                 screen.blit(name_surf, (rect.x + 10, rect.y + 10))
                 
                 # Desc
-                desc_surf = pygame.font.SysFont("Arial", 16).render(item['desc'], True, (200, 200, 200))
+                desc_surf = text_cache.render(self.desc_font, item['desc'], True, (200, 200, 200))
                 screen.blit(desc_surf, (rect.x + 10, rect.y + 40))
                 
                 # Cost
@@ -164,7 +175,7 @@ class ShopScene(Scene):
                     elif item['id'] == 'upgrade_health': lvl = upgrades.get('health', 0)
                     cost_text += f" (Lvl {lvl})"
                 
-                cost_surf = self.assets.fonts['hud'].render(cost_text, True, GOLD)
+                cost_surf = text_cache.render(self.assets.fonts['hud'], cost_text, True, GOLD)
                 screen.blit(cost_surf, (rect.x + 10, rect.y + 80))
 
         for btn in self.buttons:
@@ -174,3 +185,4 @@ class ShopScene(Scene):
         for event in events:
             for btn in self.buttons:
                 btn.handle_event(event)
+        self.mark_widgets(self.buttons)
@@ -1,5 +1,6 @@
 import pygame
 from src.utils.constants import *
+from src.ui.text_cache import TextCache
 
 class Button:
     """Production-quality UI button"""
@@ -11,16 +12,28 @@ class Button:
         self.hovered = False
         self.pressed = False
         self.enabled = True
-        self.color = bg_color
-        self.hover_color = (min(255, bg_color[0] + 20), min(255, bg_color[1] + 20), min(255, bg_color[2] + 40))
+        self.set_color(bg_color)
         self.text_color = WHITE
         self.border_color = NEON_BLUE
+        self.dirty = True # Look changed since the owning scene last redrew it
+    
+    def set_color(self, bg_color):
+        """Change the body color (hover tint follows)"""
+        self.color = bg_color
+        self.hover_color = (min(255, bg_color[0] + 20), min(255, bg_color[1] + 20), min(255, bg_color[2] + 40))
+        self.dirty = True
+    
+    @property
+    def bounds(self):
+        """Area the button may paint, glow and custom node art included"""
+        return self.rect.inflate(12, 12)
     
     def handle_event(self, event):
         """Handle input events"""
         if not self.enabled:
             return
-            
+        
+        hovered, pressed = self.hovered, self.pressed
         if event.type == pygame.MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -32,6 +45,8 @@ class Button:
                     if self.callback:
                         self.callback()
                 self.pressed = False
+        if (hovered, pressed) != (self.hovered, self.pressed):
+            self.dirty = True
 
     def update(self, dt):
         """Update button state (animations etc)"""
@@ -64,12 +79,13 @@ class Button:
         pygame.draw.rect(surface, border_color, rect, 3, border_radius=8)
         
         # Text
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_cache = TextCache()
+        text_surf = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=rect.center)
         
         # Text shadow
         if self.enabled:
-            shadow_surf = self.font.render(self.text, True, (0, 0, 0))
+            shadow_surf = text_cache.render(self.font, self.text, True, (0, 0, 0))
             surface.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
             
         surface.blit(text_surf, text_rect)
@@ -122,14 +138,19 @@ class Label:
         self.color = color
         self.bg_color = bg_color
         self.padding = 10
+        self.surface = None # Rendered text, rebuilt only when the text changes
     
     def set_text(self, text):
         """Update label text"""
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self.surface = None
     
     def draw(self, surface):
         """Render the label"""
-        text_surf = self.font.render(str(self.text), True, self.color)
+        if self.surface is None:
+            self.surface = TextCache().render(self.font, str(self.text), True, self.color)
+        text_surf = self.surface
         text_rect = text_surf.get_rect(topleft=(self.x, self.y))
         
         if self.bg_color:
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from src.utils.constants import *
+
+class TextCache:
+    """LRU cache of rendered text surfaces with a memory cap.
+
+    Keyed on (font, text, antialias, color), so a HUD string that did not
+    change since last frame costs a dictionary lookup instead of a
+    ``font.render``. Cached surfaces are shared; callers must not draw on them.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+            cls._instance.initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.initialized:
+            return
+        self.max_bytes = TEXT_CACHE_MAX_BYTES
+        self.entries = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.initialized = True
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render(text, antialias, color)"""
+        key = (font, text, antialias, tuple(color))
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.entries[key] = surf
+        self.memory += self._size(surf)
+        while self.memory > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.memory -= self._size(old)
+            self.evictions += 1
+        return surf
+
+    @staticmethod
+    def _size(surf):
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def clear(self):
+        self.entries.clear()
+        self.memory = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "memory": self.memory,
+            "hit_rate": self.hits / total if total else 0.0
+        }
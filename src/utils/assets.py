@@ -1,32 +1,247 @@
+import hashlib
+import json
+import marshal
+import mmap
+import os
 import pygame
 import random
+import weakref
+from src.utils import atlas, constants
 from src.utils.constants import *
 
+# Bump when the cache layout changes
+ASSET_CACHE_VERSION = 2
+ASSET_CACHE_DIR = os.path.join('cache', 'assets')
+
+# (kind, type) -> (atlas image, fallback size, fallback fill) for image_for;
+# (kind, None) is the kind's default for unknown types. The plain fallback
+# surface stands in when the atlas lacks the image (fill None leaves it black).
+IMAGE_REGISTRY = {
+    ('powerup', 'health'): ('powerup_health', (20, 20), None),
+    ('powerup', 'cola_burst'): ('powerup_cola', (20, 20), RED),
+    ('powerup', 'spread_shot'): ('powerup_spread', (24, 24), NEON_PURPLE),
+    ('powerup', 'rapid_fire'): ('powerup_rapid', (24, 24), GOLD),
+    ('powerup', 'shield'): ('powerup_shield', (24, 24), NEON_BLUE),
+    ('powerup', None): (None, (20, 20), NEON_BLUE),
+    ('projectile', 'coke'): ('projectile_coke', (10, 20), None),
+    ('projectile', 'pepsi'): ('projectile_pepsi', (12, 24), None),
+    ('projectile', 'snowball'): ('projectile_snowball', (16, 16), WHITE),
+    ('projectile', 'sprite_juice'): ('projectile_sprite_juice', (6, 16), GREEN),
+    ('projectile', None): (None, (8, 16), NEON_BLUE),
+    ('companion', 'sprite'): ('companion_sprite', (20, 40), None),
+    ('companion', None): (None, (20, 20), GREEN),
+}
+
 class AssetManager:
     _instance = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AssetManager, cls).__new__(cls)
+            # name -> subsurface of an atlas page
             cls._instance.images = {}
+            # name -> (page index, Rect) into the atlas pages
+            cls._instance.atlas_regions = {}
+            # As packed or mapped from the cache, before display conversion
+            cls._instance.atlas_source_pages = []
+            cls._instance.atlas_pages = []
+            cls._instance.atlas_map = None
+            cls._instance.display_format = None
+            # (kind, type) -> fallback surface built by image_for
+            cls._instance.fallback_images = {}
+            # Caches holding surfaces taken from images (e.g. ProjectileImages),
+            # emptied whenever the pages are replaced
+            cls._instance.image_caches = []
             cls._instance.fonts = {}
             cls._instance.sounds = {}
+            cls._instance.masks = weakref.WeakKeyDictionary()
+            cls._instance.use_cache = True
         return cls._instance
 
     def load_assets(self):
         # In a real production app, we would load files here.
-        # For this "Extreme Design" procedural app, we generate them.
+        # For this "Extreme Design" procedural app, we generate them,
+        # reusing the previous launch's atlas when the generators are unchanged.
+        if not (self.use_cache and self.load_cached_atlas()):
+            self.generate_images()
+            self.build_atlas()
+            if self.use_cache:
+                self.save_cached_atlas()
+        self.display_format = None
+        self.finalize_images()
+        
+        # Fonts
+        self.fonts['title'] = pygame.font.SysFont("Arial", 64, bold=True)
+        self.fonts['hud'] = pygame.font.SysFont("Arial", 24, bold=True)
+        self.fonts['menu'] = pygame.font.SysFont("Arial", 36)
+
+    def finalize(self, surface):
+        """The surface in the display's pixel format (itself when it already matches)
+
+        Blitting between formats (e.g. the cache's RGBA byte order onto an
+        XRGB display) takes a per-pixel conversion path many times slower
+        than a same-format blit.
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return surface
+        same_rgb = (surface.get_bitsize() == 32 and display.get_bitsize() == 32
+                    and surface.get_masks()[:3] == display.get_masks()[:3])
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface if same_rgb else surface.convert_alpha()
+        return surface if same_rgb else surface.convert()
+
+    def finalize_images(self):
+        """Convert the atlas pages to the current display format.
+
+        Runs after load_assets and after each display mode change; does
+        nothing while no display exists or when the format is unchanged.
+        Registered image caches are emptied; sprites built earlier keep
+        their old (still drawable) surfaces.
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return False
+        display_format = (display.get_bitsize(), display.get_masks())
+        if display_format == self.display_format:
+            return False
+        self.set_atlas_pages([self.finalize(page) for page in self.atlas_source_pages])
+        self.fallback_images.clear()
+        self.display_format = display_format
+        return True
+
+    def image_for(self, kind, type_name):
+        """Shared image for an entity kind and type from IMAGE_REGISTRY.
+
+        Every caller gets the same surface, so nothing may draw on it; a
+        missing atlas image falls back to a flat stand-in, built once.
+        """
+        key = (kind, type_name) if (kind, type_name) in IMAGE_REGISTRY else (kind, None)
+        name, size, fill = IMAGE_REGISTRY[key]
+        image = self.images.get(name)
+        if image is None:
+            image = self.fallback_images.get(key)
+            if image is None:
+                image = pygame.Surface(size)
+                if fill is not None:
+                    image.fill(fill)
+                image = self.fallback_images[key] = self.finalize(image)
+        return image
+
+    def build_atlas(self):
+        """Pack the generated images into atlas pages and point images at their regions"""
+        pages, self.atlas_regions = atlas.build_pages(self.images, ATLAS_PAGE_SIZE, ATLAS_PADDING)
+        self.atlas_source_pages = pages
+        self.set_atlas_pages(pages)
+
+    def set_atlas_pages(self, pages):
+        """Make images subsurfaces of pages, so every draw reads from a few shared buffers"""
+        self.atlas_pages = pages
+        for name, (index, rect) in self.atlas_regions.items():
+            self.images[name] = pages[index].subsurface(rect)
+        for cache in self.image_caches:
+            cache.clear()
+
+    def register_image_cache(self, cache):
+        """Have a cache of surfaces derived from images cleared when the pages change"""
+        self.image_caches.append(cache)
+
+    def atlas_region(self, name):
+        """(page surface, Rect) holding an image, for area blits straight from the page"""
+        index, rect = self.atlas_regions[name]
+        return self.atlas_pages[index], rect
+
+    def get_mask(self, image):
+        """Collision mask for an image, built once and shared by every sprite using it"""
+        mask = self.masks.get(image)
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            self.masks[image] = mask
+        return mask
+
+    def generate_images(self):
         self.generate_santa()
         self.generate_enemies()
         self.generate_boss()
         self.generate_projectiles()
         self.generate_powerups()
         self.generate_companions()
-        
-        # Fonts
-        self.fonts['title'] = pygame.font.SysFont("Arial", 64, bold=True)
-        self.fonts['hud'] = pygame.font.SysFont("Arial", 24, bold=True)
-        self.fonts['menu'] = pygame.font.SysFont("Arial", 36)
+
+    def cache_key(self):
+        """Hash of everything that can change generated pixels"""
+        digest = hashlib.sha256()
+        digest.update(f"{ASSET_CACHE_VERSION}|{pygame.version.ver}".encode())
+        for name in sorted(vars(AssetManager)):
+            if name.startswith('generate_'):
+                digest.update(name.encode())
+                digest.update(marshal.dumps(getattr(AssetManager, name).__code__))
+        for func in (atlas.aligned, atlas.pack, atlas.build_pages):
+            digest.update(marshal.dumps(func.__code__))
+        consts = sorted((k, repr(v)) for k, v in vars(constants).items() if k.isupper())
+        digest.update(repr(consts).encode())
+        return digest.hexdigest()
+
+    def load_cached_atlas(self):
+        """Map the on-disk atlas pages into memory. Returns False on a miss."""
+        manifest_path = os.path.join(ASSET_CACHE_DIR, 'manifest.json')
+        data_path = os.path.join(ASSET_CACHE_DIR, 'atlas.bin')
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('key') != self.cache_key():
+                return False
+            with open(data_path, 'rb') as f:
+                # Copy-on-write: pages are paged in as blits touch them, and a
+                # stray write to an image can never reach the file
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            view = memoryview(data)
+            pages = []
+            for entry in manifest['pages']:
+                w, h = entry['size']
+                offset = entry['offset']
+                if offset + w * h * 4 > len(data):
+                    return False
+                # BGRA bytes are ARGB8888 words: the usual display format, so
+                # finalize leaves the mapped pages as they are
+                pages.append(pygame.image.frombuffer(view[offset:offset + w * h * 4], (w, h), 'BGRA'))
+            regions = {name: (index, pygame.Rect(rect))
+                       for name, (index, *rect) in manifest['images'].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self.atlas_map = data
+        self.atlas_regions = regions
+        self.atlas_source_pages = pages
+        self.set_atlas_pages(pages)
+        return True
+
+    def save_cached_atlas(self):
+        """Write the atlas pages as raw BGRA buffers plus a manifest of page sizes and image rects"""
+        entries = []
+        offset = 0
+        chunks = []
+        for page in self.atlas_source_pages:
+            raw = pygame.image.tobytes(page, 'BGRA')
+            entries.append({'size': list(page.get_size()), 'offset': offset})
+            chunks.append(raw)
+            offset += len(raw)
+        images = {name: [index, *rect] for name, (index, rect) in self.atlas_regions.items()}
+        manifest = {'key': self.cache_key(), 'version': ASSET_CACHE_VERSION, 'pages': entries, 'images': images}
+        try:
+            os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+            data_path = os.path.join(ASSET_CACHE_DIR, 'atlas.bin')
+            manifest_path = os.path.join(ASSET_CACHE_DIR, 'manifest.json')
+            with open(data_path + '.tmp', 'wb') as f:
+                f.write(b''.join(chunks))
+            with open(manifest_path + '.tmp', 'w') as f:
+                json.dump(manifest, f)
+            # Data first so a manifest never points at a half-written buffer
+            os.replace(data_path + '.tmp', data_path)
+            os.replace(manifest_path + '.tmp', manifest_path)
+            # Per-image buffer from cache version 1
+            if os.path.exists(os.path.join(ASSET_CACHE_DIR, 'images.bin')):
+                os.remove(os.path.join(ASSET_CACHE_DIR, 'images.bin'))
+        except OSError:
+            pass
 
     def generate_santa(self):
         # Detailed Santa Sleigh
@@ -146,6 +361,11 @@ class AssetManager:
         pygame.draw.circle(surf, (200, 255, 200), (3, 5), 2) # Highlight
         self.images['projectile_sprite_juice'] = surf
 
+        # Snowball (freezing enemy shot)
+        surf = pygame.Surface((16, 16), pygame.SRCALPHA)
+        pygame.draw.circle(surf, WHITE, (8, 8), 8)
+        self.images['projectile_snowball'] = surf
+
     def generate_boss(self):
         # Coca Cola Truck - Ultra Enhanced Design
         surf = pygame.Surface((260, 150), pygame.SRCALPHA)
@@ -223,7 +443,31 @@ class AssetManager:
         pygame.draw.circle(surf, WHITE, (7, 15), 2)
         pygame.draw.circle(surf, WHITE, (17, 15), 2)
         self.images['powerup_cola'] = surf
-        
+
+        # Spread Shot
+        surf = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.circle(surf, NEON_PURPLE, (12, 12), 12)
+        pygame.draw.circle(surf, WHITE, (12, 12), 8, 2)
+        # 3 dots in triangle
+        pygame.draw.circle(surf, WHITE, (12, 6), 2)
+        pygame.draw.circle(surf, WHITE, (6, 16), 2)
+        pygame.draw.circle(surf, WHITE, (18, 16), 2)
+        self.images['powerup_spread'] = surf
+
+        # Rapid Fire
+        surf = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.rect(surf, GOLD, (4, 4, 16, 16), border_radius=4)
+        pygame.draw.polygon(surf, WHITE, [(8, 8), (16, 12), (8, 16)]) # Play icon
+        self.images['powerup_rapid'] = surf
+
+        # Shield
+        surf = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.circle(surf, NEON_BLUE, (12, 12), 12)
+        pygame.draw.circle(surf, WHITE, (12, 12), 10, 2)
+        pygame.draw.line(surf, WHITE, (6, 12), (18, 12), 2)
+        pygame.draw.line(surf, WHITE, (12, 6), (12, 18), 2)
+        self.images['powerup_shield'] = surf
+
         # Coin (New)
         surf = pygame.Surface((20, 20), pygame.SRCALPHA)
         pygame.draw.circle(surf, GOLD, (10, 10), 10)
@@ -0,0 +1,59 @@
+import pygame
+
+# Page widths and image columns are padded to multiples of this many pixels:
+# pygame's fast alpha blitter is skipped for sources whose row stride is an
+# odd pixel count
+ROW_ALIGN = 8
+
+def aligned(width):
+    return -(-width // ROW_ALIGN) * ROW_ALIGN
+
+def pack(sizes, page_size, padding=1):
+    """Shelf-pack named (w, h) sizes into pages at most page_size square.
+
+    Images go tallest first onto horizontal shelves, each starting on a
+    ROW_ALIGN column; a page is closed when
+    the next shelf does not fit, and anything larger than a page gets a page
+    of its own. Returns ({name: (page_index, Rect)}, [(page_w, page_h)]),
+    each page trimmed to the area it actually uses (width rounded up to
+    ROW_ALIGN).
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    regions = {}
+    pages = []
+    x = y = shelf_h = 0
+    page = None
+    for name in order:
+        w, h = sizes[name]
+        if w > page_size or h > page_size:
+            regions[name] = (len(pages), pygame.Rect(0, 0, w, h))
+            pages.append((aligned(w), h))
+            continue
+        if page is not None and x + w > page_size:
+            # Next shelf
+            y += shelf_h + padding
+            x = shelf_h = 0
+        if page is None or y + h > page_size:
+            page = len(pages)
+            pages.append((0, 0))
+            x = y = shelf_h = 0
+        regions[name] = (page, pygame.Rect(x, y, w, h))
+        used_w, used_h = pages[page]
+        pages[page] = (max(used_w, aligned(x + w)), max(used_h, y + h))
+        x = aligned(x + w + padding)
+        shelf_h = max(shelf_h, h)
+    return regions, pages
+
+def build_pages(images, page_size, padding=1):
+    """Copy images into freshly packed SRCALPHA pages.
+
+    Returns ([pages], {name: (page_index, Rect)}); pixels, alpha included,
+    are copied unblended.
+    """
+    regions, sizes = pack({name: surf.get_size() for name, surf in images.items()}, page_size, padding)
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in sizes]
+    for name, (index, rect) in regions.items():
+        # MAX onto the zeroed page is an exact copy; a normal blit would
+        # premultiply translucent pixels
+        pages[index].blit(images[name], rect, special_flags=pygame.BLEND_RGBA_MAX)
+    return pages, regions
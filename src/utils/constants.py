@@ -43,3 +43,41 @@ POWERUP_CHANCE = 0.20
 PARTICLE_POOL_SIZE = 500
 MAX_ENEMIES = 50
 MAX_PROJECTILES = 100
+PROJECTILE_POOL_MAX_FREE = 512  # killed bullet handles kept for reuse by BulletSystem
+ENTITY_POOL_MAX_FREE = 256  # killed enemies, drops and critters kept per type by EntityPool
+PROJECTILE_HOMING_SPEED = 200  # homing turn rate (velocity change per second)
+SPATIAL_CELL_SIZE = 128  # broadphase grid cell size in virtual pixels
+MASK_TABLE_MIN_PAIRS = 20  # candidate pairs from which BulletSystem looks up overlap tables instead of testing masks
+PROFILER_HISTORY = 120  # frames in the profiler's rolling window
+PROFILER_MAX_TRACE_EVENTS = 500_000
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # rendered text surfaces kept by TextCache
+SCALE_MODES = ['nearest', 'smooth', 'integer']  # ResolutionManager presentation scaling
+IDLE_FPS = 15  # frame cap for retained (menu) scenes once input has stopped...
+IDLE_DELAY_MS = 500  # ...for this long
+SCENE_CACHE_SIZE = 6  # left scenes SceneManager keeps alive for reuse
+ATLAS_PAGE_SIZE = 1024  # max width/height of an AssetManager atlas page
+ATLAS_PADDING = 1  # transparent pixels between packed images
+# Starfield parallax layers, far to near: (scroll px/s, stars, radius, brightness)
+STARFIELD_LAYERS = [(25, 220, 1, 0.45), (55, 100, 2, 0.7), (100, 40, 3, 1.0)]
+STARFIELD_COLORKEY = (0, 0, 0)
+DYNAMIC_RES_STEPS = [1.0, 0.75, 0.5]  # world render scales, best quality first
+DYNAMIC_RES_SMOOTHING = 0.1  # EMA weight of the newest frame time
+DYNAMIC_RES_DOWN_RATIO = 1.0  # step down when the average exceeds this fraction of the budget...
+DYNAMIC_RES_DOWN_FRAMES = 15  # ...for this many consecutive frames
+DYNAMIC_RES_UP_RATIO = 0.7  # step back up below this fraction of the budget...
+DYNAMIC_RES_UP_FRAMES = 120  # ...sustained this long (hysteresis against oscillation)
+DYNAMIC_RES_SETTLE_FRAMES = 60  # frames after a step down before judging whether it helped
+DYNAMIC_RES_MIN_GAIN = 0.9  # a step down must cut the average frame time to this fraction...
+DYNAMIC_RES_RETRY_FRAMES = 1200  # ...or it is undone and not retried for this many frames
+
+# Audio: mixer channels reserved per category, and each effect's category,
+# concurrent voice cap and priority (higher may steal lower)
+SOUND_CHANNEL_GROUPS = {"weapons": 4, "explosions": 6, "ui": 3}
+SOUND_VOICES = {
+    "laser": {"category": "weapons", "max_voices": 3, "priority": 1},
+    "explosion": {"category": "explosions", "max_voices": 4, "priority": 2},
+    "pickup": {"category": "ui", "max_voices": 2, "priority": 2},
+    "boss_alarm": {"category": "ui", "max_voices": 1, "priority": 3},
+}
+SOUND_DEFAULT_VOICE = {"category": "ui", "max_voices": 1, "priority": 0}
+SOUND_MERGE_MS = 30  # repeat triggers of one effect this close together share a voice